@@ -1,8 +1,10 @@
 from aiogram import Bot, Dispatcher
 from config import get_telegram_token
+from utils.fsm_storage_utils import fsm_storage
 
 TELEGRAM_TOKEN = get_telegram_token()
 
 bot = Bot(TELEGRAM_TOKEN)
 
-dp: Dispatcher = Dispatcher()
+# FSM states (bid flows, navigation history) survive restarts
+dp: Dispatcher = Dispatcher(storage=fsm_storage)
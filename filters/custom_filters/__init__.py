@@ -1,7 +1,6 @@
 from .access_level_filter import AccessLevelFilter
 from .allowed_user_filter import AllowedUserFilter
-from .posted_callback_filter import PostIDFilter
 
 __all__ = [
-    "AccessLevelFilter", "AllowedUserFilter", "PostIDFilter"
+    "AccessLevelFilter", "AllowedUserFilter"
 ]
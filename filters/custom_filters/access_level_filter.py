@@ -1,7 +1,7 @@
 from aiogram.filters import BaseFilter
 from aiogram.types import Message
 from typing import Optional
-from utils.database_utils import AsyncAdminsRepository
+from utils.database_utils import AsyncAdminsRepository, AccessControlCache, acl_cache
 
 
 class AccessLevelFilter(BaseFilter):
@@ -10,12 +10,14 @@ class AccessLevelFilter(BaseFilter):
 
     This filter checks the user's access level from the `Admins` table
     and allows the handler to proceed only if the access level
-    meets or exceeds the required minimum.
+    meets or exceeds the required minimum. Levels are read from the in-memory
+    access-control snapshot; the database is only queried before it is loaded.
 
     Args:
         min_level (int): Minimum access level required (1 = highest, 3 = lowest).
         db (Optional[AsyncAdminsRepository]): Optional database repository instance.
         db_path (Optional[str]): Optional path to database (used if `db` not provided).
+        acl (Optional[AccessControlCache]): Access snapshot (shared `acl_cache` by default).
 
     Example:
         @dp.message_handler(AccessLevelFilter(min_level=2))
@@ -27,13 +29,15 @@ class AccessLevelFilter(BaseFilter):
         self,
         min_level: int = 1,
         db: Optional[AsyncAdminsRepository] = None,
-        db_path: Optional[str] = None
+        db_path: Optional[str] = None,
+        acl: Optional[AccessControlCache] = None
     ):
         if db is None:
             self.db: AsyncAdminsRepository = AsyncAdminsRepository(db_path)
         else:
             self.db: AsyncAdminsRepository = db
         self.min_level = min_level
+        self.acl: AccessControlCache = acl or acl_cache
 
     async def __call__(self, message: Message) -> bool:
         """
@@ -47,10 +51,13 @@ class AccessLevelFilter(BaseFilter):
         """
         user_id = message.from_user.id
 
-        # Fetch admin record
-        admin = await self.db.get_admin(user_id)
-        if admin is None:
+        access_level = self.acl.get_access_level(user_id)
+        if not self.acl.loaded:
+            # Snapshot not loaded yet -> fall back to the database
+            admin = await self.db.get_admin_by_user_id(user_id)
+            access_level = admin[3] if admin else None  # Index 3 = Access_Level column
+
+        if access_level is None:
             return False  # User is not an admin
 
-        access_level = admin[1]  # Index 1 = Access_Level column
         return access_level <= self.min_level
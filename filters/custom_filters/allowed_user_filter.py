@@ -1,20 +1,24 @@
 from aiogram.filters import BaseFilter
-from aiogram.types import Message
-from typing import Optional
-from utils.database_utils import AsyncUsersRepository, AsyncAdminsRepository
+from aiogram.types import InlineQuery, Message
+from typing import Optional, Union
+from utils.database_utils import AsyncUsersRepository, AsyncAdminsRepository, AccessControlCache, acl_cache
 
 
 class AllowedUserFilter(BaseFilter):
     """
     Aiogram filter to allow users present in the `Users` table
     or admins present in the `Admins` table.
+
+    Answers from the in-memory access-control snapshot; the database is only
+    queried if the snapshot has not been loaded yet.
     """
 
     def __init__(
         self,
         users_repo: Optional[AsyncUsersRepository] = None,
         admins_repo: Optional[AsyncAdminsRepository] = None,
-        db_path: Optional[str] = None
+        db_path: Optional[str] = None,
+        acl: Optional[AccessControlCache] = None
     ):
         """
         Initialize filter.
@@ -23,27 +27,32 @@ class AllowedUserFilter(BaseFilter):
             users_repo (Optional[AsyncUsersRepository]): Pre-initialized Users repository.
             admins_repo (Optional[AsyncAdminsRepository]): Pre-initialized Admins repository.
             db_path (Optional[str]): Database path if repositories are not provided.
+            acl (Optional[AccessControlCache]): Access snapshot (shared `acl_cache` by default).
         """
         self.users_repo: AsyncUsersRepository = users_repo or AsyncUsersRepository(db_path)
         self.admins_repo: AsyncAdminsRepository = admins_repo or AsyncAdminsRepository(db_path)
+        self.acl: AccessControlCache = acl or acl_cache
 
-    async def __call__(self, message: Message) -> bool:
+    async def __call__(self, message: Union[Message, InlineQuery]) -> bool:
         """
         Check if the user exists in Users or is an Admin.
 
         Args:
-            message (Message): Incoming Telegram message.
+            message (Union[Message, InlineQuery]): Incoming Telegram message or inline query.
 
         Returns:
             bool: True if user exists in Users or Admins, False otherwise.
         """
         user_id = message.from_user.id
 
-        # Check Users table
+        allowed = self.acl.is_allowed(user_id)
+        if allowed is not None:
+            return allowed
+
+        # Snapshot not loaded yet -> fall back to the database
         user = await self.users_repo.get_user_by_id(user_id)
         if user is not None:
             return True
 
-        # Check Admins table
         admin = await self.admins_repo.get_admin_by_user_id(user_id)
         return admin is not None
@@ -1,11 +1,26 @@
+import os
+import shutil
+import tempfile
+import time
 from aiogram import types, Router
-from aiogram.filters import Command
+from aiogram.filters import Command, CommandObject
+from aiogram.exceptions import TelegramBadRequest
 from keyboards.kb_generator import create_inline_kb
-from aiogram.types import InlineKeyboardMarkup
+from keyboards.callback_factories import ReportCallback
+from aiogram.types import InlineKeyboardMarkup, FSInputFile, CallbackQuery
 from filters.custom_filters import AccessLevelFilter
+from middleware.callback import CallbackAnswer
+from utils.database_utils import TableExporter
+from utils.report_utils import REPORTS, format_report
+from utils.screen_utils import ScreenOutput, show
 
 # create a kb
-# kb: InlineKeyboardMarkup = create_inline_kb(...)
+reports_kb: InlineKeyboardMarkup = create_inline_kb(
+    2, **{ReportCallback(kind=kind).pack(): text for kind, text in REPORTS.items()}
+)
+
+# Minimum seconds between progress message edits
+EXPORT_PROGRESS_INTERVAL = 2
 
 # create a router
 router: Router = Router()
@@ -13,4 +28,57 @@ router: Router = Router()
 
 @router.message(Command(commands='admin'), AccessLevelFilter(1))
 async def bot_start_command(message: types.Message):
-    await message.answer(f'Admin mode {message.from_user.first_name}', parse_mode='html')
+    await message.answer(f'Admin mode {message.from_user.first_name}', reply_markup=reports_kb, parse_mode='html')
+
+
+# Reports aggregate whole tables, hence the larger latency budget
+@router.callback_query(
+    ReportCallback.filter(), AccessLevelFilter(1), flags={"late_answer": True, "latency_budget": 2.0}
+)
+async def show_report(callback: CallbackQuery, callback_data: ReportCallback, callback_answer: CallbackAnswer):
+    if callback_data.kind not in REPORTS:
+        await callback_answer("Unknown report", show_alert=True)
+        return
+    await callback_answer()
+
+    text = await format_report(callback_data.kind)
+    await show(callback, ScreenOutput(text, reports_kb))
+
+
+@router.message(Command(commands='export'), AccessLevelFilter(1))
+async def export_database(message: types.Message, command: CommandObject):
+    """
+    /export [Table ...] - send a zip of the given tables (whole database if none).
+    """
+    exporter = TableExporter()
+    known_tables = await exporter.get_tables()
+
+    tables = list(dict.fromkeys(command.args.split())) if command.args else known_tables
+    unknown = [table for table in tables if table not in known_tables]
+    if unknown:
+        await message.answer(f"Unknown tables: {', '.join(unknown)}")
+        return
+
+    status = await message.answer("Preparing export...")
+    last_update = 0.0
+
+    async def report_progress(table: str, written: int, total: int):
+        nonlocal last_update
+        now = time.monotonic()
+        if now - last_update < EXPORT_PROGRESS_INTERVAL:
+            return
+        last_update = now
+        try:
+            await status.edit_text(f"Exporting <b>{table}</b>: {written}/{total} rows", parse_mode='html')
+        except TelegramBadRequest:
+            pass  # progress is best effort
+
+    work_dir = tempfile.mkdtemp(prefix="admin_export_")
+    try:
+        archive_path = await exporter.export_archive(
+            os.path.join(work_dir, "export.zip"), tables, report_progress
+        )
+        await status.edit_text(f"Export finished: {len(tables)} table(s).")
+        await message.answer_document(FSInputFile(archive_path))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
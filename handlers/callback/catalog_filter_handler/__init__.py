@@ -0,0 +1 @@
+from .catalog_filter import router
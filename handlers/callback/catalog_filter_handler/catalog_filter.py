@@ -0,0 +1,76 @@
+from dataclasses import replace
+from typing import Any, Dict, Optional, Union
+from aiogram import Router
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup, User
+from keyboards.kb_generator import create_sectioned_kb
+from keyboards.callback_factories import FacetCallback
+from lexicon.buttons_ikb import BUTTONS
+from utils.database_utils import AsyncFacetsRepository, CatalogFilters, PRICE_BUCKETS
+from utils.listing_detail_utils import detail_prefetcher, listing_ids_in
+from utils.screen_utils import Navigation, ScreenOutput, screen, show
+from handlers.callback.comptuer_list_handler.computer_list import catalog_page_params
+
+# create a router
+router: Router = Router()
+
+
+def facet_label(facet: str, value: Any) -> str:
+    if facet == "price_bucket":
+        return PRICE_BUCKETS[value][0]
+    return str(value).replace("_", " ")
+
+
+async def build_filter_menu(filters: CatalogFilters) -> InlineKeyboardMarkup:
+    """
+    One button per facet value with the number of listings it would show.
+
+    Tapping a value selects it (or clears it if already selected); counts come
+    from the cached `Listing_Facets` summary, not from Listings.
+    """
+    facets_repo = AsyncFacetsRepository()
+    counts: Dict[str, Dict[Any, int]] = await facets_repo.get_facet_counts(filters)
+
+    sections = []
+    for facet in AsyncFacetsRepository.FACETS:
+        selected = getattr(filters, facet)
+        cleared = None if facet == "price_bucket" else ""
+        section = {}
+        for value, count in sorted(counts[facet].items()):
+            is_selected = value == selected
+            toggled = replace(filters, **{facet: cleared if is_selected else value})
+            mark = "✅ " if is_selected else ""
+            section[FacetCallback(action="menu", **toggled.codes()).pack()] = \
+                f"{mark}{facet_label(facet, value)} ({count})"
+        sections.append(section)
+
+    total = await facets_repo.count_listings(filters)
+    footer = {
+        FacetCallback(action="show", **filters.codes()).pack(): BUTTONS["show_results"].format(count=total),
+        FacetCallback(action="menu").pack(): BUTTONS["reset_filters"],
+    }
+
+    return create_sectioned_kb(3, sections, footer)
+
+
+@screen("catalog_filters")
+async def catalog_filters_screen(user: User, **filter_fields: Optional[Union[str, int]]) -> ScreenOutput:
+    return ScreenOutput("Choose filters for the catalog:", await build_filter_menu(CatalogFilters(**filter_fields)))
+
+
+@router.callback_query(FacetCallback.filter())
+async def catalog_filters(callback: CallbackQuery, callback_data: FacetCallback, navigation: Navigation):
+    filters = await AsyncFacetsRepository().decode_filters(
+        callback_data.item_type, callback_data.condition, callback_data.part_type, callback_data.price_bucket
+    )
+
+    # Both screens take the filters as params (defaults left out)
+    params = catalog_page_params(filters=filters)
+    if callback_data.action == "show":
+        output = await navigation.render("catalog_page", callback.from_user, **params)
+    else:
+        output = await navigation.render("catalog_filters", callback.from_user, **params)
+
+    await show(callback, output)
+
+    # Warms the details of the shown results (the filter menu has none)
+    detail_prefetcher.schedule(callback.from_user.id, listing_ids_in(output.reply_markup))
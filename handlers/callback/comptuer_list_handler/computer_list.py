@@ -1,33 +1,126 @@
+from dataclasses import asdict
+from typing import Any, Dict, Optional, Union
 from aiogram import Router
-from aiogram.types import CallbackQuery
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup, User
 from aiogram import F
-from utils.computer_list_utils import get_postings, format_computers
-from keyboards.kb_generator import create_inline_kb
+from utils.computer_list_utils import get_postings_page, format_computers, catalog_cache, CatalogPage
+from keyboards.kb_generator import create_paginated_kb
+from keyboards.callback_factories import ListingCallback, CatalogPageCallback, FacetCallback
+from lexicon.buttons_ikb import BUTTONS
+from utils.database_utils import AsyncFacetsRepository, CatalogFilters
+from utils.listing_detail_utils import detail_prefetcher, listing_ids_in
+from utils.screen_utils import Navigation, screen, show
 
+CATALOG_PAGE_SIZE = 10
+CATALOG_TEXT = "Here are available options.\n"
 
 # create a router
 router: Router = Router()
 
 
-@router.callback_query(F.data == "pc_list")
-async def add_load(callback: CallbackQuery):
-    postings = await get_postings()
+async def build_catalog_page(
+    after_id: int = 0,
+    before_id: Optional[int] = None,
+    filters: CatalogFilters = CatalogFilters()
+) -> InlineKeyboardMarkup:
+    """
+    Fetch one catalog page and build its keyboard with next / previous buttons.
+    """
+    postings, has_previous, has_next = await get_postings_page(
+        after_id=after_id,
+        before_id=before_id,
+        limit=CATALOG_PAGE_SIZE,
+        filters=filters
+    )
+
+    # Listings before the cursor are gone -> show the first page instead
+    if not postings and before_id is not None:
+        return await build_catalog_page(filters=filters)
+
     formatted_posts = await format_computers(postings)
 
     kwargs = {
-        str(post["listing_id"]): formatted_posts[i]  # use "listing_id" instead of "post_id"
+        ListingCallback(listing_id=post["listing_id"]).pack(): formatted_posts[i]
         for i, post in enumerate(postings)
     }
 
-    kb = create_inline_kb(width=1, **kwargs)
-    back_kb = create_inline_kb(1, "go_back")
-    kb.inline_keyboard.extend(back_kb.inline_keyboard)
+    # Every navigation button carries the active filters
+    filter_fields = filters.codes()
+
+    prev_data = next_data = None
+    if postings and has_previous:
+        prev_data = CatalogPageCallback(
+            direction="prev", cursor=postings[0]["listing_id"], **filter_fields
+        ).pack()
+    if postings and has_next:
+        next_data = CatalogPageCallback(
+            direction="next", cursor=postings[-1]["listing_id"], **filter_fields
+        ).pack()
+
+    header = {FacetCallback(action="menu", **filter_fields).pack(): BUTTONS["filters"]}
+
+    return create_paginated_kb(1, kwargs, prev_data, next_data, header)
+
+
+async def get_catalog_page(
+    after_id: int = 0,
+    before_id: Optional[int] = None,
+    filters: CatalogFilters = CatalogFilters()
+) -> CatalogPage:
+    """
+    One catalog page (text and keyboard), rendered once per catalog version
+    and shared by every user viewing it.
+    """
+    async def render() -> CatalogPage:
+        return CatalogPage(CATALOG_TEXT, await build_catalog_page(after_id, before_id, filters))
+
+    return await catalog_cache.get_or_render((filters, after_id, before_id), render)
+
 
-    await callback.message.delete()
-    await callback.answer()
-    await callback.message.answer(
-        f"Here are available options.\n",
-        reply_markup=kb,
-        parse_mode='html'
+def catalog_page_params(
+    after_id: int = 0,
+    before_id: Optional[int] = None,
+    filters: CatalogFilters = CatalogFilters()
+) -> Dict[str, Any]:
+    """
+    Params of the catalog_page screen, defaults left out to keep the history small.
+    """
+    params = {"after_id": after_id, "before_id": before_id, **asdict(filters)}
+    defaults = {"after_id": 0, "before_id": None, **asdict(CatalogFilters())}
+    return {key: value for key, value in params.items() if value != defaults[key]}
+
+
+@screen("catalog_page")
+async def catalog_page_screen(
+    user: User,
+    after_id: int = 0,
+    before_id: Optional[int] = None,
+    **filter_fields: Optional[Union[str, int]]
+) -> CatalogPage:
+    return await get_catalog_page(after_id, before_id, CatalogFilters(**filter_fields))
+
+
+@router.callback_query(F.data == "pc_list")
+async def add_load(callback: CallbackQuery, navigation: Navigation):
+    output = await navigation.render("catalog_page", callback.from_user)
+
+    await show(callback, output)
+
+    # The next tap is most likely one of these listings
+    detail_prefetcher.schedule(callback.from_user.id, listing_ids_in(output.reply_markup))
+
+
+@router.callback_query(CatalogPageCallback.filter())
+async def change_page(callback: CallbackQuery, callback_data: CatalogPageCallback, navigation: Navigation):
+    filters = await AsyncFacetsRepository().decode_filters(
+        callback_data.item_type, callback_data.condition, callback_data.part_type, callback_data.price_bucket
     )
+    if callback_data.direction == "prev":
+        params = catalog_page_params(before_id=callback_data.cursor, filters=filters)
+    else:
+        params = catalog_page_params(after_id=callback_data.cursor, filters=filters)
+    output = await navigation.render("catalog_page", callback.from_user, **params)
+
+    await show(callback, output)
 
+    detail_prefetcher.schedule(callback.from_user.id, listing_ids_in(output.reply_markup))
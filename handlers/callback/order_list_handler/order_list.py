@@ -1,39 +1,65 @@
+from typing import Optional
 from aiogram import Router, F
-from aiogram.types import CallbackQuery
-from utils.order_list_utils import format_orders  # updated unified function
+from aiogram.types import CallbackQuery, User
+from middleware.callback import CallbackAnswer
+from utils.order_list_utils import format_orders, format_order  # updated unified function
+from utils.screen_utils import Navigation, ScreenOutput, screen, show
 from keyboards.kb_generator import create_inline_kb
+from keyboards.callback_factories import OrderCallback
 
 router: Router = Router()
 
 
-@router.callback_query(F.data == "my_orders")
-async def list_user_orders(callback: CallbackQuery):
-    # Telegram user ID
-    telegram_user_id = callback.from_user.id
-
+@screen("orders")
+async def orders_screen(user: User) -> Optional[ScreenOutput]:
     # Fetch and format orders directly
-    formatted_orders = await format_orders(telegram_user_id)
+    formatted_orders = await format_orders(user.id)
 
     if not formatted_orders:
-        await callback.answer("You have no orders.", show_alert=True)
-        return
+        return None
 
-    # Create inline keyboard with order buttons
-    # Here the key can just be the index or Order_Id; we'll use Order_Id
+    # Create inline keyboard with order buttons ("order:<Order_Id>")
     kwargs = {
-        str(i + 1): order_text  # buttons labeled 1, 2, ...; callback data could be i+1 or Order_Id
-        for i, order_text in enumerate(formatted_orders)
+        OrderCallback(order_id=order_id).pack(): order_text
+        for order_id, order_text in formatted_orders
     }
 
     kb = create_inline_kb(width=1, **kwargs)
     back_kb = create_inline_kb(1, "go_back")
     kb.inline_keyboard.extend(back_kb.inline_keyboard)
 
-    # Delete previous message and send the orders
-    await callback.message.delete()
-    await callback.answer()
-    await callback.message.answer(
-        "Here are your orders:\n",
-        reply_markup=kb,
-        parse_mode="html"
-    )
+    return ScreenOutput("Here are your orders:\n", kb)
+
+
+@router.callback_query(F.data == "my_orders", flags={"late_answer": True})
+async def list_user_orders(callback: CallbackQuery, navigation: Navigation, callback_answer: CallbackAnswer):
+    output = await navigation.render("orders", callback.from_user)
+
+    if output is None:
+        await callback_answer("You have no orders.", show_alert=True)
+        return
+
+    await callback_answer()
+    await show(callback, output)
+
+
+@screen("order_detail")
+async def order_detail_screen(user: User, order_id: int) -> Optional[ScreenOutput]:
+    text = await format_order(order_id, user.id)
+    if text is None:
+        return None
+    return ScreenOutput(text, create_inline_kb(1, "go_back"))
+
+
+@router.callback_query(OrderCallback.filter(), flags={"late_answer": True})
+async def show_order(
+    callback: CallbackQuery, callback_data: OrderCallback, navigation: Navigation, callback_answer: CallbackAnswer
+):
+    output = await navigation.render("order_detail", callback.from_user, order_id=callback_data.order_id)
+
+    if output is None:
+        await callback_answer("This order is no longer available.", show_alert=True)
+        return
+
+    await callback_answer()
+    await show(callback, output)
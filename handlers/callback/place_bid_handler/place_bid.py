@@ -1,9 +1,13 @@
+from typing import Optional, Tuple
 from keyboards.kb_generator import create_inline_kb
+from keyboards.callback_factories import BidCallback
 from utils.database_utils import AsyncListingsRepository, AsyncPCsRepository, AsyncLaptopsRepository, \
     AsyncPartsRepository
-from aiogram import Router, F
-from aiogram.types import CallbackQuery
+from utils.screen_utils import Navigation, ScreenOutput, screen, show
+from aiogram import Router
+from aiogram.types import CallbackQuery, User
 from aiogram.fsm.context import FSMContext
+from middleware.callback import CallbackAnswer
 from states.user_states import BidState
 
 router = Router()
@@ -11,19 +15,16 @@ router = Router()
 kb = create_inline_kb(1, "go_back")
 
 
-@router.callback_query(F.data.startswith("bid:"))
-async def start_bid(callback: CallbackQuery, state: FSMContext):
-    # extract listing_id from callback
-    _, listing_id_str = callback.data.split(":")
-    listing_id = int(listing_id_str)
-
+async def load_bid_item(listing_id: int) -> Optional[Tuple[int, str]]:
+    """
+    Item_Id and title of the item of a listing (None if the listing does not exist).
+    """
     # load listing to get Item_Id and type
     repo = AsyncListingsRepository()
     listing = await repo.get_listing(listing_id)
 
     if not listing:
-        await callback.answer("Listing not found!", show_alert=True)
-        return
+        return None
 
     # unpack listing row
     _, item_type, item_id, added_price, real_price, notes, created_at = listing
@@ -44,20 +45,53 @@ async def start_bid(callback: CallbackQuery, state: FSMContext):
     elif item_type == "Part":
         parts_repo = AsyncPartsRepository()
         item_details = await parts_repo.get_part(item_id)
-        title = item_details[1] if item_details else "Unknown Part"
+        title = item_details[2] if item_details else "Unknown Part"
+
+    return item_id, title
+
+
+def bid_prompt_output(title: str) -> ScreenOutput:
+    # ask for price
+    return ScreenOutput(f"💵 Please enter your bid price for <b>{title}</b>:", kb)
+
+
+@screen("bid_prompt", state=BidState.waiting_for_price)
+async def bid_prompt_screen(user: User, listing_id: int) -> Optional[ScreenOutput]:
+    bid_item = await load_bid_item(listing_id)
+    if bid_item is None:
+        return None
+
+    return bid_prompt_output(bid_item[1])
+
+
+@router.callback_query(BidCallback.filter(), flags={"late_answer": True})
+async def start_bid(
+    callback: CallbackQuery,
+    callback_data: BidCallback,
+    state: FSMContext,
+    navigation: Navigation,
+    callback_answer: CallbackAnswer
+):
+    listing_id = callback_data.listing_id
+
+    # Cached row lookup, so the spinner stops before the item is loaded
+    if not await AsyncListingsRepository().get_listing(listing_id):
+        await callback_answer("Listing not found!", show_alert=True)
+        return
+    await callback_answer()
+
+    # Loaded once: the item goes to FSM data and into the prompt
+    bid_item = await load_bid_item(listing_id)
+    if bid_item is None:  # removed meanwhile
+        return
 
     # store item_id and title in FSM for later
+    item_id, title = bid_item
     await state.update_data(item_id=item_id, title=title)
 
     # set bid state
     await state.set_state(BidState.waiting_for_price)
 
-    # delete previous message
-    await callback.message.delete()
-
-    # ask for price
-    await callback.message.answer(
-        f"💵 Please enter your bid price for <b>{title}</b>:",
-        reply_markup=kb,
-        parse_mode="html"
-    )
+    output = bid_prompt_output(title)
+    navigation.remember("bid_prompt", output, listing_id=listing_id)
+    await show(callback, output)
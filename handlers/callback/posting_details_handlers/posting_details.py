@@ -1,19 +1,25 @@
+from typing import Optional
 from aiogram import Router
-from aiogram.types import CallbackQuery
-from filters.custom_filters import PostIDFilter
-from utils.database_utils import AsyncListingsRepository, AsyncPCsRepository, AsyncLaptopsRepository, AsyncPartsRepository
-from utils.computer_list_utils import format_computer_description_message
+from aiogram.types import CallbackQuery, User
+from middleware.callback import CallbackAnswer
+from utils.database_utils import AsyncListingsRepository
+from utils.listing_detail_utils import get_listing_detail
+from utils.screen_utils import Navigation, ScreenOutput, screen, show
 from keyboards.kb_generator import create_inline_kb
+from keyboards.callback_factories import ListingCallback, BidCallback
 
 router = Router()
 
 
-@router.callback_query(PostIDFilter())  # dynamically checks if callback is a valid listing ID
-async def handle_post_id(callback: CallbackQuery):
-    listing_id = int(callback.data)
+@screen("listing_detail")
+async def listing_detail_screen(user: User, listing_id: int) -> Optional[ScreenOutput]:
+    # Usually already rendered by the catalog page's prefetch
+    detail = await get_listing_detail(listing_id)
+    if not detail:
+        return None
 
     kwargs = {
-        f"bid:{listing_id}": "Bid"
+        BidCallback(listing_id=listing_id).pack(): "Bid"
     }
     kb = create_inline_kb(width=1, **kwargs)  # main bid button
 
@@ -23,48 +29,22 @@ async def handle_post_id(callback: CallbackQuery):
     # Merge back button row into main kb
     kb.inline_keyboard.extend(back_kb.inline_keyboard)
 
-    # Initialize repositories
-    listings_repo = AsyncListingsRepository()
-    listing = await listings_repo.get_listing(listing_id)
+    return ScreenOutput(detail.description, kb)
 
-    if not listing:
-        await callback.answer("Listing not found!", show_alert=True)
-        return
-
-    _, item_type, item_id, added_price, real_price, notes, created_at = listing
-
-    # Fetch actual item info from the correct table
-    title = "Unknown"
-    item_details = None
 
-    if item_type == "PC":
-        pc_repo = AsyncPCsRepository()
-        item_details = await pc_repo.get_pc(item_id)
-        title = item_details[1] if item_details else "Unknown PC"
+# "listing:<id>", no database access to route; answered once the listing is known to exist
+@router.callback_query(ListingCallback.filter(), flags={"late_answer": True})
+async def handle_post_id(
+    callback: CallbackQuery, callback_data: ListingCallback, navigation: Navigation, callback_answer: CallbackAnswer
+):
+    listing_id = callback_data.listing_id
 
-    elif item_type == "Laptop":
-        laptop_repo = AsyncLaptopsRepository()
-        item_details = await laptop_repo.get_laptop(item_id)
-        title = item_details[1] if item_details else "Unknown Laptop"
-
-    elif item_type == "Part":
-        parts_repo = AsyncPartsRepository()
-        item_details = await parts_repo.get_part(item_id)
-        title = item_details[1] if item_details else "Unknown Part"
-
-    # Format description
-    description = format_computer_description_message(
-        item=item_details or listing,  # fallback to listing info if details not found
-        item_type=item_type,
-        added_price=added_price,
-        real_price=real_price,
-        notes=notes
-    )
+    # Cached row lookup, so the spinner stops before the detail is fetched and formatted
+    if not await AsyncListingsRepository().get_listing(listing_id):
+        await callback_answer("Listing not found!", show_alert=True)
+        return
+    await callback_answer(f"You clicked on listing ID: {listing_id}")
 
-    await callback.message.delete()
-    await callback.answer(f"You clicked on listing ID: {listing_id}")
-    await callback.message.answer(
-        f"{description}",
-        reply_markup=kb,
-        parse_mode='html'
-    )
\ No newline at end of file
+    output = await navigation.render("listing_detail", callback.from_user, listing_id=listing_id)
+    if output is not None:  # None if removed meanwhile
+        await show(callback, output)
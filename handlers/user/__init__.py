@@ -1,10 +1,14 @@
 from aiogram import Router
 from .start_handler import router as start_router
+from .search_handler import router as search_router
+from .inline_search_handler import router as inline_search_router
 
 
 # create a router
 user_router: Router = Router()
 
 user_router.include_router(start_router)
+user_router.include_router(search_router)
+user_router.include_router(inline_search_router)
 
 __all__ = ["user_router"]
@@ -0,0 +1 @@
+from .inline_search import router
@@ -0,0 +1,78 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List
+from aiogram import Router, html
+from aiogram.types import InlineQuery, InlineQueryResultArticle, InputTextMessageContent
+from utils.inline_search_utils import search_listings_inline, inline_stats
+
+# Answer (possibly empty) before this many seconds; Telegram drops late answers
+INLINE_DEADLINE = 1.5
+# Seconds Telegram may serve the same answer to the same user without asking us again
+INLINE_CACHE_TIME = 60
+INLINE_PAGE_SIZE = 20
+
+logger = logging.getLogger(__name__)
+
+# create a router
+router: Router = Router()
+
+
+def _log_late_failure(search: asyncio.Future) -> None:
+    # Nobody awaits a search that missed the deadline, so its error is logged here
+    if not search.cancelled() and search.exception() is not None:
+        logger.error("Inline search failed after the deadline", exc_info=search.exception())
+
+
+def build_results(postings: List[Dict]) -> List[InlineQueryResultArticle]:
+    return [
+        InlineQueryResultArticle(
+            id=str(post["listing_id"]),
+            title=post["title"],
+            description=f"{post['item_type']} · ${post['added_price']:.2f}",
+            input_message_content=InputTextMessageContent(
+                message_text=(
+                    f"<b>{html.quote(post['title'])}</b>\n"
+                    f"Type: {post['item_type']}\n"
+                    f"Price: ${post['added_price']:.2f}\n"
+                    f"Listing #{post['listing_id']}"
+                ),
+                parse_mode='html'
+            ),
+        )
+        for post in postings
+    ]
+
+
+@router.inline_query()
+async def inline_search(inline_query: InlineQuery):
+    started = time.perf_counter()
+
+    # Shielded: a search that misses the deadline still finishes and fills
+    # the cache, so the next keystroke for the same query is instant.
+    search = asyncio.ensure_future(
+        search_listings_inline(inline_query.query, inline_query.offset, INLINE_PAGE_SIZE)
+    )
+    try:
+        postings, next_offset = await asyncio.wait_for(asyncio.shield(search), INLINE_DEADLINE)
+        timed_out = False
+    except asyncio.TimeoutError:
+        postings, next_offset = [], ""
+        timed_out = True
+        search.add_done_callback(_log_late_failure)
+
+    await inline_query.answer(
+        build_results(postings),
+        # A timed-out (empty) answer must not be cached by Telegram
+        cache_time=1 if timed_out else INLINE_CACHE_TIME,
+        # Only allowed users may search, so Telegram must not share results between users
+        is_personal=True,
+        next_offset=next_offset,
+    )
+
+    latency = time.perf_counter() - started
+    inline_stats.record(latency, timed_out)
+    if timed_out:
+        logger.warning("Inline query %r missed the %.1fs deadline", inline_query.query, INLINE_DEADLINE)
+    else:
+        logger.debug("Inline query %r answered in %.1f ms", inline_query.query, latency * 1000)
@@ -0,0 +1,87 @@
+from typing import Optional
+from aiogram import Router, F, html
+from aiogram.filters import StateFilter
+from aiogram.fsm.context import FSMContext
+from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, User
+from utils.computer_list_utils import search_postings_page, format_computers
+from keyboards.kb_generator import create_paginated_kb
+from keyboards.callback_factories import ListingCallback, SearchPageCallback
+from utils.listing_detail_utils import detail_prefetcher, listing_ids_in
+from utils.screen_utils import Navigation, ScreenOutput, screen, show
+from middleware.callback import CallbackAnswer
+
+SEARCH_PAGE_SIZE = 10
+
+# create a router
+router: Router = Router()
+
+
+async def build_search_page(text: str, page: int = 0) -> Optional[InlineKeyboardMarkup]:
+    """
+    Run the search for one page and build its keyboard (None if nothing matched).
+    """
+    postings, has_previous, has_next = await search_postings_page(text, page, SEARCH_PAGE_SIZE)
+    if not postings:
+        return None
+
+    formatted_posts = await format_computers(postings)
+
+    kwargs = {
+        ListingCallback(listing_id=post["listing_id"]).pack(): formatted_posts[i]
+        for i, post in enumerate(postings)
+    }
+
+    prev_data = SearchPageCallback(page=page - 1).pack() if has_previous else None
+    next_data = SearchPageCallback(page=page + 1).pack() if has_next else None
+
+    return create_paginated_kb(1, kwargs, prev_data, next_data)
+
+
+@screen("search_results")
+async def search_results_screen(user: User, text: str, page: int = 0) -> Optional[ScreenOutput]:
+    kb = await build_search_page(text, page)
+    if kb is None:
+        return None
+    return ScreenOutput(f"Results for <b>{html.quote(text)}</b>:", kb)
+
+
+# Plain text outside of any FSM flow (bids etc.) is a search query
+@router.message(StateFilter(None), F.text, ~F.text.startswith("/"))
+async def search_inventory(message: Message, state: FSMContext, navigation: Navigation):
+    text = message.text.strip()
+    output = await navigation.render("search_results", message.from_user, text=text, page=0)
+
+    if output is None:
+        await message.answer(f"Nothing found for <b>{html.quote(text)}</b>.", parse_mode='html')
+        return
+
+    # Paging callbacks re-run the search with the stored text
+    await state.update_data(search_query=text)
+
+    await message.answer(output.text, reply_markup=output.reply_markup, parse_mode=output.parse_mode)
+
+    # The next tap is most likely one of these results
+    detail_prefetcher.schedule(message.from_user.id, listing_ids_in(output.reply_markup))
+
+
+@router.callback_query(SearchPageCallback.filter(), flags={"late_answer": True})
+async def change_search_page(
+    callback: CallbackQuery,
+    callback_data: SearchPageCallback,
+    state: FSMContext,
+    navigation: Navigation,
+    callback_answer: CallbackAnswer
+):
+    text = (await state.get_data()).get("search_query")
+    output = None
+    if text:
+        output = await navigation.render("search_results", callback.from_user, text=text, page=callback_data.page)
+
+    if output is None:
+        await callback_answer("This search has expired, send your query again.", show_alert=True)
+        return
+
+    await callback_answer()
+    await show(callback, output)
+
+    detail_prefetcher.schedule(callback.from_user.id, listing_ids_in(output.reply_markup))
@@ -1,7 +1,8 @@
 from aiogram import types, Router
 from aiogram.filters import Command
 from keyboards.kb_generator import create_inline_kb
-from aiogram.types import InlineKeyboardMarkup
+from aiogram.types import InlineKeyboardMarkup, User
+from utils.screen_utils import ScreenOutput, screen, render_screen
 
 
 # create a kb
@@ -11,6 +12,12 @@ kb: InlineKeyboardMarkup = create_inline_kb(2,"my_profile", "my_orders", "pc_lis
 router: Router = Router()
 
 
+@screen("main_menu")
+async def main_menu_screen(user: User) -> ScreenOutput:
+    return ScreenOutput(f'HI, {user.first_name}', kb)
+
+
 @router.message(Command(commands='start'))
 async def bot_start_command(message: types.Message):
-    await message.answer(f'HI, {message.from_user.first_name}', reply_markup=kb, parse_mode='html')
\ No newline at end of file
+    output = await render_screen("main_menu", message.from_user)
+    await message.answer(output.text, reply_markup=output.reply_markup, parse_mode=output.parse_mode)
@@ -1 +1,2 @@
-from . import kb_generator
\ No newline at end of file
+from . import kb_generator
+from . import callback_factories
\ No newline at end of file
@@ -0,0 +1,5 @@
+from .factories import ListingCallback, BidCallback, OrderCallback, CatalogPageCallback, FacetCallback, \
+    SearchPageCallback, ReportCallback
+
+__all__ = ["ListingCallback", "BidCallback", "OrderCallback", "CatalogPageCallback", "FacetCallback",
+           "SearchPageCallback", "ReportCallback"]
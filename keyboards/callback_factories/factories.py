@@ -0,0 +1,67 @@
+from typing import Optional
+from aiogram.filters.callback_data import CallbackData
+
+
+# Typed callback data. Each factory packs to "<prefix>:<id>", so routers can
+# dispatch on the prefix alone without touching the database.
+
+class ListingCallback(CallbackData, prefix="listing"):
+    """Open the details of a listing: `listing:<listing_id>`."""
+    listing_id: int
+
+
+class BidCallback(CallbackData, prefix="bid"):
+    """Start bidding on a listing: `bid:<listing_id>`."""
+    listing_id: int
+
+
+class OrderCallback(CallbackData, prefix="order"):
+    """Select an order: `order:<order_id>`."""
+    order_id: int
+
+
+class CatalogPageCallback(CallbackData, prefix="catalog"):
+    """
+    Navigate the paginated catalog:
+    `catalog:<direction>:<cursor>:<item_type>:<condition>:<part_type>:<price_bucket>`.
+
+    `direction` is "next" (listings after `cursor`) or "prev" (listings before it).
+    The remaining fields carry the active facet filters (empty = not filtered),
+    condition and part type as their `facet_code` (see `CatalogFilters.codes`).
+    """
+    direction: str
+    cursor: int
+    item_type: str = ""
+    condition: str = ""
+    part_type: str = ""
+    price_bucket: Optional[int] = None
+
+
+class FacetCallback(CallbackData, prefix="facet"):
+    """
+    Catalog filter menu: `facet:<action>:<item_type>:<condition>:<part_type>:<price_bucket>`.
+
+    `action` is "menu" (show the filter buttons for this selection) or
+    "show" (open the catalog filtered by it). Filters are packed as in
+    `CatalogPageCallback`.
+    """
+    action: str
+    item_type: str = ""
+    condition: str = ""
+    part_type: str = ""
+    price_bucket: Optional[int] = None
+
+
+class SearchPageCallback(CallbackData, prefix="search"):
+    """
+    Navigate full-text search results: `search:<page>`.
+
+    The search text itself is kept in FSM data (`search_query`), since it may
+    not fit into the 64-byte callback data.
+    """
+    page: int
+
+
+class ReportCallback(CallbackData, prefix="report"):
+    """Show an admin report: `report:<kind>`."""
+    kind: str
@@ -1 +1,3 @@
-from .generator import create_inline_kb
\ No newline at end of file
+from .generator import create_inline_kb
+from .paginated import create_paginated_kb
+from .sectioned import create_sectioned_kb
@@ -0,0 +1,46 @@
+from typing import Optional
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+from lexicon.buttons_ikb import BUTTONS
+
+
+def create_paginated_kb(width: int,
+                        buttons: dict[str, str],
+                        prev_data: Optional[str] = None,
+                        next_data: Optional[str] = None,
+                        header: Optional[dict[str, str]] = None) -> InlineKeyboardMarkup:
+    """
+    Build an inline keyboard for one page of items.
+
+    Args:
+        width (int): Number of item buttons per row.
+        buttons (dict[str, str]): Callback data -> button text for the page items.
+        prev_data (Optional[str]): Callback data of the "previous page" button (hidden if None).
+        next_data (Optional[str]): Callback data of the "next page" button (hidden if None).
+        header (Optional[dict[str, str]]): Callback data -> text of buttons shown in a row above the items.
+
+    Returns:
+        InlineKeyboardMarkup: Item rows, a navigation row and a "Back" row.
+    """
+    kb_builder: InlineKeyboardBuilder = InlineKeyboardBuilder()
+
+    if header:
+        kb_builder.row(*[InlineKeyboardButton(text=text, callback_data=data) for data, text in header.items()])
+
+    kb_builder.row(
+        *[InlineKeyboardButton(text=text, callback_data=data) for data, text in buttons.items()],
+        width=width
+    )
+
+    # Navigation row only holds the directions that exist
+    nav_buttons: list[InlineKeyboardButton] = []
+    if prev_data:
+        nav_buttons.append(InlineKeyboardButton(text=BUTTONS["prev_page"], callback_data=prev_data))
+    if next_data:
+        nav_buttons.append(InlineKeyboardButton(text=BUTTONS["next_page"], callback_data=next_data))
+    if nav_buttons:
+        kb_builder.row(*nav_buttons)
+
+    kb_builder.row(InlineKeyboardButton(text=BUTTONS["go_back"], callback_data="go_back"))
+
+    return kb_builder.as_markup()
@@ -0,0 +1,33 @@
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+from lexicon.buttons_ikb import BUTTONS
+
+
+def create_sectioned_kb(width: int,
+                        sections: list[dict[str, str]],
+                        footer: dict[str, str]) -> InlineKeyboardMarkup:
+    """
+    Build an inline keyboard made of independent button groups.
+
+    Args:
+        width (int): Maximum number of buttons per row inside a section.
+        sections (list[dict[str, str]]): Groups of callback data -> button text;
+            every group starts on a new row.
+        footer (dict[str, str]): Callback data -> text of buttons in one row under the sections.
+
+    Returns:
+        InlineKeyboardMarkup: Section rows, the footer row and a "Back" row.
+    """
+    kb_builder: InlineKeyboardBuilder = InlineKeyboardBuilder()
+
+    for section in sections:
+        buttons = [InlineKeyboardButton(text=text, callback_data=data) for data, text in section.items()]
+        for i in range(0, len(buttons), width):
+            kb_builder.row(*buttons[i:i + width])
+
+    if footer:
+        kb_builder.row(*[InlineKeyboardButton(text=text, callback_data=data) for data, text in footer.items()])
+
+    kb_builder.row(InlineKeyboardButton(text=BUTTONS["go_back"], callback_data="go_back"))
+
+    return kb_builder.as_markup()
@@ -4,4 +4,9 @@ BUTTONS: dict[str, str] = {
     "my_profile": "My Profile",
     "go_back": "Back",
     "bid": "Bid",
+    "prev_page": "◀️ Previous",
+    "next_page": "Next ▶️",
+    "filters": "🔎 Filters",
+    "reset_filters": "Reset",
+    "show_results": "Show {count} results",
 }
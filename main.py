@@ -1,8 +1,32 @@
 from bot import bot, dp
+from config import get_db_path
 from filters.custom_filters import AllowedUserFilter
 import asyncio
 import handlers
-from middleware.callback import HistoryMiddleware
+from middleware.callback import AnswerFirstMiddleware, HistoryMiddleware, PrefetchCancelMiddleware
+from middleware.update import ApiCallCounterMiddleware, ApiCallRequestMiddleware
+from utils.database_utils import (
+    open_pool, close_pools, run_migrations, acl_cache, start_write_queue, stop_write_queues
+)
+
+
+async def on_startup():
+    # Open the shared SQLite connection pool once for the whole bot
+    await open_pool(get_db_path())
+    await run_migrations()
+
+    # Group-commit bursts of writes (e.g. bids) instead of one fsync per row
+    start_write_queue(get_db_path())
+
+    # Access filters answer from this snapshot instead of querying per message
+    await acl_cache.load()
+    acl_cache.start_refresh()
+
+
+async def on_shutdown():
+    await acl_cache.stop_refresh()
+    await stop_write_queues()
+    await close_pools()
 
 
 async def run_bot():
@@ -11,7 +35,17 @@ async def run_bot():
     dp.include_router(handlers.admin.admin_router)
     dp.include_router(handlers.callback.callback_router)
     dp.message.filter(AllowedUserFilter())
+    dp.inline_query.filter(AllowedUserFilter())
+    dp.update.outer_middleware(ApiCallCounterMiddleware())
+    bot.session.middleware(ApiCallRequestMiddleware())
+    dp.message.outer_middleware(PrefetchCancelMiddleware())
+    dp.callback_query.outer_middleware(PrefetchCancelMiddleware())
+    # Answers callbacks before the handler works, so it wraps the history middleware
+    dp.callback_query.middleware(AnswerFirstMiddleware())
     dp.callback_query.middleware(HistoryMiddleware())
+    dp.message.middleware(HistoryMiddleware())
+    dp.startup.register(on_startup)
+    dp.shutdown.register(on_shutdown)
     print('Bot was started successfully!')
     # Start polling the bot (this should be awaited)
     await dp.start_polling(bot)
@@ -1 +1,3 @@
 from .back_history_middleware import HistoryMiddleware
+from .prefetch_middleware import PrefetchCancelMiddleware
+from .answer_middleware import AnswerFirstMiddleware, CallbackAnswer
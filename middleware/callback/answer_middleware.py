@@ -0,0 +1,83 @@
+import logging
+import time
+from typing import Optional
+from aiogram import BaseMiddleware
+from aiogram.dispatcher.flags import get_flag
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import CallbackQuery
+
+
+logger = logging.getLogger(__name__)
+
+
+class CallbackAnswer:
+    """
+    Answers one callback query at most once; later calls do nothing.
+
+    Given to handlers as `callback_answer` so they can answer (or alert)
+    as soon as the outcome is known, before the slow rendering.
+    """
+    __slots__ = ("callback", "started", "answered_after")
+
+    def __init__(self, callback: CallbackQuery, started: float) -> None:
+        self.callback = callback
+        self.started = started
+        self.answered_after: Optional[float] = None
+
+    @property
+    def answered(self) -> bool:
+        return self.answered_after is not None
+
+    async def __call__(self, text: Optional[str] = None, show_alert: Optional[bool] = None) -> None:
+        if self.answered:
+            return
+        self.answered_after = time.monotonic() - self.started
+        try:
+            await self.callback.answer(text, show_alert=show_alert)
+        except TelegramBadRequest as e:
+            # The query expired while the update was queued, nothing left to stop
+            logger.warning("Could not answer callback query %s: %s", self.callback.id, e.message)
+
+
+class AnswerFirstMiddleware(BaseMiddleware):
+    """
+    Stops the client's loading spinner before the handler does its work.
+
+    Callback queries are answered as soon as their handler is matched. A
+    handler that may have to alert the user is flagged `late_answer` and
+    answers through `callback_answer` once it knows the outcome; whatever
+    is still unanswered when the handler returns (or fails) is answered
+    then. Handlers running longer than their latency budget (flag
+    `latency_budget`, seconds) are logged.
+    """
+
+    def __init__(self, latency_budget: float = 0.5) -> None:
+        """
+        Args:
+            latency_budget (float): Default seconds a handler may take.
+        """
+        self.latency_budget = latency_budget
+
+    async def __call__(self, handler, event, data):
+        if not isinstance(event, CallbackQuery):
+            return await handler(event, data)
+
+        started = time.monotonic()
+        callback_answer = CallbackAnswer(event, started)
+        data["callback_answer"] = callback_answer
+
+        if not get_flag(data, "late_answer"):
+            await callback_answer()
+        try:
+            return await handler(event, data)
+        finally:
+            await callback_answer()
+
+            elapsed = time.monotonic() - started
+            budget = get_flag(data, "latency_budget", default=self.latency_budget)
+            if elapsed > budget:
+                logger.warning(
+                    "Callback handler %s took %.0f ms (budget %.0f ms, answered after %.0f ms)",
+                    data["handler"].callback.__qualname__, elapsed * 1000, budget * 1000,
+                    callback_answer.answered_after * 1000
+                )
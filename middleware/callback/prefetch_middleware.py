@@ -0,0 +1,25 @@
+from aiogram import BaseMiddleware
+from aiogram.types import CallbackQuery
+from keyboards.callback_factories import ListingCallback
+from utils.listing_detail_utils import detail_prefetcher
+
+
+class PrefetchCancelMiddleware(BaseMiddleware):
+    """
+    Cancels a user's listing-detail prefetch once they leave the listing list.
+
+    Opening a listing or going back to the list keeps the prefetch running;
+    any other update means the prefetched details are no longer on screen.
+    Handlers that show a new list schedule a fresh prefetch themselves.
+    """
+
+    # Callback data that stays within the displayed list
+    KEEP_PREFETCH = (f"{ListingCallback.__prefix__}:", "go_back")
+
+    async def __call__(self, handler, event, data):
+        user = data.get("event_from_user")
+        if user is not None:
+            if not (isinstance(event, CallbackQuery) and event.data and event.data.startswith(self.KEEP_PREFETCH)):
+                detail_prefetcher.cancel(user.id)
+
+        return await handler(event, data)
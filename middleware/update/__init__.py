@@ -0,0 +1 @@
+from .api_call_middleware import ApiCallCounterMiddleware, ApiCallRequestMiddleware
@@ -0,0 +1,27 @@
+from aiogram import BaseMiddleware
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware
+from aiogram.types import Update
+from utils.api_stats_utils import api_call_stats
+
+
+class ApiCallCounterMiddleware(BaseMiddleware):
+    """
+    Counts the Bot API calls made while handling each update (register on `dp.update`).
+    """
+
+    async def __call__(self, handler, event: Update, data):
+        token = api_call_stats.start_update()
+        try:
+            return await handler(event, data)
+        finally:
+            api_call_stats.finish_update(event.event_type, token)
+
+
+class ApiCallRequestMiddleware(BaseRequestMiddleware):
+    """
+    Reports every Bot API request to `api_call_stats` (register on `bot.session`).
+    """
+
+    async def __call__(self, make_request, bot, method):
+        api_call_stats.record_call(type(method).__name__)
+        return await make_request(bot, method)
@@ -0,0 +1,149 @@
+import asyncio
+import itertools
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
+
+import pytest
+from aiogram import Bot, Dispatcher
+from aiogram.client.session.base import BaseSession
+from aiogram.methods import EditMessageText, SendMessage, TelegramMethod
+from aiogram.types import CallbackQuery, Chat as TelegramChat, Message, Update, User
+
+import handlers
+from middleware.callback import AnswerFirstMiddleware, HistoryMiddleware
+from utils.database_utils import AsyncDatabase, AsyncSpecsRepository, row_cache, open_pool, close_pools, run_migrations
+
+BASE_DB = Path(__file__).resolve().parent.parent / "database" / "Service.db"
+
+# Tables whose writes the shared caches listen to
+CACHED_TABLES = ("Listings", "PCs", "Laptops", "Parts", "Users")
+
+# Every test chat is a new user, so FSM data of the shared dispatcher never leaks between tests
+_user_ids = itertools.count(9001)
+
+
+@pytest.fixture
+def make_database(tmp_path, monkeypatch) -> Callable[[str], str]:
+    """
+    Factory of test databases: a migrated copy of database/Service.db with
+    `script` applied, set as the app's DATABASE. Returns the database path.
+    """
+    db_path = str(tmp_path / "Service.db")
+    monkeypatch.setenv("DATABASE", db_path)
+
+    def make(script: str = "") -> str:
+        shutil.copy(BASE_DB, db_path)
+
+        async def prepare() -> None:
+            await open_pool(db_path)
+            try:
+                await run_migrations(db_path)
+                if script:
+                    async with AsyncDatabase(db_path).pool.writer() as conn:
+                        await conn.executescript(script)
+                        await conn.commit()
+            finally:
+                await close_pools()
+
+        asyncio.run(prepare())
+
+        # The shared caches are per process, not per database
+        row_cache.clear()
+        AsyncSpecsRepository.clear()
+        for table in CACHED_TABLES:
+            row_cache.notify_write(table)
+        return db_path
+
+    return make
+
+
+class MockSession(BaseSession):
+    """
+    Bot API session that answers locally: keeps the chat's messages and
+    records every method sent.
+    """
+
+    def __init__(self, chat: TelegramChat) -> None:
+        super().__init__()
+        self.chat = chat
+        self.sent: List[TelegramMethod] = []
+        self.messages: Dict[int, Message] = {}
+        self._message_ids = itertools.count(1000)
+
+    async def make_request(self, bot: Bot, method: TelegramMethod[Any], timeout: Optional[int] = None) -> Any:
+        self.sent.append(method)
+        if isinstance(method, SendMessage):
+            return self._store(next(self._message_ids), method.text, method.reply_markup)
+        if isinstance(method, EditMessageText):
+            return self._store(method.message_id, method.text, method.reply_markup)
+        return True
+
+    def _store(self, message_id: int, text: str, reply_markup: Any) -> Message:
+        message = Message(
+            message_id=message_id, date=datetime.now(), chat=self.chat, text=text, reply_markup=reply_markup
+        )
+        self.messages[message_id] = message
+        return message
+
+    async def close(self) -> None:
+        pass
+
+    async def stream_content(self, *args: Any, **kwargs: Any) -> AsyncGenerator[bytes, None]:
+        yield b""
+
+
+class Chat:
+    """
+    One user chatting with the bot: sends messages and taps buttons.
+    """
+
+    def __init__(self, dispatcher: Dispatcher) -> None:
+        self.dispatcher = dispatcher
+        self.user = User(id=next(_user_ids), is_bot=False, first_name="Test")
+        self.session = MockSession(TelegramChat(id=self.user.id, type="private"))
+        self.bot = Bot("1:test", session=self.session)
+        self._update_ids = itertools.count(1)
+
+    @property
+    def last_message(self) -> Message:
+        return self.session.messages[max(self.session.messages)]
+
+    async def send(self, text: str) -> None:
+        message = Message(
+            message_id=next(self.session._message_ids), date=datetime.now(), chat=self.session.chat,
+            from_user=self.user, text=text
+        )
+        await self.dispatcher.feed_update(self.bot, Update(update_id=next(self._update_ids), message=message))
+
+    async def tap(self, message: Message, data: str) -> Message:
+        """
+        Tap the button `data` of `message`; returns the message as shown afterwards.
+        """
+        callback = CallbackQuery(
+            id=str(next(self._update_ids)), from_user=self.user, chat_instance="test", message=message, data=data
+        )
+        await self.dispatcher.feed_update(self.bot, Update(update_id=next(self._update_ids), callback_query=callback))
+        return self.session.messages[message.message_id]
+
+
+@pytest.fixture(scope="session")
+def dispatcher() -> Dispatcher:
+    """
+    The bot's routers and navigation middlewares, as main.py sets them up
+    (routers attach to one dispatcher only, hence per session).
+    """
+    dp = Dispatcher()
+    dp.include_router(handlers.user.user_router)
+    dp.include_router(handlers.admin.admin_router)
+    dp.include_router(handlers.callback.callback_router)
+    dp.callback_query.middleware(AnswerFirstMiddleware())
+    dp.callback_query.middleware(HistoryMiddleware())
+    dp.message.middleware(HistoryMiddleware())
+    return dp
+
+
+@pytest.fixture
+def chat(dispatcher) -> Chat:
+    return Chat(dispatcher)
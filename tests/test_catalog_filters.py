@@ -0,0 +1,90 @@
+import asyncio
+from dataclasses import asdict
+from typing import Set
+
+import pytest
+from aiogram.types import Message
+
+from handlers.callback.comptuer_list_handler.computer_list import CATALOG_TEXT
+from keyboards.callback_factories import CatalogPageCallback
+from lexicon.buttons_ikb import BUTTONS
+from utils.database_utils import AsyncFacetsRepository, CatalogFilters, open_pool, close_pools
+from utils.listing_detail_utils import detail_prefetcher
+
+# The longest facet values
+CONDITION = "Refubrished"
+PART_TYPE = "Laptop_Case_Panel"
+
+SEED = f"""
+    INSERT INTO Parts (Part_Id, Type, Title, Condition, Listed_Price) VALUES
+        (9001, '{PART_TYPE}', 'Cooler A', '{CONDITION}', 120),
+        (9002, '{PART_TYPE}', 'Cooler B', 'New', 150),
+        (9003, 'GPU', 'Graphics card', '{CONDITION}', 300);
+    INSERT INTO Listings (Listing_Id, Item_Type, Item_Id, Added_Price) VALUES
+        (9001, 'Part', 9001, 130), (9002, 'Part', 9002, 160), (9003, 'Part', 9003, 320);
+"""
+
+
+def button(message: Message, label: str) -> str:
+    """
+    Callback data of the button of `message` whose text starts with `label`.
+    """
+    keys = [key for row in message.reply_markup.inline_keyboard for key in row]
+    for key in keys:
+        if key.text.startswith(label):
+            return key.callback_data
+    raise AssertionError(f"No {label!r} button in {[key.text for key in keys]}")
+
+
+def listing_buttons(message: Message) -> Set[str]:
+    keys = [key for row in message.reply_markup.inline_keyboard for key in row]
+    return {key.callback_data for key in keys if key.callback_data.startswith("listing:")}
+
+
+def test_catalog_callback_fits_with_longest_filters(make_database):
+    db_path = make_database(SEED)
+    filters = CatalogFilters("Part", CONDITION, PART_TYPE, 4)
+    # The largest SQLite rowid
+    cursor = 2 ** 63 - 1
+
+    with pytest.raises(ValueError):
+        CatalogPageCallback(direction="prev", cursor=cursor, **asdict(filters)).pack()
+
+    packed = CatalogPageCallback(direction="prev", cursor=cursor, **filters.codes()).pack()
+    unpacked = CatalogPageCallback.unpack(packed)
+
+    async def decode() -> CatalogFilters:
+        await open_pool(db_path)
+        try:
+            return await AsyncFacetsRepository(db_path).decode_filters(
+                unpacked.item_type, unpacked.condition, unpacked.part_type, unpacked.price_bucket
+            )
+        finally:
+            await close_pools()
+
+    assert asyncio.run(decode()) == filters
+
+
+def test_filter_menu_selects_longest_values(make_database, chat):
+    db_path = make_database(SEED)
+
+    async def run() -> None:
+        await open_pool(db_path)
+        try:
+            await chat.send("/start")
+            message = await chat.tap(chat.last_message, "pc_list")
+            message = await chat.tap(message, button(message, BUTTONS["filters"]))
+
+            # Select both facets
+            message = await chat.tap(message, button(message, CONDITION))
+            message = await chat.tap(message, button(message, PART_TYPE.replace("_", " ")))
+
+            message = await chat.tap(message, button(message, "Show"))
+            assert message.text == CATALOG_TEXT
+            assert listing_buttons(message) == {"listing:9001"}
+        finally:
+            detail_prefetcher.cancel(chat.user.id)
+            await asyncio.sleep(0)
+            await close_pools()
+
+    asyncio.run(run())
@@ -0,0 +1,81 @@
+import asyncio
+import sqlite3
+
+import numpy as np
+
+from utils.database_utils import ColumnarSnapshotWriter, load_snapshot, open_pool, close_pools
+
+# Only these orders, no bids
+EMPTY = "DELETE FROM Orders; DELETE FROM Bids;"
+
+SEED = EMPTY + """
+    INSERT INTO Users (User_Id, Username, Name) VALUES (9001, 'buyer', 'Buyer');
+    INSERT INTO Orders (Order_Id, User_Id, Item_Id, Total_Price, Profit, Status, Created_At) VALUES
+        (1, 9001, 10, 100, 10, 'Paid', '2026-01-01 10:00:00'),
+        (2, 9001, 11, 250.5, NULL, 'Pending', '2026-01-02 11:30:00'),
+        (3, 9001, 12, 80, 5, 'Shipped', '2026-01-03 12:45:00');
+"""
+
+
+def snapshot(db_path: str, directory: str, rebuild: bool = False) -> int:
+    async def run() -> int:
+        await open_pool(db_path)
+        try:
+            return await ColumnarSnapshotWriter(db_path, segment_rows=2).snapshot("Orders", directory, rebuild)
+        finally:
+            await close_pools()
+
+    return asyncio.run(run())
+
+
+def test_snapshot_reads_back(make_database, tmp_path):
+    db_path = make_database(SEED)
+    directory = str(tmp_path / "snapshots")
+
+    assert snapshot(db_path, directory) == 3
+
+    orders = load_snapshot(directory, "Orders")
+    assert len(orders) == 3
+    assert len(orders.segments) == 2
+    assert orders.last_key == 3
+    assert orders.column("Order_Id").tolist() == [1, 2, 3]
+    assert orders.column("Status").tolist() == ["Paid", "Pending", "Shipped"]
+    assert orders.column("Total_Price").tolist() == [100, 250.5, 80]
+    assert np.isnan(orders.column("Profit")[1])
+    assert orders.column("Created_At")[2] == np.datetime64("2026-01-03T12:45:00")
+
+
+def test_snapshot_appends_new_rows_and_rebuilds(make_database, tmp_path):
+    db_path = make_database(SEED)
+    directory = str(tmp_path / "snapshots")
+    snapshot(db_path, directory)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("INSERT INTO Orders (Order_Id, User_Id, Item_Id, Total_Price) VALUES (4, 9001, 13, 60)")
+        conn.commit()
+    finally:
+        conn.close()
+
+    assert snapshot(db_path, directory) == 1
+    assert load_snapshot(directory, "Orders").column("Order_Id").tolist() == [1, 2, 3, 4]
+
+    assert snapshot(db_path, directory, rebuild=True) == 4
+    assert load_snapshot(directory, "Orders").column("Order_Id").tolist() == [1, 2, 3, 4]
+
+
+def test_empty_table_writes_meta(make_database, tmp_path):
+    db_path = make_database(EMPTY)
+    directory = str(tmp_path / "snapshots")
+
+    async def run() -> int:
+        await open_pool(db_path)
+        try:
+            return await ColumnarSnapshotWriter(db_path).snapshot("Bids", directory)
+        finally:
+            await close_pools()
+
+    assert asyncio.run(run()) == 0
+    bids = load_snapshot(directory, "Bids")
+    assert len(bids) == 0
+    assert bids.column("Bid_Id").tolist() == []
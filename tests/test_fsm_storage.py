@@ -0,0 +1,38 @@
+import asyncio
+
+from aiogram.fsm.storage.base import StorageKey
+
+from utils.database_utils import open_pool, close_pools
+from utils.fsm_storage_utils import SQLiteStorage
+
+KEY = StorageKey(bot_id=1, chat_id=9001, user_id=9001)
+OTHER_KEY = StorageKey(bot_id=1, chat_id=9002, user_id=9002)
+
+
+def test_flush_persists_and_deletes(make_database):
+    db_path = make_database()
+
+    async def run() -> None:
+        await open_pool(db_path)
+        try:
+            storage = SQLiteStorage(db_path)
+            await storage.set_state(KEY, "BidState:waiting_for_price")
+            await storage.set_data(KEY, {"item_id": 7})
+            await storage.set_state(OTHER_KEY, "BidState:waiting_for_price")
+            await storage.flush()
+
+            # Cleared keys are deleted by the next flush
+            await storage.set_state(OTHER_KEY, None)
+            await storage.flush()
+            assert storage.flushes == 2
+
+            # A new storage has nothing in memory and loads from SQLite
+            reloaded = SQLiteStorage(db_path)
+            assert await reloaded.get_state(KEY) == "BidState:waiting_for_price"
+            assert await reloaded.get_data(KEY) == {"item_id": 7}
+            assert await reloaded.get_state(OTHER_KEY) is None
+            assert reloaded.loads == 2
+        finally:
+            await close_pools()
+
+    asyncio.run(run())
@@ -0,0 +1,21 @@
+import asyncio
+
+from utils.inline_search_utils import inline_search
+from utils.inline_search_utils import inline_cache, normalize_query, search_listings_inline
+
+
+def test_search_racing_a_write_is_not_cached(monkeypatch):
+    stale = ([{"listing_id": 1}], "")
+
+    async def search_during_write(query, page, limit):
+        # A listing is written while the search is still reading
+        inline_cache.clear("Listings", 1)
+        return stale[0], False, False
+
+    monkeypatch.setattr(inline_search, "search_postings_page", search_during_write)
+    inline_cache.clear()
+
+    page = asyncio.run(search_listings_inline("RTX 3070"))
+
+    assert page == stale
+    assert inline_cache.get((normalize_query("RTX 3070"), "", 20)) is None
@@ -0,0 +1,40 @@
+import asyncio
+
+from handlers.callback.comptuer_list_handler.computer_list import CATALOG_TEXT
+from utils.database_utils import open_pool, close_pools
+from utils.listing_detail_utils import detail_prefetcher
+
+SEED = """
+    INSERT INTO Parts (Part_Id, Type, Title, Condition, Listed_Price)
+        VALUES (9001, 'GPU', 'GeForce RTX 3070', 'Used', 300);
+    INSERT INTO Listings (Listing_Id, Item_Type, Item_Id, Added_Price) VALUES (9001, 'Part', 9001, 350);
+"""
+
+
+def test_back_from_search_shows_previous_screen(make_database, chat):
+    db_path = make_database(SEED)
+
+    async def run() -> None:
+        await open_pool(db_path)
+        try:
+            await chat.send("/start")
+            catalog = await chat.tap(chat.last_message, "pc_list")
+            assert catalog.text == CATALOG_TEXT
+
+            await chat.send("rtx")
+            results = chat.last_message
+            assert results.text == "Results for <b>rtx</b>:"
+
+            # Back leaves the search results for the catalog they were searched from
+            shown = await chat.tap(results, "go_back")
+            assert shown.text == CATALOG_TEXT
+
+            # ... and the main menu is next
+            shown = await chat.tap(shown, "go_back")
+            assert shown.text != CATALOG_TEXT
+        finally:
+            detail_prefetcher.cancel(chat.user.id)
+            await asyncio.sleep(0)
+            await close_pools()
+
+    asyncio.run(run())
@@ -0,0 +1,44 @@
+import asyncio
+
+from aiogram.methods import AnswerCallbackQuery
+
+from keyboards.callback_factories import OrderCallback
+from utils.database_utils import open_pool, close_pools
+
+
+def seed(user_id: int) -> str:
+    # One order of the chat's user and one of somebody else
+    return f"""
+        INSERT INTO Users (User_Id, Username, Name) VALUES ({user_id}, 'buyer', 'Buyer'), (1, 'other', 'Other');
+        INSERT INTO Orders (Order_Id, User_Id, Item_Id, Total_Price, Notes_and_instructions) VALUES
+            (9001, {user_id}, 9001, 500, 'Leave at <door>'), (9002, 1, 9001, 700, NULL);
+    """
+
+
+def test_order_opens_and_goes_back(make_database, chat):
+    db_path = make_database(seed(chat.user.id))
+
+    async def run() -> None:
+        await open_pool(db_path)
+        try:
+            await chat.send("/start")
+            orders = await chat.tap(chat.last_message, "my_orders")
+            assert orders.text == "Here are your orders:\n"
+
+            shown = await chat.tap(orders, OrderCallback(order_id=9001).pack())
+            assert shown.text.startswith("<b>Order ID: 9001</b>\n")
+            assert "Notes: Leave at &lt;door&gt;" in shown.text
+            # Answered, then edited
+            assert isinstance(chat.session.sent[-2], AnswerCallbackQuery)
+
+            shown = await chat.tap(shown, "go_back")
+            assert shown.text == "Here are your orders:\n"
+
+            # Orders of other users stay hidden
+            shown = await chat.tap(shown, OrderCallback(order_id=9002).pack())
+            assert shown.text == "Here are your orders:\n"
+            assert chat.session.sent[-1].show_alert
+        finally:
+            await close_pools()
+
+    asyncio.run(run())
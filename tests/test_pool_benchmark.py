@@ -0,0 +1,54 @@
+import asyncio
+import time
+from typing import Tuple
+
+import aiosqlite
+
+from utils.database_utils import AsyncDatabase, open_pool, close_pools
+
+QUERIES = 500
+QUERY = "SELECT * FROM Listings WHERE Listing_Id = ?"
+
+SEED = """
+    WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 1000)
+    INSERT INTO Listings (Item_Type, Item_Id, Added_Price) SELECT 'Part', x, x FROM n;
+"""
+
+
+async def connection_per_query(db_path: str, listing_id: int) -> Tuple:
+    """
+    How AsyncDatabase read a row before the pool: a new connection for every query.
+    """
+    async with aiosqlite.connect(db_path) as conn:
+        async with conn.execute(QUERY, (listing_id,)) as cursor:
+            return await cursor.fetchone()
+
+
+async def mean_us(read, queries: int = QUERIES) -> float:
+    started = time.perf_counter()
+    for i in range(queries):
+        await read(i % 1000 + 1)
+    return (time.perf_counter() - started) / queries * 1_000_000
+
+
+def test_pooled_query_beats_connection_per_query(make_database, capsys):
+    db_path = make_database(SEED)
+
+    async def run() -> Tuple[float, float]:
+        await open_pool(db_path)
+        try:
+            db = AsyncDatabase(db_path)
+            pooled = await mean_us(lambda listing_id: db.fetchone(QUERY, (listing_id,)))
+            per_query = await mean_us(lambda listing_id: connection_per_query(db_path, listing_id))
+            return pooled, per_query
+        finally:
+            await close_pools()
+
+    pooled, per_query = asyncio.run(run())
+
+    with capsys.disabled():
+        print(f"\nListing by id, mean of {QUERIES} queries:")
+        print(f"  pooled connection     {pooled:7.0f} us")
+        print(f"  connection per query  {per_query:7.0f} us")
+
+    assert pooled < per_query, f"Pooled query is not faster ({pooled:.0f} vs {per_query:.0f} us)"
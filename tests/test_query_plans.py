@@ -0,0 +1,135 @@
+import asyncio
+import sqlite3
+from typing import Any, List, Set, Tuple
+
+import pytest
+
+from aiogram.fsm.storage.base import StorageKey
+from utils.database_utils import (
+    AsyncDatabase, AsyncListingsRepository, AsyncFacetsRepository, AsyncSearchRepository, AsyncSpecsRepository,
+    AsyncPCsRepository, AsyncLaptopsRepository, AsyncPartsRepository, AsyncOrdersRepository, AsyncBidsRepository,
+    AsyncUsersRepository, AsyncAdminsRepository, CatalogFilters, open_pool, close_pools
+)
+from utils.fsm_storage_utils import SQLiteStorage
+
+# One row of everything, so that every query of a lookup actually runs
+SEED = """
+    INSERT INTO Parts (Part_Id, Type, Title, Condition, Listed_Price) VALUES (9001, 'CPU', 'Test CPU', 'New', 100);
+    INSERT INTO PCs (PC_Id, Title, CPU_Id) VALUES (9001, 'Test PC', 9001);
+    INSERT INTO Laptops (Laptop_Id, Title, CPU_Id) VALUES (9001, 'Test Laptop', 9001);
+    INSERT INTO Listings (Listing_Id, Item_Type, Item_Id, Added_Price) VALUES
+        (9001, 'PC', 9001, 500), (9002, 'Laptop', 9001, 700), (9003, 'Part', 9001, 120);
+    INSERT INTO Users (User_Id, Username, Name) VALUES (9001, 'test', 'Test');
+    INSERT INTO Admins (User_Id, Admin_Id, Admin_name, Access_Level) VALUES (9001, 1, 'Test', 1);
+    INSERT INTO Orders (Order_Id, User_Id, Item_Id, Total_Price) VALUES (9001, 9001, 9001, 500);
+    INSERT INTO Bids (Bid_Id, User_Id, Item_Id, Offered_Price) VALUES (9001, 9001, 9001, 450);
+"""
+
+
+def hot_lookups():
+    """
+    Repository calls made while serving users: (name, coroutine factory).
+    """
+    return [
+        ("get_listing", lambda: AsyncListingsRepository().get_listing(9001)),
+        ("get_listings_by_type", lambda: AsyncListingsRepository().get_listings_by_type("PC")),
+        ("get_catalog(item_type)", lambda: AsyncListingsRepository().get_catalog("PC")),
+        ("get_listings_page", lambda: AsyncListingsRepository().get_listings_page(0)),
+        ("get_listings_page(item_type)", lambda: AsyncListingsRepository().get_listings_page(0, item_type="PC")),
+        ("get_listings_page(before_id)", lambda: AsyncListingsRepository().get_listings_page(before_id=9003)),
+        ("get_filtered_page(type)", lambda: AsyncFacetsRepository().get_filtered_page(CatalogFilters(item_type="PC"))),
+        ("get_filtered_page(price)", lambda: AsyncFacetsRepository().get_filtered_page(CatalogFilters(price_bucket=1))),
+        ("get_filtered_page(type, price)",
+         lambda: AsyncFacetsRepository().get_filtered_page(CatalogFilters(item_type="Laptop", price_bucket=1))),
+        ("get_filtered_page(part_type)",
+         lambda: AsyncFacetsRepository().get_filtered_page(CatalogFilters(part_type="CPU"))),
+        ("search_listing_ids", lambda: AsyncSearchRepository().search_listing_ids("test cpu")),
+        ("search_catalog", lambda: AsyncSearchRepository().search_catalog("test")),
+        ("get_spec(PC)", lambda: AsyncSpecsRepository().get_spec("PC", 9001)),
+        ("get_spec(Laptop)", lambda: AsyncSpecsRepository().get_spec("Laptop", 9001)),
+        ("get_pc", lambda: AsyncPCsRepository().get_pc(9001)),
+        ("get_laptop", lambda: AsyncLaptopsRepository().get_laptop(9001)),
+        ("get_part", lambda: AsyncPartsRepository().get_part(9001)),
+        ("get_parts_by_type", lambda: AsyncPartsRepository().get_parts_by_type("CPU")),
+        ("get_orders_by_user", lambda: AsyncOrdersRepository().get_orders_by_user(9001)),
+        ("get_orders_with_users(user_id)", lambda: AsyncOrdersRepository().get_orders_with_users(9001)),
+        ("get_bids_by_user", lambda: AsyncBidsRepository().get_bids_by_user(9001)),
+        ("get_user_by_id", lambda: AsyncUsersRepository().get_user_by_id(9001)),
+        ("get_users_by_ids", lambda: AsyncUsersRepository().get_users_by_ids([9001, 9002])),
+        ("get_admin_by_user_id", lambda: AsyncAdminsRepository().get_admin_by_user_id(9001)),
+        ("get_admin_by_admin_id", lambda: AsyncAdminsRepository().get_admin_by_admin_id(1)),
+        ("FSM get_state", lambda: SQLiteStorage().get_state(StorageKey(1, 9001, 9001))),
+    ]
+
+
+@pytest.fixture
+def database(make_database):
+    return make_database(SEED)
+
+
+def record_queries(monkeypatch) -> List[Tuple[str, Tuple]]:
+    """
+    Capture the SQL and params every read sends, as the repositories send them.
+    """
+    sent: List[Tuple[str, Tuple]] = []
+    fetchone, fetchall = AsyncDatabase.fetchone, AsyncDatabase.fetchall
+
+    async def recording_fetchone(self, query: str, params: Tuple = ()) -> Any:
+        sent.append((query, params))
+        return await fetchone(self, query, params)
+
+    async def recording_fetchall(self, query: str, params: Tuple = ()) -> Any:
+        sent.append((query, params))
+        return await fetchall(self, query, params)
+
+    monkeypatch.setattr(AsyncDatabase, "fetchone", recording_fetchone)
+    monkeypatch.setattr(AsyncDatabase, "fetchall", recording_fetchall)
+    return sent
+
+
+def full_scans(conn: sqlite3.Connection, query: str, params: Tuple) -> List[str]:
+    """
+    Plan steps that read a whole table: `SCAN <table>` without an index.
+
+    Scans of CTEs and subquery results (whose names are not tables) are fine.
+    """
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    return [
+        detail for *_, detail in conn.execute(f"EXPLAIN QUERY PLAN {query}", params)
+        if detail.startswith("SCAN ") and " USING " not in detail and "VIRTUAL TABLE" not in detail
+        and _scanned_table(detail, query, tables) in tables
+    ]
+
+
+def _scanned_table(step: str, query: str, tables: Set[str]) -> str:
+    # "SCAN l" names the alias; find "<table> l" in the query text
+    name = step.split()[1]
+    if name in tables:
+        return name
+    words = query.replace(",", " ").split()
+    for table, alias in zip(words, words[1:]):
+        if alias == name and table in tables:
+            return table
+    return name
+
+
+@pytest.mark.parametrize("name, lookup", hot_lookups(), ids=[name for name, _ in hot_lookups()])
+def test_hot_query_uses_index(database, monkeypatch, name, lookup):
+    sent = record_queries(monkeypatch)
+
+    async def run() -> None:
+        await open_pool(database)
+        try:
+            await lookup()
+        finally:
+            await close_pools()
+
+    asyncio.run(run())
+    assert sent, f"{name} sent no query"
+
+    conn = sqlite3.connect(database)
+    try:
+        scans = [(query, step) for query, params in sent for step in full_scans(conn, query, params)]
+    finally:
+        conn.close()
+    assert not scans, f"{name} scans a whole table: {scans}"
@@ -0,0 +1,14 @@
+import asyncio
+
+from utils.report_utils.format_reports import CACHES, format_cache, format_report
+
+
+def test_format_cache_computes_hit_rate():
+    lines = format_cache("Rows", {"hits": 3, "misses": 1, "cached": 4, "memory_kb": 1.6})
+    assert lines == ["<b>Rows</b>", "Hit rate: 75.0% (3 hits, 1 misses)", "Cached: 4, memory kb: 2"]
+
+
+def test_cache_report_has_every_cache():
+    text = asyncio.run(format_report("cache"))
+    for cache in CACHES:
+        assert f"<b>{cache.label}</b>\nHit rate: " in text
@@ -0,0 +1,68 @@
+import asyncio
+import time
+from typing import List, Tuple
+
+from utils.database_utils import AsyncDatabase, AsyncSearchRepository, open_pool, close_pools
+
+ROWS = 20000
+RUNS = 20
+
+# ROWS parts with a few rare and many common words, one listing each
+SEED = f"""
+    WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < {ROWS})
+    INSERT INTO Parts (Type, Title, Condition, Listed_Price, Description, Notes)
+    SELECT 'GPU',
+           'GeForce RTX ' || (3050 + x % 50) || ' ' || CASE WHEN x % 997 = 0 THEN 'Thinkpad dock' ELSE 'Gaming' END,
+           'Used', x % 900, 'Graphics card number ' || x, 'Batch ' || (x % 100)
+    FROM n;
+    INSERT INTO Listings (Item_Type, Item_Id, Added_Price) SELECT 'Part', Part_Id, Listed_Price FROM Parts;
+"""
+
+# (query, selective): selective queries match a handful of rows
+QUERIES = [("thinkpad dock", True), ("rtx 3071", False), ("gaming", False)]
+
+
+def like_query(text: str) -> Tuple[str, Tuple]:
+    """
+    The LIKE search FTS replaced: every word in the title, description or notes.
+    """
+    words = text.split()
+    condition = " AND ".join("(Title LIKE ? OR Description LIKE ? OR Notes LIKE ?)" for _ in words)
+    return f"SELECT Part_Id FROM Parts WHERE {condition} LIMIT 11", tuple(f"%{w}%" for w in words for _ in range(3))
+
+
+async def mean_ms(search, runs: int = RUNS) -> float:
+    started = time.perf_counter()
+    for _ in range(runs):
+        await search()
+    return (time.perf_counter() - started) / runs * 1000
+
+
+def test_fts_search_beats_like(make_database, capsys):
+    db_path = make_database(SEED)
+    results: List[Tuple[str, bool, float, float]] = []
+
+    async def run() -> None:
+        await open_pool(db_path)
+        try:
+            search, db = AsyncSearchRepository(db_path), AsyncDatabase(db_path)
+            for text, selective in QUERIES:
+                query, params = like_query(text)
+                fts = await mean_ms(lambda: search.search_listing_ids(text, 11))
+                like = await mean_ms(lambda: db.fetchall(query, params))
+                results.append((text, selective, fts, like))
+        finally:
+            await close_pools()
+
+    asyncio.run(run())
+
+    with capsys.disabled():
+        print(f"\nTop 11 of {ROWS} parts, mean of {RUNS} runs:")
+        for text, _, fts, like in results:
+            print(f"  {text:15} FTS {fts:6.2f} ms   LIKE {like:6.2f} ms")
+
+    # LIKE stops at the first 11 (unranked) rows of common words, but reads
+    # every row for rare ones
+    for text, selective, fts, like in results:
+        if selective:
+            assert fts < like, f"FTS search for {text!r} is not faster than LIKE ({fts:.2f} vs {like:.2f} ms)"
@@ -0,0 +1,51 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+from utils.database_utils import AsyncDatabase, open_pool, close_pools
+
+
+def run(db_path: str, work) -> None:
+    async def main() -> None:
+        await open_pool(db_path)
+        try:
+            await work(AsyncDatabase(db_path))
+        finally:
+            await close_pools()
+
+    asyncio.run(main())
+
+
+def tables(db_path: str) -> set:
+    conn = sqlite3.connect(db_path)
+    try:
+        return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    finally:
+        conn.close()
+
+
+def test_script_is_committed(make_database):
+    db_path = make_database()
+    run(db_path, lambda db: db.run_script_in_transaction("CREATE TABLE T1 (X); INSERT INTO T1 VALUES (1);"))
+    assert "T1" in tables(db_path)
+
+
+def test_failing_script_leaves_no_changes(make_database):
+    db_path = make_database()
+    with pytest.raises(sqlite3.OperationalError):
+        run(db_path, lambda db: db.run_script_in_transaction("CREATE TABLE T1 (X); INSERT INTO Missing VALUES (1);"))
+    assert "T1" not in tables(db_path)
+
+
+def test_failing_block_rolls_back_the_script(make_database):
+    db_path = make_database()
+
+    async def work(db: AsyncDatabase) -> None:
+        async with db.transaction("CREATE TABLE T1 (X);") as conn:
+            await conn.execute("INSERT INTO T1 VALUES (1)")
+            raise RuntimeError("failed after the script")
+
+    with pytest.raises(RuntimeError):
+        run(db_path, work)
+    assert "T1" not in tables(db_path)
@@ -1,3 +1,9 @@
 from . import database_utils
 from . import computer_list_utils
 from . import order_list_utils
+from . import report_utils
+from . import inline_search_utils
+from . import listing_detail_utils
+from . import screen_utils
+from . import fsm_storage_utils
+from . import api_stats_utils
@@ -0,0 +1,3 @@
+from .api_calls import ApiCallStats, api_call_stats
+
+__all__ = ["ApiCallStats", "api_call_stats"]
@@ -0,0 +1,60 @@
+from collections import Counter
+from contextvars import ContextVar, Token
+from typing import Dict, List, Optional
+
+# Bot API methods called while handling the current update (None outside of one)
+_update_calls: ContextVar[Optional[List[str]]] = ContextVar("update_calls", default=None)
+
+
+class ApiCallStats:
+    """
+    Bot API calls made per update, by update type.
+
+    The update middleware opens a per-update call list (`start_update`),
+    the session request middleware appends every API method to it
+    (`record_call`) and `finish_update` folds it into the totals. Calls
+    made outside of an update (e.g. startup) are counted as "background".
+    """
+
+    def __init__(self) -> None:
+        self.updates: Counter = Counter()
+        self.calls: Counter = Counter()
+        self.max_calls: Dict[str, int] = {}
+        self.methods: Counter = Counter()
+
+    def start_update(self) -> Token:
+        return _update_calls.set([])
+
+    def record_call(self, method: str) -> None:
+        self.methods[method] += 1
+        calls = _update_calls.get()
+        if calls is None:
+            self.calls["background"] += 1
+        else:
+            calls.append(method)
+
+    def finish_update(self, update_type: str, token: Token) -> None:
+        calls = _update_calls.get() or []
+        _update_calls.reset(token)
+
+        self.updates[update_type] += 1
+        self.calls[update_type] += len(calls)
+        self.max_calls[update_type] = max(self.max_calls.get(update_type, 0), len(calls))
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per update type: updates, API calls, calls per update and the most calls in one update.
+        """
+        return {
+            update_type: {
+                "updates": updates,
+                "calls": self.calls[update_type],
+                "calls_per_update": self.calls[update_type] / updates,
+                "max_calls": self.max_calls[update_type],
+            }
+            for update_type, updates in self.updates.items()
+        }
+
+
+# Shared instance fed by the API call middlewares
+api_call_stats = ApiCallStats()
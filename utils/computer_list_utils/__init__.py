@@ -1,5 +1,7 @@
-from .get_computer_postings import get_postings
+from .get_computer_postings import get_postings, get_postings_page, search_postings_page
 from .format_postings_for_keyboard import format_computers
 from .formate_description_of_unit import format_computer_description_message
+from .catalog_cache import CatalogPage, CatalogPageCache, catalog_cache
 
-__all__ = ["get_postings", "format_computers", "format_computer_description_message"]
+__all__ = ["get_postings", "get_postings_page", "search_postings_page", "format_computers", "format_computer_description_message",
+           "CatalogPage", "CatalogPageCache", "catalog_cache"]
@@ -0,0 +1,109 @@
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable
+from utils.database_utils import WriteListener, row_cache
+from utils.screen_utils import ScreenOutput
+
+# Message text and keyboard of one rendered catalog page
+CatalogPage = ScreenOutput
+
+
+class CatalogPageCache:
+    """
+    Process-wide cache of rendered catalog pages, shared by all users.
+
+    Pages are keyed by (catalog version, page key). Any write to a listing or
+    an item bumps the version, which makes every cached page unreachable, so a
+    page is rendered once per catalog change no matter how many users view it.
+    Concurrent misses for the same page share a single render (single-flight).
+
+    Cached keyboards are shared objects and must not be modified by callers.
+    """
+
+    # Section title in the Caches report
+    label = "Catalog pages"
+
+    def __init__(self, max_entries: int = 500) -> None:
+        """
+        Args:
+            max_entries (int): Maximum number of cached pages.
+        """
+        self.max_entries = max_entries
+        self.version = 0
+
+        self.hits = 0
+        self.renders = 0
+        self.coalesced = 0
+
+        self._pages: "OrderedDict[Hashable, CatalogPage]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def get_or_render(self, page_key: Hashable, render: Callable[[], Awaitable[CatalogPage]]) -> CatalogPage:
+        """
+        The cached page for `page_key`, rendering it with `render` on a miss.
+
+        Args:
+            page_key (Hashable): Identifies the page within one catalog version,
+                e.g. (filters, after_id, before_id).
+            render (Callable): Coroutine function producing the page.
+
+        Returns:
+            CatalogPage: The rendered page.
+        """
+        key = (self.version, page_key)
+
+        page = self._pages.get(key)
+        if page is not None:
+            self._pages.move_to_end(key)
+            self.hits += 1
+            return page
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            self.renders += 1
+            future = asyncio.ensure_future(render())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+
+        # Shielded: a cancelled viewer must not cancel the render for the others
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        # A page rendered across a write belongs to an old version: drop it
+        if key[0] != self.version:
+            return
+        self._pages[key] = future.result()
+        while len(self._pages) > self.max_entries:
+            self._pages.popitem(last=False)
+
+    def bump(self, *_: Any) -> None:
+        self.version += 1
+        self._pages.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Hits and misses (rendered or shared with a running render), then the
+        catalog version, renders, shared renders and cached pages.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.renders + self.coalesced,
+            "version": self.version,
+            "renders": self.renders,
+            "shared_renders": self.coalesced,
+            "cached": len(self._pages),
+        }
+
+
+# Shared instance used by the catalog handlers
+catalog_cache = CatalogPageCache()
+
+_on_write: WriteListener = catalog_cache.bump
+for _table in ("Listings", "PCs", "Laptops", "Parts"):
+    row_cache.subscribe(_table, _on_write)
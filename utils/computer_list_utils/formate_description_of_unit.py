@@ -1,10 +1,15 @@
 
+from typing import Optional
+from utils.database_utils import ResolvedSpec
+
+
 def format_computer_description_message(
     item: tuple,
     item_type: str,
     added_price: float = None,
     real_price: float = None,
-    notes: str = None
+    notes: str = None,
+    spec: Optional[ResolvedSpec] = None
 ) -> str:
     """
     Format a PC, Laptop, or Part row into a Telegram-friendly message.
@@ -15,6 +20,8 @@ def format_computer_description_message(
         added_price (float, optional): Listing added price.
         real_price (float, optional): Listing real price.
         notes (str, optional): Notes from the listing.
+        spec (ResolvedSpec, optional): Resolved components of a PC or Laptop;
+            when given, slots are shown by part title instead of raw ids.
 
     Returns:
         str: Formatted message.
@@ -22,8 +29,9 @@ def format_computer_description_message(
 
     message_lines = []
 
-    # Basic title
-    title = item[1] if item else "Unknown"
+    # Basic title (a Parts row has Type before Title)
+    title_index = 2 if item_type == "Part" else 1
+    title = item[title_index] if item else "Unknown"
     message_lines.append(f"<b>{title}</b>")
 
     # Optional notes / description
@@ -42,16 +50,19 @@ def format_computer_description_message(
         ) = item
 
         message_lines.append(f"<b>Condition:</b> {Condition}")
-        message_lines.append(f"<b>CPU ID:</b> {CPU_Id}")
-        message_lines.append(f"<b>GPU ID:</b> {GPU_Id}")
-        message_lines.append(f"<b>RAM ID:</b> {RAM_Id}")
-        message_lines.append(f"<b>Storage SSD ID:</b> {SSD_Id}")
-        message_lines.append(f"<b>Storage HDD ID:</b> {HDD_Id}")
-        message_lines.append(f"<b>PSU ID:</b> {PSU_Id}")
-        message_lines.append(f"<b>Motherboard ID:</b> {Motherboard_Id}")
-        message_lines.append(f"<b>Case ID:</b> {Case_Id}")
-        message_lines.append(f"<b>Cooler ID:</b> {Cooler_Id}")
-        message_lines.append(f"<b>Fan ID:</b> {Fan_Id}")
+        if spec is not None:
+            message_lines.extend(_format_components(spec))
+        else:
+            message_lines.append(f"<b>CPU ID:</b> {CPU_Id}")
+            message_lines.append(f"<b>GPU ID:</b> {GPU_Id}")
+            message_lines.append(f"<b>RAM ID:</b> {RAM_Id}")
+            message_lines.append(f"<b>Storage SSD ID:</b> {SSD_Id}")
+            message_lines.append(f"<b>Storage HDD ID:</b> {HDD_Id}")
+            message_lines.append(f"<b>PSU ID:</b> {PSU_Id}")
+            message_lines.append(f"<b>Motherboard ID:</b> {Motherboard_Id}")
+            message_lines.append(f"<b>Case ID:</b> {Case_Id}")
+            message_lines.append(f"<b>Cooler ID:</b> {Cooler_Id}")
+            message_lines.append(f"<b>Fan ID:</b> {Fan_Id}")
 
     elif item_type == "Laptop":
         (
@@ -61,25 +72,28 @@ def format_computer_description_message(
         ) = item
 
         message_lines.append(f"<b>Condition:</b> {Condition}")
-        message_lines.append(f"<b>CPU ID:</b> {CPU_Id}")
-        message_lines.append(f"<b>GPU ID:</b> {GPU_Id}")
-        message_lines.append(f"<b>RAM ID:</b> {RAM_Id}")
-        message_lines.append(f"<b>Storage SSD ID:</b> {SSD_Id}")
-        message_lines.append(f"<b>Storage HDD ID:</b> {HDD_Id}")
-        message_lines.append(f"<b>Motherboard ID:</b> {Motherboard_Id}")
-        message_lines.append(f"<b>Battery ID:</b> {Battery_Id}")
-        message_lines.append(f"<b>Keyboard ID:</b> {Keyboard_Id}")
-        message_lines.append(f"<b>Touchpad ID:</b> {Touchpad_Id}")
-        message_lines.append(f"<b>Display ID:</b> {Display_Id}")
-        message_lines.append(f"<b>Charger ID:</b> {Charger_Id}")
-        message_lines.append(f"<b>Webcam ID:</b> {Webcam_Id}")
-        message_lines.append(f"<b>Case Panel ID:</b> {Case_Panel_Id}")
+        if spec is not None:
+            message_lines.extend(_format_components(spec))
+        else:
+            message_lines.append(f"<b>CPU ID:</b> {CPU_Id}")
+            message_lines.append(f"<b>GPU ID:</b> {GPU_Id}")
+            message_lines.append(f"<b>RAM ID:</b> {RAM_Id}")
+            message_lines.append(f"<b>Storage SSD ID:</b> {SSD_Id}")
+            message_lines.append(f"<b>Storage HDD ID:</b> {HDD_Id}")
+            message_lines.append(f"<b>Motherboard ID:</b> {Motherboard_Id}")
+            message_lines.append(f"<b>Battery ID:</b> {Battery_Id}")
+            message_lines.append(f"<b>Keyboard ID:</b> {Keyboard_Id}")
+            message_lines.append(f"<b>Touchpad ID:</b> {Touchpad_Id}")
+            message_lines.append(f"<b>Display ID:</b> {Display_Id}")
+            message_lines.append(f"<b>Charger ID:</b> {Charger_Id}")
+            message_lines.append(f"<b>Webcam ID:</b> {Webcam_Id}")
+            message_lines.append(f"<b>Case Panel ID:</b> {Case_Panel_Id}")
 
     elif item_type == "Part":
         # For parts, just show name / type / condition if available
         (
-            Part_Id, Title, Part_Type, Condition, Listed_Price,
-            Bought_Price, Link, Contact_Info, Created_At
+            Part_Id, Part_Type, Title, Condition, Listed_Price, Sold_Price,
+            Link, Description, Notes_field, Contact_Info, Contract_Id, Created_At
         ) = item
 
         message_lines.append(f"<b>Condition:</b> {Condition}")
@@ -89,3 +103,21 @@ def format_computer_description_message(
         message_lines.append(f"💰 <b>Added Price:</b> ${added_price}")
 
     return "\n".join(message_lines)
+
+
+def _format_components(spec: ResolvedSpec) -> list:
+    """
+    One line per filled component slot, followed by the components total.
+    """
+    lines = []
+    for component in spec.components:
+        if component.title is None:
+            lines.append(f"<b>{component.slot}:</b> part #{component.part_id} (unavailable)")
+            continue
+        lines.append(
+            f"<b>{component.slot}:</b> {component.title} "
+            f"({component.condition}, ${component.price or 0:.2f})"
+        )
+    if spec.components:
+        lines.append(f"<b>Components total:</b> ${spec.total_price:.2f}")
+    return lines
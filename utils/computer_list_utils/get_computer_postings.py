@@ -1,10 +1,6 @@
-from typing import List, Dict, Optional
-from utils.database_utils import (
-    AsyncListingsRepository,
-    AsyncPCsRepository,
-    AsyncLaptopsRepository,
-    AsyncPartsRepository
-)
+from typing import List, Dict, Optional, Tuple
+from utils.database_utils import AsyncListingsRepository, AsyncSearchRepository, AsyncFacetsRepository, \
+    CatalogFilters
 
 
 async def get_postings(
@@ -13,7 +9,7 @@ async def get_postings(
     item_type: Optional[str] = None
 ) -> List[Dict]:
     """
-    Fetch listings with titles from the appropriate table depending on item_type.
+    Fetch listings with titles of their PC, Laptop, or Part in a single query.
 
     Args:
         db (Optional[AsyncListingsRepository]): Existing Listings repo instance.
@@ -28,41 +24,91 @@ async def get_postings(
     if db is None:
         db = AsyncListingsRepository(db_path)
 
-    # Fetch listings, optionally filtered by type
-    if item_type:
-        listings = await db.get_listings_by_type(item_type)
+    # Listings are streamed, already joined to their PC / Laptop / Part titles
+    return [_to_posting(listing) async for listing in db.iter_catalog(item_type)]
+
+
+async def get_postings_page(
+    after_id: int = 0,
+    before_id: Optional[int] = None,
+    limit: int = 10,
+    item_type: Optional[str] = None,
+    db: Optional[AsyncListingsRepository] = None,
+    db_path: Optional[str] = None,
+    filters: Optional[CatalogFilters] = None
+) -> Tuple[List[Dict], bool, bool]:
+    """
+    Fetch one keyset-paginated page of listings with titles.
+
+    Args:
+        after_id (int): Cursor for the next page (last Listing_Id already shown).
+        before_id (Optional[int]): Cursor for the previous page (first Listing_Id shown).
+        limit (int): Page size.
+        item_type (Optional[str]): Filter by 'PC', 'Laptop', or 'Part'.
+        db (Optional[AsyncListingsRepository]): Existing Listings repo instance.
+        db_path (Optional[str]): Path to the database if db is None.
+        filters (Optional[CatalogFilters]): Facet filters; take precedence over `item_type`.
+
+    Returns:
+        Tuple[List[Dict], bool, bool]: (postings, has_previous, has_next).
+    """
+    if db is None:
+        db = AsyncListingsRepository(db_path)
+
+    # One extra row tells whether another page exists in that direction
+    if filters is not None:
+        rows = await AsyncFacetsRepository(db.db_path).get_filtered_page(filters, after_id, limit + 1, before_id)
+    else:
+        rows = await db.get_listings_page(after_id, limit + 1, item_type, before_id)
+
+    if before_id is not None:
+        has_previous = len(rows) > limit
+        rows = rows[-limit:]
+        has_next = True
     else:
-        listings = await db.get_all_listings()
-
-    # Initialize repositories for each item type
-    pc_repo = AsyncPCsRepository(db_path)
-    laptop_repo = AsyncLaptopsRepository(db_path)
-    parts_repo = AsyncPartsRepository(db_path)
-
-    result = []
-
-    for listing in listings:
-        listing_id, item_type, item_id, added_price, real_price, notes, created_at = listing
-
-        # Fetch title from the corresponding repository
-        title = "Unknown"
-        if item_type == "PC":
-            item = await pc_repo.get_pc(item_id)
-            title = item[1] if item else "Unknown PC"
-        elif item_type == "Laptop":
-            item = await laptop_repo.get_laptop(item_id)
-            title = item[1] if item else "Unknown Laptop"
-        elif item_type == "Part":
-            item = await parts_repo.get_part(item_id)
-            title = item[1] if item else "Unknown Part"
-
-        result.append({
-            "listing_id": listing_id,
-            "item_type": item_type,
-            "added_price": added_price,
-            "real_price": real_price,
-            "title": title,
-        })
-
-    return result
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        has_previous = after_id > 0
+
+    return [_to_posting(row) for row in rows], has_previous, has_next
+
+
+async def search_postings_page(
+    text: str,
+    page: int = 0,
+    limit: int = 10,
+    db: Optional[AsyncSearchRepository] = None,
+    db_path: Optional[str] = None
+) -> Tuple[List[Dict], bool, bool]:
+    """
+    Fetch one page of full-text search results, best match first.
+
+    Args:
+        text (str): Free search text typed by the user.
+        page (int): Zero-based page number.
+        limit (int): Page size.
+        db (Optional[AsyncSearchRepository]): Existing Search repo instance.
+        db_path (Optional[str]): Path to the database if db is None.
+
+    Returns:
+        Tuple[List[Dict], bool, bool]: (postings, has_previous, has_next).
+    """
+    if db is None:
+        db = AsyncSearchRepository(db_path)
+
+    # One extra row tells whether another page exists
+    rows = await db.search_catalog(text, limit + 1, page * limit)
+
+    return [_to_posting(row) for row in rows[:limit]], page > 0, len(rows) > limit
+
+
+def _to_posting(listing: Tuple) -> Dict:
+    listing_id, item_type, item_id, added_price, real_price, notes, created_at, title = listing
 
+    return {
+        "listing_id": listing_id,
+        "item_type": item_type,
+        "added_price": added_price,
+        "real_price": real_price,
+        "title": title or f"Unknown {item_type}",
+    }
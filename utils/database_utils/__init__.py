@@ -1,4 +1,9 @@
+from .connection_pool import AsyncConnectionPool, open_pool, close_pools
+from .batch_loader import BatchLoader, LoaderStats, get_loaders, get_loader_stats
+from .write_queue import WriteQueue, start_write_queue, stop_write_queues
 from .database import AsyncDatabase
+from .acl_cache import AccessControlCache, acl_cache
+from .row_cache import RowCache, WriteListener, row_cache, cached, invalidates
 from .admin_database import AsyncAdminsRepository
 from .user_database import AsyncUsersRepository
 from .pc_database import AsyncPCsRepository
@@ -7,9 +12,33 @@ from .laptop_database import AsyncLaptopsRepository
 from .part_database import AsyncPartsRepository
 from .order_database import AsyncOrdersRepository
 from .bid_database import AsyncBidsRepository
+from .report_database import AsyncReportsRepository
+from .search_database import AsyncSearchRepository
+from .facet_database import AsyncFacetsRepository, CatalogFilters, PRICE_BUCKETS, facet_code
+from .spec_database import AsyncSpecsRepository, ResolvedSpec, ResolvedComponent
+from .migrations import run_migrations
+from .table_export import TableExporter
+from .columnar_snapshot import ColumnarSnapshot, ColumnarSnapshotWriter, load_snapshot
 
 __all__ = [
+    "AsyncConnectionPool",
+    "open_pool",
+    "close_pools",
+    "BatchLoader",
+    "LoaderStats",
+    "get_loaders",
+    "get_loader_stats",
+    "WriteQueue",
+    "start_write_queue",
+    "stop_write_queues",
     "AsyncDatabase",
+    "AccessControlCache",
+    "acl_cache",
+    "RowCache",
+    "WriteListener",
+    "row_cache",
+    "cached",
+    "invalidates",
     "AsyncAdminsRepository",
     "AsyncUsersRepository",
     "AsyncListingsRepository",
@@ -18,4 +47,18 @@ __all__ = [
     "AsyncPartsRepository",
     "AsyncOrdersRepository",
     "AsyncBidsRepository",
+    "AsyncReportsRepository",
+    "AsyncSearchRepository",
+    "AsyncFacetsRepository",
+    "CatalogFilters",
+    "PRICE_BUCKETS",
+    "facet_code",
+    "AsyncSpecsRepository",
+    "ResolvedSpec",
+    "ResolvedComponent",
+    "run_migrations",
+    "TableExporter",
+    "ColumnarSnapshot",
+    "ColumnarSnapshotWriter",
+    "load_snapshot",
 ]
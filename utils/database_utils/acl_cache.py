@@ -0,0 +1,150 @@
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from .database import AsyncDatabase
+
+
+logger = logging.getLogger(__name__)
+
+
+class AccessControlCache:
+    """
+    In-memory snapshot of who may use the bot.
+
+    Holds the ids from `Users` and the access levels from `Admins`, so the
+    access filters answer without touching SQLite. The snapshot is loaded at
+    startup, kept up to date by `AsyncUsersRepository` / `AsyncAdminsRepository`
+    writes, and reloaded periodically as a safety net for external edits.
+
+    Metrics:
+        hits: checks answered from the snapshot.
+        misses: checks made before the snapshot was loaded (callers fall back to the DB).
+    """
+
+    # Section title in the Caches report
+    label = "Access control"
+
+    def __init__(self, refresh_interval: float = 300) -> None:
+        """
+        Args:
+            refresh_interval (float): Seconds between background reloads.
+        """
+        self.refresh_interval = refresh_interval
+        self.user_ids: Set[int] = set()
+        self.admin_levels: Dict[int, int] = {}
+        self.loaded = False
+        self.hits = 0
+        self.misses = 0
+        self._refresh_task: Optional[asyncio.Task] = None
+        # Write hooks called while a reload is fetching, re-applied after its swap
+        self._journal: Optional[List[Tuple[Callable, Tuple[Any, ...]]]] = None
+        self._load_lock = asyncio.Lock()
+
+    async def load(self, db_path: Optional[str] = None) -> None:
+        """
+        (Re)load the snapshot from the Users and Admins tables.
+
+        Users and admins added or removed while the tables are read may be
+        missing from what was read, so those writes are re-applied to the new
+        snapshot.
+        """
+        db = AsyncDatabase(db_path)
+        async with self._load_lock:
+            self._journal = []
+            try:
+                users = await db.fetchall("SELECT User_Id FROM Users")
+                admins = await db.fetchall("SELECT User_Id, Access_Level FROM Admins")
+            finally:
+                journal, self._journal = self._journal, None
+
+            # Swap whole objects so readers never see a half-built snapshot
+            self.user_ids = {row[0] for row in users}
+            self.admin_levels = {row[0]: row[1] for row in admins}
+            for hook, args in journal:
+                hook(*args)
+            self.loaded = True
+
+    # ----------------- Lookups -----------------
+
+    def is_allowed(self, user_id: int) -> Optional[bool]:
+        """
+        Whether the user is in Users or Admins; None if the snapshot is not loaded.
+        """
+        if not self.loaded:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return user_id in self.user_ids or user_id in self.admin_levels
+
+    def get_access_level(self, user_id: int) -> Optional[int]:
+        """
+        Admin access level of the user (None if not an admin).
+
+        Before the snapshot is loaded this always returns None, so callers
+        should check `loaded` and fall back to the database.
+        """
+        if not self.loaded:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self.admin_levels.get(user_id)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "users": len(self.user_ids),
+            "admins": len(self.admin_levels),
+        }
+
+    # ----------------- Write hooks -----------------
+
+    def _record(self, hook: Callable, *args: Any) -> None:
+        if self._journal is not None:
+            self._journal.append((hook, args))
+
+    def add_user(self, user_id: int) -> None:
+        self.user_ids.add(user_id)
+        self._record(self.add_user, user_id)
+
+    def remove_user(self, user_id: int) -> None:
+        self.user_ids.discard(user_id)
+        self._record(self.remove_user, user_id)
+
+    def set_admin(self, user_id: int, access_level: int) -> None:
+        self.admin_levels[user_id] = access_level
+        self._record(self.set_admin, user_id, access_level)
+
+    def remove_admin(self, user_id: int) -> None:
+        self.admin_levels.pop(user_id, None)
+        self._record(self.remove_admin, user_id)
+
+    # ----------------- Periodic refresh -----------------
+
+    async def _refresh_loop(self, db_path: Optional[str]) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.load(db_path)
+            except Exception:
+                logger.exception("Failed to refresh the access-control snapshot")
+
+    def start_refresh(self, db_path: Optional[str] = None) -> None:
+        """
+        Start reloading the snapshot every `refresh_interval` seconds.
+        """
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop(db_path))
+
+    async def stop_refresh(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+
+# Shared snapshot used by the access filters and the repositories
+acl_cache = AccessControlCache()
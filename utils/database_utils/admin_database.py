@@ -1,5 +1,6 @@
 from typing import Optional, List, Tuple
 from utils.database_utils import AsyncDatabase
+from .acl_cache import acl_cache
 
 
 class AsyncAdminsRepository(AsyncDatabase):
@@ -22,6 +23,7 @@ class AsyncAdminsRepository(AsyncDatabase):
         columns = ["User_Id", "Admin_Id", "Admin_name", "Access_Level"]
         values = (user_id, admin_id, admin_name, access_level)
         await self.insert(self.TABLE_NAME, columns, values)
+        acl_cache.set_admin(user_id, access_level)
 
     async def get_admin_by_user_id(self, user_id: int) -> Optional[Tuple]:
         """
@@ -68,9 +70,12 @@ class AsyncAdminsRepository(AsyncDatabase):
             update_str = ", ".join(updates)
             params.append(user_id)
             await self.update(self.TABLE_NAME, update_str, "User_Id = ?", tuple(params))
+            if access_level is not None and user_id in acl_cache.admin_levels:
+                acl_cache.set_admin(user_id, access_level)
 
     async def delete_admin(self, user_id: int) -> None:
         """
         Delete an admin by User_Id.
         """
         await self.delete(self.TABLE_NAME, "User_Id = ?", (user_id,))
+        acl_cache.remove_admin(user_id)
@@ -0,0 +1,158 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set
+
+
+BatchFunction = Callable[[List[Any]], Awaitable[Dict[Any, Any]]]
+
+
+@dataclass
+class LoaderStats:
+    """
+    Counters for one BatchLoader.
+
+    Attributes:
+        loads (int): Number of `load()` calls.
+        keys (int): Number of distinct keys actually queried.
+        batches (int): Number of batch queries issued.
+    """
+    loads: int = 0
+    keys: int = 0
+    batches: int = 0
+
+    @property
+    def queries_saved(self) -> int:
+        """Queries avoided compared to one query per `load()` call."""
+        return self.loads - self.batches
+
+
+class BatchLoader:
+    """
+    DataLoader-style batcher for single-id lookups.
+
+    Every `load(key)` made during the same event-loop tick (or within
+    `delay` seconds) is collected, duplicate keys are merged, and the batch
+    function is called once per `max_batch_size` keys. Each caller then
+    receives its own row, or None if the key was not found.
+
+    Typical usage:
+        loader = BatchLoader(fetch_rows_by_ids)
+        row_a, row_b = await asyncio.gather(loader.load(1), loader.load(2))
+    """
+
+    def __init__(
+        self,
+        batch_fn: BatchFunction,
+        max_batch_size: int = 500,
+        delay: float = 0.0,
+        label: str = "Loader"
+    ) -> None:
+        """
+        Args:
+            batch_fn: Coroutine taking a list of keys and returning {key: row}.
+            max_batch_size (int): Maximum number of keys per batch call.
+            delay (float): Seconds to wait for more keys; 0 batches within one tick.
+            label (str): Section title in the Caches report.
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.delay = delay
+        self.label = label
+        self.counters = LoaderStats()
+
+        self._pending: Dict[Hashable, List[asyncio.Future]] = {}
+        self._scheduled = False
+        # Running batches; the event loop only keeps weak references to tasks
+        self._tasks: Set[asyncio.Task] = set()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Loads merged into a key already being fetched (hits) and keys queried
+        (misses), then batch queries and queries saved.
+        """
+        return {
+            "hits": self.counters.loads - self.counters.keys,
+            "misses": self.counters.keys,
+            "queries": self.counters.batches,
+            "queries_saved": self.counters.queries_saved,
+        }
+
+    async def load(self, key: Hashable) -> Optional[Any]:
+        """
+        Queue `key` for the next batch and wait for its row.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.counters.loads += 1
+        self._pending.setdefault(key, []).append(future)
+
+        if not self._scheduled:
+            self._scheduled = True
+            if self.delay:
+                loop.call_later(self.delay, self._dispatch)
+            else:
+                loop.call_soon(self._dispatch)
+
+        return await future
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        self._scheduled = False
+
+        keys = list(pending)
+        for start in range(0, len(keys), self.max_batch_size):
+            chunk = {key: pending[key] for key in keys[start:start + self.max_batch_size]}
+            task = asyncio.ensure_future(self._run_batch(chunk))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, pending: Dict[Hashable, List[asyncio.Future]]) -> None:
+        self.counters.batches += 1
+        self.counters.keys += len(pending)
+
+        try:
+            rows = await self.batch_fn(list(pending))
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+        else:
+            for key, futures in pending.items():
+                for future in futures:
+                    if not future.done():
+                        future.set_result(rows.get(key))
+        finally:
+            # Cancelled (e.g. on shutdown): no caller may be left waiting
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.cancel()
+
+
+_loaders: Dict[Hashable, BatchLoader] = {}
+
+
+def get_loader(name: Hashable, batch_fn: BatchFunction, label: str = "Loader") -> BatchLoader:
+    """
+    Return the shared loader registered under `name`, creating it with `batch_fn` if needed.
+    """
+    loader = _loaders.get(name)
+    if loader is None:
+        loader = BatchLoader(batch_fn, label=label)
+        _loaders[name] = loader
+    return loader
+
+
+def get_loaders() -> List[BatchLoader]:
+    """
+    Every shared loader, in creation order.
+    """
+    return list(_loaders.values())
+
+
+def get_loader_stats() -> Dict[Hashable, LoaderStats]:
+    """
+    Counters of every shared loader, keyed by loader name.
+    """
+    return {name: loader.counters for name, loader in _loaders.items()}
@@ -1,4 +1,4 @@
-from typing import Optional, List, Tuple
+from typing import AsyncIterator, Optional, List, Tuple
 from utils.database_utils import AsyncDatabase
 
 
@@ -49,6 +49,9 @@ class AsyncBidsRepository(AsyncDatabase):
     async def get_all_bids(self) -> List[Tuple]:
         return await self.get_table(self.TABLE_NAME)
 
+    def iter_all_bids(self, chunk_size: int = 500) -> AsyncIterator[Tuple]:
+        return self.iter_table(self.TABLE_NAME, chunk_size)
+
     async def update_bid(
         self,
         bid_id: int,
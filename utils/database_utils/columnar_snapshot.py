@@ -0,0 +1,191 @@
+import asyncio
+import json
+import os
+import shutil
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from .database import AsyncDatabase
+
+
+# Tables with a snapshot layout, mapped to the key used for incremental appends
+SNAPSHOT_TABLES: Dict[str, str] = {
+    "Orders": "Order_Id",
+    "Bids": "Bid_Id",
+    "Listings": "Listing_Id",
+}
+
+META_FILE = "meta.json"
+
+
+def _column_dtype(name: str, declared_type: str, not_null: bool) -> str:
+    """
+    Map an SQLite column to a NumPy dtype string.
+
+    Nullable integers become float64 so NULL can be stored as NaN; text uses
+    fixed-width unicode so it stays memory-mappable.
+    """
+    declared_type = declared_type.upper()
+    if name == "Created_At":
+        return "datetime64[s]"
+    if "INT" in declared_type:
+        return "int64" if not_null else "float64"
+    if "REAL" in declared_type or "NUMERIC" in declared_type:
+        return "float64"
+    return "U"
+
+
+def _to_array(values: List[Any], dtype: str) -> np.ndarray:
+    if dtype == "U":
+        return np.array(["" if value is None else str(value) for value in values], dtype="U")
+    if dtype == "float64":
+        return np.array([np.nan if value is None else value for value in values], dtype=dtype)
+    return np.array(values, dtype=dtype)
+
+
+def _read_meta(meta_path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(meta_path):
+        return None
+    with open(meta_path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _write_meta(meta_path: str, meta: Dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+    with open(meta_path, "w", encoding="utf-8") as file:
+        json.dump(meta, file)
+
+
+class ColumnarSnapshot:
+    """
+    Memory-mapped, typed columnar view of one exported table.
+
+    Every column of every segment is an `.npy` file opened with
+    `mmap_mode="r"`, so loading costs no copies. `column()` returns a zero-copy
+    view when the snapshot has a single segment and concatenates otherwise.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        with open(os.path.join(directory, META_FILE), encoding="utf-8") as file:
+            self.meta: Dict[str, Any] = json.load(file)
+
+        self.segments: List[Dict[str, np.ndarray]] = [
+            {
+                name: np.load(os.path.join(directory, segment, f"{name}.npy"), mmap_mode="r")
+                for name in self.columns
+            }
+            for segment in self.meta["segments"]
+        ]
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.meta["columns"])
+
+    @property
+    def last_key(self) -> int:
+        return self.meta["last_key"]
+
+    def __len__(self) -> int:
+        return sum(len(segment[self.columns[0]]) for segment in self.segments) if self.segments else 0
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        The full column across all segments.
+        """
+        parts = [segment[name] for segment in self.segments]
+        if not parts:
+            return np.array([], dtype=self.meta["columns"][name])
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+
+class ColumnarSnapshotWriter:
+    """
+    Writes typed columnar snapshots of `SNAPSHOT_TABLES` for analytics.
+
+    Layout (one directory per table):
+        <directory>/<Table>/meta.json              columns, dtypes, last key, segments
+        <directory>/<Table>/<segment>/<Column>.npy
+
+    Each call to `snapshot()` appends only rows whose key is greater than the
+    last exported key, as new segments of at most `segment_rows` rows. Rows
+    updated in place (e.g. an order's Status) are only picked up by a rebuild.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, segment_rows: int = 50_000) -> None:
+        """
+        Args:
+            db_path (Optional[str]): Path to the database (config default if omitted).
+            segment_rows (int): Maximum rows per segment (bounds memory while exporting).
+        """
+        self.db = AsyncDatabase(db_path)
+        self.segment_rows = segment_rows
+
+    async def _schema(self, table_name: str) -> Dict[str, str]:
+        rows = await self.db.fetchall(f"PRAGMA table_info({table_name})")
+        # table_info: (cid, name, type, notnull, default, pk)
+        return {row[1]: _column_dtype(row[1], row[2], bool(row[3] or row[5])) for row in rows}
+
+    async def snapshot(self, table_name: str, directory: str, rebuild: bool = False) -> int:
+        """
+        Export new rows of `table_name` into `directory`.
+
+        Args:
+            table_name (str): One of `SNAPSHOT_TABLES`.
+            directory (str): Root snapshot directory.
+            rebuild (bool): Drop the existing snapshot and export everything.
+
+        Returns:
+            int: Number of rows appended.
+        """
+        key = SNAPSHOT_TABLES[table_name]
+        table_dir = os.path.join(directory, table_name)
+        meta_path = os.path.join(table_dir, META_FILE)
+
+        # File I/O runs in worker threads, off the event loop
+        if rebuild:
+            await asyncio.to_thread(shutil.rmtree, table_dir, ignore_errors=True)
+
+        meta = await asyncio.to_thread(_read_meta, meta_path)
+        is_new = meta is None
+        if is_new:
+            meta = {"key": key, "last_key": 0, "columns": await self._schema(table_name), "segments": []}
+
+        columns: Dict[str, str] = meta["columns"]
+        query = f"SELECT {', '.join(columns)} FROM {table_name} WHERE {key} > ? ORDER BY {key}"
+        appended = 0
+
+        async for rows in self.db.iterate_chunks(query, (meta["last_key"],), self.segment_rows):
+            segment = f"{len(meta['segments']):06d}"
+            await asyncio.to_thread(self._write_segment, table_dir, segment, columns, rows)
+
+            meta["segments"].append(segment)
+            meta["last_key"] = rows[-1][list(columns).index(key)]
+            appended += len(rows)
+
+            # Persist after every segment so an interrupted run resumes cleanly
+            await asyncio.to_thread(_write_meta, meta_path, meta)
+
+        if is_new and not appended:
+            await asyncio.to_thread(_write_meta, meta_path, meta)
+
+        return appended
+
+    @staticmethod
+    def _write_segment(table_dir: str, segment: str, columns: Dict[str, str], rows: List[Tuple]) -> None:
+        segment_dir = os.path.join(table_dir, segment)
+        os.makedirs(segment_dir, exist_ok=True)
+        for index, (name, dtype) in enumerate(columns.items()):
+            np.save(os.path.join(segment_dir, f"{name}.npy"), _to_array([row[index] for row in rows], dtype))
+
+    async def snapshot_all(self, directory: str, rebuild: bool = False) -> Dict[str, int]:
+        """
+        Snapshot every table in `SNAPSHOT_TABLES`. Returns rows appended per table.
+        """
+        return {table: await self.snapshot(table, directory, rebuild) for table in SNAPSHOT_TABLES}
+
+
+def load_snapshot(directory: str, table_name: str) -> ColumnarSnapshot:
+    """
+    Memory-map the snapshot of `table_name` stored under `directory`.
+    """
+    return ColumnarSnapshot(os.path.join(directory, table_name))
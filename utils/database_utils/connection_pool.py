@@ -0,0 +1,156 @@
+import asyncio
+import aiosqlite
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
+
+
+# Pragmas applied to every pooled connection
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",      # safe with WAL, avoids an fsync per commit
+    "PRAGMA cache_size = -16000",       # ~16 MB page cache per connection
+    "PRAGMA mmap_size = 268435456",     # 256 MB memory-mapped I/O
+    "PRAGMA busy_timeout = 5000",       # wait up to 5s on locks instead of failing
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+class AsyncConnectionPool:
+    """
+    Shared pool of long-lived aiosqlite connections for one SQLite file.
+
+    The pool keeps a single writer connection (serialised by a lock, since
+    SQLite allows only one writer at a time) and several reader connections
+    handed out through a queue. The database is switched to WAL mode, so
+    readers never block the writer and always see committed data.
+
+    Typical usage:
+        pool = AsyncConnectionPool("database/Service.db", readers=4)
+        await pool.open()
+        async with pool.reader() as conn:
+            ...
+        await pool.close()
+    """
+
+    def __init__(self, db_path: str, readers: int = 4) -> None:
+        """
+        Args:
+            db_path (str): Path to the SQLite database file.
+            readers (int): Number of read-only connections to keep open.
+        """
+        self.db_path = db_path
+        self.readers_count = max(1, readers)
+
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._readers: List[aiosqlite.Connection] = []
+        self._idle_readers: asyncio.Queue = asyncio.Queue()
+        self._write_lock = asyncio.Lock()
+        self._open_lock = asyncio.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._writer is not None
+
+    async def _connect(self) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(self.db_path)
+        for pragma in CONNECTION_PRAGMAS:
+            await self._pragma(conn, pragma)
+        return conn
+
+    @staticmethod
+    async def _pragma(conn: aiosqlite.Connection, pragma: str) -> None:
+        # Close the cursor right away: some pragmas return a row and an
+        # unfinished statement would keep a lock on the database file.
+        async with conn.execute(pragma):
+            pass
+
+    async def open(self) -> None:
+        """
+        Open the writer and reader connections. Safe to call repeatedly.
+        """
+        if self.is_open:
+            return
+
+        async with self._open_lock:
+            if self.is_open:
+                return
+
+            writer = await self._connect()
+            await self._pragma(writer, "PRAGMA journal_mode = WAL")
+
+            for _ in range(self.readers_count):
+                reader = await self._connect()
+                await self._pragma(reader, "PRAGMA query_only = 1")
+                self._readers.append(reader)
+                self._idle_readers.put_nowait(reader)
+
+            self._writer = writer
+
+    async def close(self) -> None:
+        """
+        Close every pooled connection.
+        """
+        async with self._open_lock:
+            if not self.is_open:
+                return
+
+            async with self._write_lock:
+                await self._writer.close()
+                self._writer = None
+
+            for reader in self._readers:
+                await reader.close()
+            self._readers.clear()
+            self._idle_readers = asyncio.Queue()
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Borrow a read-only connection for the duration of the block.
+        """
+        await self.open()
+        conn = await self._idle_readers.get()
+        try:
+            yield conn
+        finally:
+            self._idle_readers.put_nowait(conn)
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Acquire exclusive access to the writer connection.
+        """
+        await self.open()
+        async with self._write_lock:
+            yield self._writer
+
+
+_pools: Dict[str, AsyncConnectionPool] = {}
+
+
+def get_pool(db_path: str, readers: int = 4) -> AsyncConnectionPool:
+    """
+    Return the shared pool for `db_path`, creating it (unopened) if needed.
+    """
+    pool = _pools.get(db_path)
+    if pool is None:
+        pool = AsyncConnectionPool(db_path, readers)
+        _pools[db_path] = pool
+    return pool
+
+
+async def open_pool(db_path: str, readers: int = 4) -> AsyncConnectionPool:
+    """
+    Open the shared pool for `db_path` (call once at startup).
+    """
+    pool = get_pool(db_path, readers)
+    await pool.open()
+    return pool
+
+
+async def close_pools() -> None:
+    """
+    Close every shared pool (call on dispatcher shutdown).
+    """
+    for pool in list(_pools.values()):
+        await pool.close()
+    _pools.clear()
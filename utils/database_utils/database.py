@@ -1,7 +1,10 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Iterable, List, Tuple, Optional
 import aiosqlite
-from typing import Any, List, Tuple, Optional
 from config import get_db_path
-import csv
+from .connection_pool import AsyncConnectionPool, get_pool
+from .batch_loader import get_loader
+from .write_queue import get_write_queue
 
 
 class AsyncDatabase:
@@ -9,9 +12,9 @@ class AsyncDatabase:
     Asynchronous SQLite database helper using aiosqlite.
 
     This base class provides the fundamental CRUD operations and serves as
-    the foundation for table-specific repository classes. It manages opening
-    and closing database connections for each query, ensuring safe and
-    isolated operations in an async environment.
+    the foundation for table-specific repository classes. Queries run on a
+    shared pool of long-lived connections (see `AsyncConnectionPool`): writes
+    go through the single writer connection, reads through pooled readers.
 
     Typical usage:
         db = AsyncDatabase()
@@ -29,22 +32,76 @@ class AsyncDatabase:
         """
         self.db_path = db_path or get_db_path()
 
-    async def execute(self, query: str, params: Tuple = ()) -> None:
+    @property
+    def pool(self) -> AsyncConnectionPool:
+        """
+        Shared connection pool for this database file.
+        """
+        return get_pool(self.db_path)
+
+    async def execute(self, query: str, params: Tuple = ()) -> Optional[int]:
         """
         Execute a write/query command such as INSERT, UPDATE, DELETE, or CREATE.
 
-        Opens a new connection, executes the statement, and commits changes.
+        If a write queue is running for this database (see `start_write_queue`),
+        the statement is group-committed with other pending writes; otherwise it
+        runs on the pooled writer connection and commits on its own. Either way
+        the change is committed when this returns. On failure the statement is
+        rolled back and the error is raised to the caller.
 
         Args:
             query (str): SQL query string.
             params (tuple): Parameters for the SQL query (default: empty tuple).
 
         Returns:
-            None
+            Optional[int]: `lastrowid` of the statement (id of an inserted row).
+        """
+        queue = get_write_queue(self.db_path)
+        if queue is not None:
+            return await queue.submit(query, params)
+
+        async with self.pool.writer() as db:
+            try:
+                cursor = await db.execute(query, params)
+                await db.commit()
+                return cursor.lastrowid
+            except Exception:
+                await db.rollback()
+                raise
+
+    @asynccontextmanager
+    async def transaction(self, script: str = "") -> AsyncIterator[aiosqlite.Connection]:
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(query, params)
-            await db.commit()
+        Hold the writer connection inside one transaction.
+
+        `script` (any number of statements) runs first, then the block uses the
+        yielded connection. Everything is committed when the block exits and
+        rolled back if the script or the block raises.
+
+        Args:
+            script (str): SQL script to run at the start of the transaction.
+
+        Yields:
+            aiosqlite.Connection: The writer connection.
+        """
+        async with self.pool.writer() as conn:
+            try:
+                await conn.executescript(f"BEGIN;\n{script}")
+                yield conn
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+
+    async def run_script_in_transaction(self, script: str) -> None:
+        """
+        Run an SQL script atomically: all of its statements or none.
+
+        Args:
+            script (str): SQL script, e.g. a rebuild of a derived table.
+        """
+        async with self.transaction(script):
+            pass
 
     async def fetchone(self, query: str, params: Tuple = ()) -> Optional[Tuple[Any]]:
         """
@@ -57,7 +114,7 @@ class AsyncDatabase:
         Returns:
             Optional[Tuple]: The first row found, or None if no results.
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.reader() as db:
             async with db.execute(query, params) as cursor:
                 return await cursor.fetchone()
 
@@ -72,10 +129,56 @@ class AsyncDatabase:
         Returns:
             list[Tuple]: All returned rows.
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self.pool.reader() as db:
             async with db.execute(query, params) as cursor:
                 return await cursor.fetchall()
 
+    async def iterate_chunks(
+        self,
+        query: str,
+        params: Tuple = (),
+        chunk_size: int = 500
+    ) -> AsyncIterator[List[Tuple[Any]]]:
+        """
+        Execute a SELECT query and yield its rows in `fetchmany` chunks.
+
+        A pooled reader connection is held until the generator finishes, so
+        memory stays flat whatever the result size. If you may stop early, wrap
+        the generator in `contextlib.aclosing` so the connection is returned
+        right away.
+
+        Args:
+            query (str): SQL SELECT statement.
+            params (tuple): Query parameters.
+            chunk_size (int): Rows fetched per round trip.
+
+        Yields:
+            list[Tuple]: Up to `chunk_size` rows.
+        """
+        async with self.pool.reader() as db:
+            async with db.execute(query, params) as cursor:
+                while True:
+                    rows = await cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    yield rows
+
+    async def iterate(self, query: str, params: Tuple = (), chunk_size: int = 500) -> AsyncIterator[Tuple[Any]]:
+        """
+        Execute a SELECT query and yield rows one by one, fetched in chunks.
+
+        Args:
+            query (str): SQL SELECT statement.
+            params (tuple): Query parameters.
+            chunk_size (int): Rows fetched per round trip.
+
+        Yields:
+            Tuple: One row.
+        """
+        async for rows in self.iterate_chunks(query, params, chunk_size):
+            for row in rows:
+                yield row
+
     # ---- Helper Methods ----
 
     async def get_table(self, table_name: str) -> List[Tuple[Any]]:
@@ -90,6 +193,25 @@ class AsyncDatabase:
         """
         return await self.fetchall(f"SELECT * FROM {table_name}")
 
+    def iter_table(self, table_name: str, chunk_size: int = 500) -> AsyncIterator[Tuple[Any]]:
+        """
+        Stream all rows from a table without loading them into a list.
+
+        Args:
+            table_name (str): Name of the table.
+            chunk_size (int): Rows fetched per round trip.
+
+        Returns:
+            AsyncIterator[Tuple]: Rows of the table.
+        """
+        return self.iterate(f"SELECT * FROM {table_name}", chunk_size=chunk_size)
+
+    async def get_columns(self, table_name: str) -> List[str]:
+        """
+        Column names of a table, in declaration order.
+        """
+        return [row[1] for row in await self.fetchall(f"PRAGMA table_info({table_name})")]
+
     async def get_row(self, table_name: str, condition: str, params: Tuple = ()) -> Optional[Tuple[Any]]:
         """
         Retrieve a single row matching the SQL condition.
@@ -105,7 +227,62 @@ class AsyncDatabase:
         query = f"SELECT * FROM {table_name} WHERE {condition}"
         return await self.fetchone(query, params)
 
-    async def insert(self, table_name: str, columns: list[str], values: Tuple) -> None:
+    async def get_rows_by_ids(
+        self,
+        table_name: str,
+        id_column: str,
+        ids: Iterable[Any],
+        chunk_size: int = 500
+    ) -> List[Tuple[Any]]:
+        """
+        Retrieve the rows whose `id_column` is in `ids` using chunked IN (...) queries.
+
+        Duplicate ids are dropped, and each chunk stays below SQLite's limit on
+        bound parameters.
+
+        Args:
+            table_name (str): Table to query.
+            id_column (str): Column the ids refer to, e.g. "User_Id".
+            ids (Iterable): Ids to look up.
+            chunk_size (int): Maximum number of ids per query.
+
+        Returns:
+            list[Tuple]: Matching rows, in no particular order.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        rows: List[Tuple[Any]] = []
+
+        for start in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[start:start + chunk_size]
+            placeholders = ", ".join("?" for _ in chunk)
+            query = f"SELECT * FROM {table_name} WHERE {id_column} IN ({placeholders})"
+            rows.extend(await self.fetchall(query, tuple(chunk)))
+
+        return rows
+
+    async def load_row(self, table_name: str, id_column: str, row_id: Any) -> Optional[Tuple[Any]]:
+        """
+        Retrieve a single row by id through the shared batch loader.
+
+        Concurrent `load_row` calls for the same table made within one
+        event-loop tick are merged into a single `WHERE id IN (...)` query.
+
+        Args:
+            table_name (str): Table to query.
+            id_column (str): Primary key column, e.g. "PC_Id".
+            row_id (Any): Id to look up.
+
+        Returns:
+            Optional[Tuple]: The row found, or None.
+        """
+        async def fetch_batch(ids: List[Any]) -> dict:
+            rows = await self.get_rows_by_ids(table_name, id_column, ids)
+            return {row[0]: row for row in rows}
+
+        loader = get_loader((self.db_path, table_name), fetch_batch, label=f"{table_name} loader")
+        return await loader.load(row_id)
+
+    async def insert(self, table_name: str, columns: list[str], values: Tuple) -> Optional[int]:
         """
         Insert a new row into a table.
 
@@ -115,12 +292,12 @@ class AsyncDatabase:
             values (tuple): Values matching the given columns.
 
         Returns:
-            None
+            Optional[int]: Rowid of the inserted row.
         """
         cols = ", ".join(columns)
         placeholders = ", ".join("?" for _ in columns)
         query = f"INSERT INTO {table_name} ({cols}) VALUES ({placeholders})"
-        await self.execute(query, values)
+        return await self.execute(query, values)
 
     async def update(self, table_name: str, updates: str, condition: str, params: Tuple = ()) -> None:
         """
@@ -153,27 +330,22 @@ class AsyncDatabase:
         query = f"DELETE FROM {table_name} WHERE {condition}"
         await self.execute(query, params)
 
-    async def export_table_to_csv(self, table_name: str, csv_path: str) -> str:
+    async def export_table_to_csv(self, table_name: str, csv_path: str, chunk_size: int = 1000) -> str:
         """
         Export an entire table to a CSV file.
 
+        Rows are streamed in chunks and written from a worker thread (see
+        `TableExporter`), so neither memory nor the event loop is tied up by
+        large tables.
+
         Args:
             table_name (str): Name of the table to export.
             csv_path (str): File path where CSV will be saved.
+            chunk_size (int): Rows fetched and written per round trip.
 
         Returns:
             str: The file path to the created CSV.
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(f"SELECT * FROM {table_name}")
-            rows = await cursor.fetchall()
-            col_names = [description[0] for description in cursor.description]
-            await cursor.close()
-
-        # Write the CSV file
-        with open(csv_path, "w", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file)
-            writer.writerow(col_names)
-            writer.writerows(rows)
+        from .table_export import TableExporter
 
-        return csv_path
\ No newline at end of file
+        return await TableExporter(self.db_path, chunk_size).export_table(table_name, csv_path)
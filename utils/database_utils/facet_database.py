@@ -0,0 +1,360 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from utils.database_utils import AsyncDatabase
+from .listing_database import AsyncListingsRepository
+from .row_cache import WriteListener, row_cache
+
+
+# Price ranges on Listings.Added_Price: (label, lower bound inclusive, upper bound exclusive)
+PRICE_BUCKETS: List[Tuple[str, float, Optional[float]]] = [
+    ("< $100", 0, 100),
+    ("$100-300", 100, 300),
+    ("$300-700", 300, 700),
+    ("$700-1500", 700, 1500),
+    ("$1500+", 1500, None),
+]
+
+
+def price_bucket_sql(column: str = "Added_Price") -> str:
+    """
+    SQL expression mapping a price column to its index in `PRICE_BUCKETS`.
+
+    Migration 5 indexes exactly this expression, so filtered queries must use
+    it verbatim (with the same `column`) to be served by the index.
+    """
+    cases = " ".join(
+        f"WHEN {column} < {upper} THEN {index}"
+        for index, (_, _, upper) in enumerate(PRICE_BUCKETS) if upper is not None
+    )
+    return f"(CASE {cases} ELSE {len(PRICE_BUCKETS) - 1} END)"
+
+
+def facet_code(value: str) -> str:
+    """
+    Short fixed-size code of a facet value for callback data ('' stays '').
+
+    Conditions and part types are free-form strings that may contain ':' or
+    overflow Telegram's 64-byte callback data; their 8-character codes do not.
+    """
+    if not value:
+        return ""
+    return hashlib.blake2b(value.encode(), digest_size=4).hexdigest()
+
+
+# Facet values of a listing `X` (a NEW/OLD row or an alias), '' when unknown
+def _condition_sql(x: str) -> str:
+    return (
+        f"COALESCE(CASE {x}.Item_Type "
+        f"WHEN 'PC' THEN (SELECT Condition FROM PCs WHERE PC_Id = {x}.Item_Id) "
+        f"WHEN 'Laptop' THEN (SELECT Condition FROM Laptops WHERE Laptop_Id = {x}.Item_Id) "
+        f"ELSE (SELECT Condition FROM Parts WHERE Part_Id = {x}.Item_Id) END, '')"
+    )
+
+
+def _part_type_sql(x: str) -> str:
+    return (
+        f"CASE WHEN {x}.Item_Type = 'Part' "
+        f"THEN COALESCE((SELECT Type FROM Parts WHERE Part_Id = {x}.Item_Id), '') ELSE '' END"
+    )
+
+
+def _add_listing_sql(x: str) -> str:
+    return f"""
+            INSERT INTO Listing_Facets (Item_Type, Condition, Part_Type, Price_Bucket, Listings)
+            VALUES ({x}.Item_Type, {_condition_sql(x)}, {_part_type_sql(x)}, {price_bucket_sql(f"{x}.Added_Price")}, 1)
+            ON CONFLICT (Item_Type, Condition, Part_Type, Price_Bucket) DO UPDATE SET Listings = Listings + 1;"""
+
+
+def _remove_listing_sql(x: str) -> str:
+    key = (
+        f"Item_Type = {x}.Item_Type AND Condition = {_condition_sql(x)} "
+        f"AND Part_Type = {_part_type_sql(x)} AND Price_Bucket = {price_bucket_sql(f'{x}.Added_Price')}"
+    )
+    return f"""
+            UPDATE Listing_Facets SET Listings = Listings - 1 WHERE {key};
+            DELETE FROM Listing_Facets WHERE Listings <= 0 AND {key};"""
+
+
+def _move_item_sql(item_type: str, id_column: str, old: Tuple[str, str], new: Tuple[str, str]) -> str:
+    """
+    Move every listing of one item from facet (old condition, old part type)
+    to (new condition, new part type), bucket by bucket.
+    """
+    bucket = price_bucket_sql("l.Added_Price")
+    listings_of_item = f"Listings l WHERE l.Item_Type = '{item_type}' AND l.Item_Id = {id_column}"
+    return f"""
+            UPDATE Listing_Facets SET Listings = Listings - (
+                SELECT COUNT(*) FROM {listings_of_item} AND {bucket} = Listing_Facets.Price_Bucket
+            )
+            WHERE Item_Type = '{item_type}' AND Condition = {old[0]} AND Part_Type = {old[1]};
+            DELETE FROM Listing_Facets WHERE Listings <= 0;
+            INSERT INTO Listing_Facets (Item_Type, Condition, Part_Type, Price_Bucket, Listings)
+            SELECT '{item_type}', {new[0]}, {new[1]}, {bucket}, COUNT(*) FROM {listings_of_item}
+            GROUP BY 4
+            ON CONFLICT (Item_Type, Condition, Part_Type, Price_Bucket) DO UPDATE SET
+                Listings = Listings + excluded.Listings;"""
+
+
+def _item_triggers(table: str, item_type: str, id_column: str, facet_columns: str) -> str:
+    has_type = item_type == "Part"
+    part_type = (lambda row: f"COALESCE({row}.Type, '')") if has_type else (lambda row: "''")
+
+    def values(row: Optional[str]) -> Tuple[str, str]:
+        if row is None:  # the item does not exist
+            return "''", "''"
+        return f"COALESCE({row}.Condition, '')", part_type(row)
+
+    name = table.lower()
+    return f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{name}_facets_insert AFTER INSERT ON {table}
+        BEGIN{_move_item_sql(item_type, f"NEW.{id_column}", values(None), values("NEW"))}
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_{name}_facets_delete AFTER DELETE ON {table}
+        BEGIN{_move_item_sql(item_type, f"OLD.{id_column}", values("OLD"), values(None))}
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_{name}_facets_update AFTER UPDATE OF {facet_columns} ON {table}
+        BEGIN{_move_item_sql(item_type, f"OLD.{id_column}", values("OLD"), values(None))}{
+            _move_item_sql(item_type, f"NEW.{id_column}", values(None), values("NEW"))}
+        END;
+"""
+
+
+# Summary table, triggers and composite indexes of migration 5
+FACETS_SCHEMA_SCRIPT = f"""
+        CREATE TABLE IF NOT EXISTS Listing_Facets (
+            Item_Type    TEXT    NOT NULL,
+            Condition    TEXT    NOT NULL,
+            Part_Type    TEXT    NOT NULL,
+            Price_Bucket INTEGER NOT NULL,
+            Listings     INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (Item_Type, Condition, Part_Type, Price_Bucket)
+        ) WITHOUT ROWID;
+
+        CREATE TRIGGER IF NOT EXISTS trg_listings_facets_insert AFTER INSERT ON Listings
+        BEGIN{_add_listing_sql("NEW")}
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_listings_facets_delete AFTER DELETE ON Listings
+        BEGIN{_remove_listing_sql("OLD")}
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_listings_facets_update
+        AFTER UPDATE OF Item_Type, Item_Id, Added_Price ON Listings
+        BEGIN{_remove_listing_sql("OLD")}{_add_listing_sql("NEW")}
+        END;
+{_item_triggers("PCs", "PC", "PC_Id", "PC_Id, Condition")}
+{_item_triggers("Laptops", "Laptop", "Laptop_Id", "Laptop_Id, Condition")}
+{_item_triggers("Parts", "Part", "Part_Id", "Part_Id, Condition, Type")}
+        -- Filtered catalog pages: equality on type / price bucket, keyset on Listing_Id
+        CREATE INDEX IF NOT EXISTS idx_listings_type_bucket
+            ON Listings (Item_Type, {price_bucket_sql()}, Listing_Id);
+        CREATE INDEX IF NOT EXISTS idx_listings_bucket
+            ON Listings ({price_bucket_sql()}, Listing_Id);
+        CREATE INDEX IF NOT EXISTS idx_parts_type_condition ON Parts (Type, Condition);
+"""
+
+
+@dataclass(frozen=True)
+class CatalogFilters:
+    """
+    Facet selection of the catalog; empty / None fields are not filtered.
+
+    Attributes:
+        item_type (str): 'PC', 'Laptop' or 'Part'.
+        condition (str): Condition of the listed item.
+        part_type (str): `Parts.Type` (implies item_type 'Part').
+        price_bucket (Optional[int]): Index into `PRICE_BUCKETS`.
+    """
+    item_type: str = ""
+    condition: str = ""
+    part_type: str = ""
+    price_bucket: Optional[int] = None
+
+    def matches(self, item_type: str, condition: str, part_type: str, price_bucket: int, skip: str = "") -> bool:
+        """
+        Whether a facet combination passes every filter except the `skip` facet.
+        """
+        return (
+            (skip == "item_type" or not self.item_type or self.item_type == item_type)
+            and (skip == "condition" or not self.condition or self.condition == condition)
+            and (skip == "part_type" or not self.part_type or self.part_type == part_type)
+            and (skip == "price_bucket" or self.price_bucket is None or self.price_bucket == price_bucket)
+        )
+
+    def codes(self) -> Dict[str, Any]:
+        """
+        Callback data fields of this selection, with `facet_code`s for condition and part type.
+        """
+        return {
+            "item_type": self.item_type,
+            "condition": facet_code(self.condition),
+            "part_type": facet_code(self.part_type),
+            "price_bucket": self.price_bucket,
+        }
+
+
+class AsyncFacetsRepository(AsyncDatabase):
+    """
+    Faceted catalog filtering backed by the `Listing_Facets` summary table.
+
+    `Listing_Facets` holds one row per (Item_Type, Condition, Part_Type,
+    Price_Bucket) combination with its number of listings. Triggers on
+    Listings, PCs, Laptops and Parts keep it exact (see migration 5), and the
+    few hundred combinations are cached in memory until the next write, so
+    facet counts for any selection are computed without touching Listings.
+    """
+
+    FACETS = ("item_type", "condition", "part_type", "price_bucket")
+
+    # Re-counts every facet combination (also the backfill of migration 5)
+    FACETS_REBUILD_SCRIPT = f"""
+        DELETE FROM Listing_Facets;
+        INSERT INTO Listing_Facets (Item_Type, Condition, Part_Type, Price_Bucket, Listings)
+        SELECT l.Item_Type, {_condition_sql("l")}, {_part_type_sql("l")}, {price_bucket_sql("l.Added_Price")}, COUNT(*)
+        FROM Listings l
+        GROUP BY 1, 2, 3, 4;
+    """
+
+    # Facet rows per db_path, dropped on every write to the tables they depend on
+    _combinations: Dict[str, List[Tuple[str, str, str, int, int]]] = {}
+
+    @classmethod
+    def _invalidate(cls, *_: Any) -> None:
+        cls._combinations.clear()
+
+    async def get_combinations(self) -> List[Tuple[str, str, str, int, int]]:
+        """
+        All facet combinations with their listing counts.
+
+        Returns:
+            List[Tuple]: (Item_Type, Condition, Part_Type, Price_Bucket, Listings) rows.
+        """
+        combinations = self._combinations.get(self.db_path)
+        if combinations is None:
+            combinations = await self.fetchall(
+                "SELECT Item_Type, Condition, Part_Type, Price_Bucket, Listings FROM Listing_Facets"
+            )
+            self._combinations[self.db_path] = combinations
+        return combinations
+
+    async def decode_filters(
+        self,
+        item_type: str = "",
+        condition: str = "",
+        part_type: str = "",
+        price_bucket: Optional[int] = None
+    ) -> CatalogFilters:
+        """
+        Filters of callback data packed by `CatalogFilters.codes`.
+
+        Codes are looked up among the cached facet values; a code whose value
+        no longer has listings is dropped (not filtered).
+        """
+        values: Dict[str, str] = {}
+        for _, row_condition, row_part_type, _, _ in await self.get_combinations():
+            values[facet_code(row_condition)] = row_condition
+            values[facet_code(row_part_type)] = row_part_type
+        return CatalogFilters(item_type, values.get(condition, ""), values.get(part_type, ""), price_bucket)
+
+    async def get_facet_counts(self, filters: CatalogFilters) -> Dict[str, Dict[Any, int]]:
+        """
+        Listing counts per value of every facet, given the other active filters.
+
+        The count of a value is the number of results the catalog would show
+        if that value were selected for its facet (other selections unchanged).
+
+        Returns:
+            Dict[str, Dict[Any, int]]: facet name -> {value: count}; values
+            with no listings are omitted.
+        """
+        counts: Dict[str, Dict[Any, int]] = {facet: {} for facet in self.FACETS}
+
+        for combination in await self.get_combinations():
+            *values, listings = combination
+            for facet, value in zip(self.FACETS, values):
+                if value == "" or not filters.matches(*values, skip=facet):
+                    continue
+                counts[facet][value] = counts[facet].get(value, 0) + listings
+
+        return counts
+
+    async def count_listings(self, filters: CatalogFilters) -> int:
+        """
+        Number of listings matching every filter.
+        """
+        return sum(row[-1] for row in await self.get_combinations() if filters.matches(*row[:-1]))
+
+    async def get_filtered_page(
+        self,
+        filters: CatalogFilters,
+        after_id: int = 0,
+        limit: int = 10,
+        before_id: Optional[int] = None
+    ) -> List[Tuple[Any]]:
+        """
+        One keyset-paginated catalog page restricted to `filters`.
+
+        Rows have the shape of `AsyncListingsRepository.get_catalog`. Type and
+        price filters seek through `idx_listings_type_bucket` /
+        `idx_listings_bucket`; condition and part type are checked on the
+        joined item row.
+
+        Args:
+            filters (CatalogFilters): Active facet selection.
+            after_id (int): Return listings with Listing_Id greater than this (next page).
+            limit (int): Maximum number of rows.
+            before_id (Optional[int]): If given, return the listings right before
+                this id instead (previous page); `after_id` is ignored.
+
+        Returns:
+            List[Tuple]: Catalog rows in ascending Listing_Id order.
+        """
+        conditions = []
+        params: List[Any] = []
+
+        item_type = "Part" if filters.part_type else filters.item_type
+        if item_type:
+            conditions.append("l.Item_Type = ?")
+            params.append(item_type)
+        if filters.price_bucket is not None:
+            conditions.append(f"{price_bucket_sql('l.Added_Price')} = ?")
+            params.append(filters.price_bucket)
+        if filters.condition:
+            conditions.append("COALESCE(pc.Condition, lp.Condition, p.Condition) = ?")
+            params.append(filters.condition)
+        if filters.part_type:
+            conditions.append("p.Type = ?")
+            params.append(filters.part_type)
+
+        if before_id is not None:
+            conditions.append("l.Listing_Id < ?")
+            params.append(before_id)
+            order = "DESC"
+        else:
+            conditions.append("l.Listing_Id > ?")
+            params.append(after_id)
+            order = "ASC"
+
+        params.append(limit)
+        query = (
+            f"{AsyncListingsRepository.CATALOG_QUERY} WHERE {' AND '.join(conditions)} "
+            f"ORDER BY l.Listing_Id {order} LIMIT ?"
+        )
+        rows = await self.fetchall(query, tuple(params))
+
+        return rows[::-1] if before_id is not None else rows
+
+    async def rebuild_facets(self) -> None:
+        """
+        Recompute `Listing_Facets` from scratch (e.g. after a bulk import with triggers off).
+        """
+        await self.run_script_in_transaction(self.FACETS_REBUILD_SCRIPT)
+        self._invalidate()
+
+
+_on_write: WriteListener = AsyncFacetsRepository._invalidate
+for _table in ("Listings", "PCs", "Laptops", "Parts"):
+    row_cache.subscribe(_table, _on_write)
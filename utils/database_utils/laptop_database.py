@@ -1,5 +1,6 @@
 from typing import Optional, Tuple, List, Any
 from utils.database_utils import AsyncDatabase
+from .row_cache import cached, invalidates
 
 
 class AsyncLaptopsRepository(AsyncDatabase):
@@ -14,6 +15,7 @@ class AsyncLaptopsRepository(AsyncDatabase):
 
     # ----------------- Getters -----------------
 
+    @cached("Laptops")
     async def get_laptop(self, laptop_id: int) -> Optional[Tuple]:
         """
         Retrieve a single laptop by ID.
@@ -24,7 +26,7 @@ class AsyncLaptopsRepository(AsyncDatabase):
         Returns:
             Optional[Tuple]: Laptop row or None if not found.
         """
-        return await self.get_row(self.TABLE, "Laptop_Id = ?", (laptop_id,))
+        return await self.load_row(self.TABLE, "Laptop_Id", laptop_id)
 
     async def get_all_laptops(self) -> List[Tuple[Any]]:
         """
@@ -37,6 +39,7 @@ class AsyncLaptopsRepository(AsyncDatabase):
 
     # ----------------- Insert / Update / Delete -----------------
 
+    @invalidates("Laptops", by_id=False)
     async def add_laptop(
         self,
         title: str,
@@ -57,7 +60,7 @@ class AsyncLaptopsRepository(AsyncDatabase):
         description: Optional[str] = None,
         notes: Optional[str] = None,
         condition: str = "Used"
-    ) -> None:
+    ) -> Optional[int]:
         """
     Insert a new laptop into the database.
 
@@ -82,7 +85,7 @@ class AsyncLaptopsRepository(AsyncDatabase):
         condition (str): Condition of the laptop. One of 'New', 'Used', 'Open-Box', 'For-Parts'.
 
     Returns:
-        None
+        Optional[int]: Laptop_Id of the new laptop.
     """
 
         columns = [
@@ -98,8 +101,9 @@ class AsyncLaptopsRepository(AsyncDatabase):
             photo_url, description, notes, condition
         )
 
-        await self.insert(self.TABLE, columns, values)
+        return await self.insert(self.TABLE, columns, values)
 
+    @invalidates("Laptops")
     async def update_laptop(
         self,
         laptop_id: int,
@@ -119,6 +123,7 @@ class AsyncLaptopsRepository(AsyncDatabase):
         """
         await self.update(self.TABLE, updates, "Laptop_Id = ?", params)
 
+    @invalidates("Laptops")
     async def remove_laptop(self, laptop_id: int) -> None:
         """
         Delete a laptop by ID.
@@ -1,5 +1,6 @@
 from utils.database_utils import AsyncDatabase
-from typing import Optional, Tuple, List, Any
+from .row_cache import cached, invalidates
+from typing import AsyncIterator, Optional, Tuple, List, Any
 
 
 class AsyncListingsRepository(AsyncDatabase):
@@ -12,11 +13,30 @@ class AsyncListingsRepository(AsyncDatabase):
 
     TABLE = "Listings"
 
+    # Listing columns joined to the title of the PC, Laptop or Part they point at.
+    # Each LEFT JOIN only matches for its own Item_Type, so every listing costs
+    # at most one primary-key lookup and the whole catalog is a single query.
+    CATALOG_QUERY = """
+        SELECT
+            l.Listing_Id, l.Item_Type, l.Item_Id, l.Added_Price,
+            l.Real_Price, l.Notes, l.Created_At,
+            CASE l.Item_Type
+                WHEN 'PC' THEN pc.Title
+                WHEN 'Laptop' THEN lp.Title
+                WHEN 'Part' THEN p.Title
+            END AS Title
+        FROM Listings l
+        LEFT JOIN PCs pc ON l.Item_Type = 'PC' AND pc.PC_Id = l.Item_Id
+        LEFT JOIN Laptops lp ON l.Item_Type = 'Laptop' AND lp.Laptop_Id = l.Item_Id
+        LEFT JOIN Parts p ON l.Item_Type = 'Part' AND p.Part_Id = l.Item_Id
+    """
+
+    @cached("Listings")
     async def get_listing(self, listing_id: int) -> Optional[Tuple]:
         """
         Retrieve a single listing by Listing_Id.
         """
-        return await self.get_row(self.TABLE, "Listing_Id = ?", (listing_id,))
+        return await self.load_row(self.TABLE, "Listing_Id", listing_id)
 
     async def get_all_listings(self) -> List[Tuple[Any]]:
         """
@@ -24,12 +44,93 @@ class AsyncListingsRepository(AsyncDatabase):
         """
         return await self.get_table(self.TABLE)
 
+    def iter_all_listings(self, chunk_size: int = 500) -> AsyncIterator[Tuple[Any]]:
+        """
+        Stream all listings without loading them into a list.
+        """
+        return self.iter_table(self.TABLE, chunk_size)
+
     async def get_listings_by_type(self, item_type: str) -> List[Tuple[Any]]:
         """
         Retrieve all listings of a specific type (PC, Laptop, Part).
         """
         return await self.fetchall(f"SELECT * FROM {self.TABLE} WHERE Item_Type = ?", (item_type,))
 
+    def _catalog_query(self, item_type: Optional[str]) -> Tuple[str, Tuple]:
+        if item_type:
+            return f"{self.CATALOG_QUERY} WHERE l.Item_Type = ? ORDER BY l.Listing_Id", (item_type,)
+        return f"{self.CATALOG_QUERY} ORDER BY l.Listing_Id", ()
+
+    async def get_catalog(self, item_type: Optional[str] = None) -> List[Tuple[Any]]:
+        """
+        Retrieve listings joined to their item titles in one query.
+
+        Args:
+            item_type (Optional[str]): Filter by 'PC', 'Laptop', or 'Part'. Fetch all if None.
+
+        Returns:
+            List[Tuple]: Listing rows with the item Title appended as the last column
+            (None if the referenced item no longer exists).
+        """
+        return await self.fetchall(*self._catalog_query(item_type))
+
+    def iter_catalog(self, item_type: Optional[str] = None, chunk_size: int = 500) -> AsyncIterator[Tuple[Any]]:
+        """
+        Stream the rows of `get_catalog` without loading them into a list.
+        """
+        query, params = self._catalog_query(item_type)
+        return self.iterate(query, params, chunk_size)
+
+    async def get_listings_page(
+        self,
+        after_id: int = 0,
+        limit: int = 10,
+        item_type: Optional[str] = None,
+        before_id: Optional[int] = None
+    ) -> List[Tuple[Any]]:
+        """
+        Retrieve one page of the catalog using keyset pagination on Listing_Id.
+
+        Rows have the same shape as `get_catalog`. Only the requested rows are
+        read, whatever the page number, because the query seeks straight to
+        the cursor through the primary key (or the Item_Type index).
+
+        Args:
+            after_id (int): Return listings with Listing_Id greater than this (next page).
+            limit (int): Maximum number of rows.
+            item_type (Optional[str]): Filter by 'PC', 'Laptop', or 'Part'.
+            before_id (Optional[int]): If given, return the listings right before
+                this id instead (previous page); `after_id` is ignored.
+
+        Returns:
+            List[Tuple]: Catalog rows in ascending Listing_Id order.
+        """
+        conditions = []
+        params: List[Any] = []
+
+        if item_type:
+            conditions.append("l.Item_Type = ?")
+            params.append(item_type)
+
+        if before_id is not None:
+            conditions.append("l.Listing_Id < ?")
+            params.append(before_id)
+            order = "DESC"
+        else:
+            conditions.append("l.Listing_Id > ?")
+            params.append(after_id)
+            order = "ASC"
+
+        params.append(limit)
+        query = (
+            f"{self.CATALOG_QUERY} WHERE {' AND '.join(conditions)} "
+            f"ORDER BY l.Listing_Id {order} LIMIT ?"
+        )
+        rows = await self.fetchall(query, tuple(params))
+
+        return rows[::-1] if before_id is not None else rows
+
+    @invalidates("Listings", by_id=False)
     async def add_listing(
         self,
         item_type: str,
@@ -37,22 +138,24 @@ class AsyncListingsRepository(AsyncDatabase):
         added_price: float = 0,
         real_price: float = 0,
         notes: Optional[str] = None
-    ) -> None:
+    ) -> Optional[int]:
         """
-        Add a new listing to the database.
+        Add a new listing to the database and return its Listing_Id.
         """
-        await self.insert(
+        return await self.insert(
             self.TABLE,
             ["Item_Type", "Item_Id", "Added_Price", "Real_Price", "Notes"],
             (item_type, item_id, added_price, real_price, notes)
         )
 
+    @invalidates("Listings")
     async def remove_listing(self, listing_id: int) -> None:
         """
         Remove a listing by its Listing_Id.
         """
         await self.delete(self.TABLE, "Listing_Id = ?", (listing_id,))
 
+    @invalidates("Listings")
     async def update_listing(
         self,
         listing_id: int,
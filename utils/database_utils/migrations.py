@@ -0,0 +1,345 @@
+import logging
+from dataclasses import dataclass
+from typing import List, Optional
+from .database import AsyncDatabase
+from .report_database import AsyncReportsRepository
+from .search_database import AsyncSearchRepository
+from .facet_database import AsyncFacetsRepository, FACETS_SCHEMA_SCRIPT
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    One versioned schema change.
+
+    Attributes:
+        version (int): Strictly increasing version number.
+        description (str): Short human-readable summary.
+        script (str): SQL statements applied in a single transaction.
+    """
+    version: int
+    description: str
+    script: str
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(
+        1,
+        "Hot-path secondary indexes",
+        """
+        CREATE INDEX IF NOT EXISTS idx_listings_type ON Listings (Item_Type, Listing_Id);
+        CREATE INDEX IF NOT EXISTS idx_orders_user ON Orders (User_Id, Order_Id);
+        CREATE INDEX IF NOT EXISTS idx_bids_user ON Bids (User_Id);
+        CREATE INDEX IF NOT EXISTS idx_bids_item ON Bids (Item_Id);
+        CREATE INDEX IF NOT EXISTS idx_parts_type ON Parts (Type);
+        CREATE INDEX IF NOT EXISTS idx_admins_admin_id ON Admins (Admin_Id);
+        """
+    ),
+    Migration(
+        2,
+        "Covering index for listing lookups by item",
+        """
+        CREATE INDEX IF NOT EXISTS idx_listings_item ON Listings (Item_Type, Item_Id);
+        """
+    ),
+    Migration(
+        3,
+        "Sales and bid rollup tables maintained by triggers",
+        f"""
+        CREATE TABLE IF NOT EXISTS Orders_Daily_Rollup (
+            Day      TEXT    NOT NULL,
+            Status   TEXT    NOT NULL,
+            Orders   INTEGER NOT NULL DEFAULT 0,
+            Quantity INTEGER NOT NULL DEFAULT 0,
+            Revenue  REAL    NOT NULL DEFAULT 0,
+            Profit   REAL    NOT NULL DEFAULT 0,
+            PRIMARY KEY (Day, Status)
+        ) WITHOUT ROWID;
+
+        CREATE TABLE IF NOT EXISTS Orders_Buyer_Rollup (
+            User_Id  INTEGER NOT NULL,
+            Status   TEXT    NOT NULL,
+            Orders   INTEGER NOT NULL DEFAULT 0,
+            Quantity INTEGER NOT NULL DEFAULT 0,
+            Revenue  REAL    NOT NULL DEFAULT 0,
+            Profit   REAL    NOT NULL DEFAULT 0,
+            PRIMARY KEY (User_Id, Status)
+        ) WITHOUT ROWID;
+
+        CREATE TABLE IF NOT EXISTS Bids_Daily_Rollup (
+            Day           TEXT    NOT NULL,
+            Status        TEXT    NOT NULL,
+            Bids          INTEGER NOT NULL DEFAULT 0,
+            Offered_Total REAL    NOT NULL DEFAULT 0,
+            PRIMARY KEY (Day, Status)
+        ) WITHOUT ROWID;
+
+        -- Orders without a Created_At are rolled up under Day = ''
+
+        CREATE TRIGGER IF NOT EXISTS trg_orders_rollup_insert AFTER INSERT ON Orders
+        BEGIN
+            INSERT INTO Orders_Daily_Rollup (Day, Status, Orders, Quantity, Revenue, Profit)
+            VALUES (COALESCE(date(NEW.Created_At), ''), NEW.Status, 1,
+                    NEW.Quantity, NEW.Total_Price, COALESCE(NEW.Profit, 0))
+            ON CONFLICT (Day, Status) DO UPDATE SET
+                Orders = Orders + 1,
+                Quantity = Quantity + excluded.Quantity,
+                Revenue = Revenue + excluded.Revenue,
+                Profit = Profit + excluded.Profit;
+
+            INSERT INTO Orders_Buyer_Rollup (User_Id, Status, Orders, Quantity, Revenue, Profit)
+            VALUES (NEW.User_Id, NEW.Status, 1, NEW.Quantity, NEW.Total_Price, COALESCE(NEW.Profit, 0))
+            ON CONFLICT (User_Id, Status) DO UPDATE SET
+                Orders = Orders + 1,
+                Quantity = Quantity + excluded.Quantity,
+                Revenue = Revenue + excluded.Revenue,
+                Profit = Profit + excluded.Profit;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_orders_rollup_delete AFTER DELETE ON Orders
+        BEGIN
+            UPDATE Orders_Daily_Rollup SET
+                Orders = Orders - 1,
+                Quantity = Quantity - OLD.Quantity,
+                Revenue = Revenue - OLD.Total_Price,
+                Profit = Profit - COALESCE(OLD.Profit, 0)
+            WHERE Day = COALESCE(date(OLD.Created_At), '') AND Status = OLD.Status;
+            DELETE FROM Orders_Daily_Rollup
+            WHERE Day = COALESCE(date(OLD.Created_At), '') AND Status = OLD.Status AND Orders <= 0;
+
+            UPDATE Orders_Buyer_Rollup SET
+                Orders = Orders - 1,
+                Quantity = Quantity - OLD.Quantity,
+                Revenue = Revenue - OLD.Total_Price,
+                Profit = Profit - COALESCE(OLD.Profit, 0)
+            WHERE User_Id = OLD.User_Id AND Status = OLD.Status;
+            DELETE FROM Orders_Buyer_Rollup
+            WHERE User_Id = OLD.User_Id AND Status = OLD.Status AND Orders <= 0;
+        END;
+
+        -- An update moves the order out of its old buckets and into the new ones
+        CREATE TRIGGER IF NOT EXISTS trg_orders_rollup_update
+        AFTER UPDATE OF User_Id, Quantity, Total_Price, Profit, Status, Created_At ON Orders
+        BEGIN
+            UPDATE Orders_Daily_Rollup SET
+                Orders = Orders - 1,
+                Quantity = Quantity - OLD.Quantity,
+                Revenue = Revenue - OLD.Total_Price,
+                Profit = Profit - COALESCE(OLD.Profit, 0)
+            WHERE Day = COALESCE(date(OLD.Created_At), '') AND Status = OLD.Status;
+            DELETE FROM Orders_Daily_Rollup
+            WHERE Day = COALESCE(date(OLD.Created_At), '') AND Status = OLD.Status AND Orders <= 0;
+
+            UPDATE Orders_Buyer_Rollup SET
+                Orders = Orders - 1,
+                Quantity = Quantity - OLD.Quantity,
+                Revenue = Revenue - OLD.Total_Price,
+                Profit = Profit - COALESCE(OLD.Profit, 0)
+            WHERE User_Id = OLD.User_Id AND Status = OLD.Status;
+            DELETE FROM Orders_Buyer_Rollup
+            WHERE User_Id = OLD.User_Id AND Status = OLD.Status AND Orders <= 0;
+
+            INSERT INTO Orders_Daily_Rollup (Day, Status, Orders, Quantity, Revenue, Profit)
+            VALUES (COALESCE(date(NEW.Created_At), ''), NEW.Status, 1,
+                    NEW.Quantity, NEW.Total_Price, COALESCE(NEW.Profit, 0))
+            ON CONFLICT (Day, Status) DO UPDATE SET
+                Orders = Orders + 1,
+                Quantity = Quantity + excluded.Quantity,
+                Revenue = Revenue + excluded.Revenue,
+                Profit = Profit + excluded.Profit;
+
+            INSERT INTO Orders_Buyer_Rollup (User_Id, Status, Orders, Quantity, Revenue, Profit)
+            VALUES (NEW.User_Id, NEW.Status, 1, NEW.Quantity, NEW.Total_Price, COALESCE(NEW.Profit, 0))
+            ON CONFLICT (User_Id, Status) DO UPDATE SET
+                Orders = Orders + 1,
+                Quantity = Quantity + excluded.Quantity,
+                Revenue = Revenue + excluded.Revenue,
+                Profit = Profit + excluded.Profit;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_bids_rollup_insert AFTER INSERT ON Bids
+        BEGIN
+            INSERT INTO Bids_Daily_Rollup (Day, Status, Bids, Offered_Total)
+            VALUES (COALESCE(date(NEW.Created_At), ''), NEW.Status, 1, NEW.Offered_Price)
+            ON CONFLICT (Day, Status) DO UPDATE SET
+                Bids = Bids + 1,
+                Offered_Total = Offered_Total + excluded.Offered_Total;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_bids_rollup_delete AFTER DELETE ON Bids
+        BEGIN
+            UPDATE Bids_Daily_Rollup SET
+                Bids = Bids - 1,
+                Offered_Total = Offered_Total - OLD.Offered_Price
+            WHERE Day = COALESCE(date(OLD.Created_At), '') AND Status = OLD.Status;
+            DELETE FROM Bids_Daily_Rollup
+            WHERE Day = COALESCE(date(OLD.Created_At), '') AND Status = OLD.Status AND Bids <= 0;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_bids_rollup_update
+        AFTER UPDATE OF Offered_Price, Status, Created_At ON Bids
+        BEGIN
+            UPDATE Bids_Daily_Rollup SET
+                Bids = Bids - 1,
+                Offered_Total = Offered_Total - OLD.Offered_Price
+            WHERE Day = COALESCE(date(OLD.Created_At), '') AND Status = OLD.Status;
+            DELETE FROM Bids_Daily_Rollup
+            WHERE Day = COALESCE(date(OLD.Created_At), '') AND Status = OLD.Status AND Bids <= 0;
+
+            INSERT INTO Bids_Daily_Rollup (Day, Status, Bids, Offered_Total)
+            VALUES (COALESCE(date(NEW.Created_At), ''), NEW.Status, 1, NEW.Offered_Price)
+            ON CONFLICT (Day, Status) DO UPDATE SET
+                Bids = Bids + 1,
+                Offered_Total = Offered_Total + excluded.Offered_Total;
+        END;
+
+        -- Backfill from the existing rows
+        {AsyncReportsRepository.ROLLUP_REBUILD_SCRIPT}
+        """
+    ),
+    Migration(
+        4,
+        "Full-text search index over PCs, Laptops and Parts",
+        f"""
+        -- rowid = Item_Id * 4 + type code (1 = PC, 2 = Laptop, 3 = Part), so
+        -- triggers and searches address an item's document by rowid
+        CREATE VIRTUAL TABLE IF NOT EXISTS Inventory_FTS USING fts5(
+            Title, Description, Notes,
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3'
+        );
+
+        -- Title matches outrank Description / Notes matches
+        INSERT INTO Inventory_FTS (Inventory_FTS, rank) VALUES ('rank', 'bm25(10.0, 2.0, 1.0)');
+
+        CREATE TRIGGER IF NOT EXISTS trg_pcs_fts_insert AFTER INSERT ON PCs
+        BEGIN
+            INSERT INTO Inventory_FTS (rowid, Title, Description, Notes)
+            VALUES (NEW.PC_Id * 4 + 1, NEW.Title, NEW.Description, NEW.Notes);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_pcs_fts_delete AFTER DELETE ON PCs
+        BEGIN
+            DELETE FROM Inventory_FTS WHERE rowid = OLD.PC_Id * 4 + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_pcs_fts_update AFTER UPDATE OF PC_Id, Title, Description, Notes ON PCs
+        BEGIN
+            DELETE FROM Inventory_FTS WHERE rowid = OLD.PC_Id * 4 + 1;
+            INSERT INTO Inventory_FTS (rowid, Title, Description, Notes)
+            VALUES (NEW.PC_Id * 4 + 1, NEW.Title, NEW.Description, NEW.Notes);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_laptops_fts_insert AFTER INSERT ON Laptops
+        BEGIN
+            INSERT INTO Inventory_FTS (rowid, Title, Description, Notes)
+            VALUES (NEW.Laptop_Id * 4 + 2, NEW.Title, NEW.Description, NEW.Notes);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_laptops_fts_delete AFTER DELETE ON Laptops
+        BEGIN
+            DELETE FROM Inventory_FTS WHERE rowid = OLD.Laptop_Id * 4 + 2;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_laptops_fts_update AFTER UPDATE OF Laptop_Id, Title, Description, Notes ON Laptops
+        BEGIN
+            DELETE FROM Inventory_FTS WHERE rowid = OLD.Laptop_Id * 4 + 2;
+            INSERT INTO Inventory_FTS (rowid, Title, Description, Notes)
+            VALUES (NEW.Laptop_Id * 4 + 2, NEW.Title, NEW.Description, NEW.Notes);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_parts_fts_insert AFTER INSERT ON Parts
+        BEGIN
+            INSERT INTO Inventory_FTS (rowid, Title, Description, Notes)
+            VALUES (NEW.Part_Id * 4 + 3, NEW.Title, NEW.Description, NEW.Notes);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_parts_fts_delete AFTER DELETE ON Parts
+        BEGIN
+            DELETE FROM Inventory_FTS WHERE rowid = OLD.Part_Id * 4 + 3;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_parts_fts_update AFTER UPDATE OF Part_Id, Title, Description, Notes ON Parts
+        BEGIN
+            DELETE FROM Inventory_FTS WHERE rowid = OLD.Part_Id * 4 + 3;
+            INSERT INTO Inventory_FTS (rowid, Title, Description, Notes)
+            VALUES (NEW.Part_Id * 4 + 3, NEW.Title, NEW.Description, NEW.Notes);
+        END;
+
+        {AsyncSearchRepository.FTS_REBUILD_SCRIPT}
+        """
+    ),
+    Migration(
+        5,
+        "Listing facet counts and composite indexes for filtered catalog pages",
+        f"""
+        {FACETS_SCHEMA_SCRIPT}
+        {AsyncFacetsRepository.FACETS_REBUILD_SCRIPT}
+        """
+    ),
+    Migration(
+        6,
+        "Persistent FSM states (utils.fsm_storage_utils.SQLiteStorage)",
+        """
+        CREATE TABLE IF NOT EXISTS FSM_Storage (
+            Key TEXT PRIMARY KEY,
+            State TEXT,
+            Data TEXT NOT NULL DEFAULT '{}',
+            Updated_At REAL NOT NULL
+        ) WITHOUT ROWID;
+        """
+    ),
+]
+
+
+SCHEMA_VERSION_TABLE = """
+    CREATE TABLE IF NOT EXISTS schema_version (
+        Version     INTEGER PRIMARY KEY,
+        Description TEXT NOT NULL,
+        Applied_At  TEXT DEFAULT (datetime('now'))
+    )
+"""
+
+
+async def get_schema_version(db: AsyncDatabase) -> int:
+    """
+    Return the highest applied migration version (0 if none).
+    """
+    await db.execute(SCHEMA_VERSION_TABLE)
+    row = await db.fetchone("SELECT MAX(Version) FROM schema_version")
+    return row[0] or 0
+
+
+async def run_migrations(db_path: Optional[str] = None) -> int:
+    """
+    Apply every pending migration in order.
+
+    Each migration runs in its own transaction together with its
+    `schema_version` record, so a failing migration leaves no partial changes.
+
+    Args:
+        db_path (Optional[str]): Path to the database (config default if omitted).
+
+    Returns:
+        int: Schema version after the run.
+    """
+    db = AsyncDatabase(db_path)
+    current = await get_schema_version(db)
+
+    for migration in MIGRATIONS:
+        if migration.version <= current:
+            continue
+
+        async with db.transaction(migration.script) as conn:
+            await conn.execute(
+                "INSERT INTO schema_version (Version, Description) VALUES (?, ?)",
+                (migration.version, migration.description)
+            )
+
+        logger.info("Applied migration %s: %s", migration.version, migration.description)
+        current = migration.version
+
+    return current
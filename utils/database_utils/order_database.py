@@ -1,4 +1,4 @@
-from typing import Optional, List, Tuple
+from typing import AsyncIterator, Optional, List, Tuple
 from utils.database_utils import AsyncDatabase
 
 
@@ -61,12 +61,45 @@ class AsyncOrdersRepository(AsyncDatabase):
         query = f"SELECT * FROM {self.TABLE_NAME} WHERE User_Id = ?"
         return await self.fetchall(query, (user_id,))
 
+    def _orders_with_users_query(self, user_id: Optional[int]) -> Tuple[str, Tuple]:
+        query = f"""
+            SELECT o.*, u.Username, u.Name
+            FROM {self.TABLE_NAME} o
+            LEFT JOIN Users u ON u.User_Id = o.User_Id
+        """
+        if user_id is not None:
+            return f"{query} WHERE o.User_Id = ? ORDER BY o.Order_Id", (user_id,)
+        return f"{query} ORDER BY o.Order_Id", ()
+
+    async def get_orders_with_users(self, user_id: Optional[int] = None) -> List[Tuple]:
+        """
+        Get orders joined to their buyer in one query.
+
+        Each row is the Orders row followed by the buyer's Username and Name
+        (None if the user no longer exists). Pass `user_id` to limit the
+        result to one user's orders.
+        """
+        return await self.fetchall(*self._orders_with_users_query(user_id))
+
+    def iter_orders_with_users(self, user_id: Optional[int] = None, chunk_size: int = 500) -> AsyncIterator[Tuple]:
+        """
+        Stream the rows of `get_orders_with_users` without loading them into a list.
+        """
+        query, params = self._orders_with_users_query(user_id)
+        return self.iterate(query, params, chunk_size)
+
     async def get_all_orders(self) -> List[Tuple]:
         """
         Retrieve all orders.
         """
         return await self.get_table(self.TABLE_NAME)
 
+    def iter_all_orders(self, chunk_size: int = 500) -> AsyncIterator[Tuple]:
+        """
+        Stream all orders without loading them into a list.
+        """
+        return self.iter_table(self.TABLE_NAME, chunk_size)
+
     async def update_order(
         self,
         order_id: int,
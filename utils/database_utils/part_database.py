@@ -1,5 +1,6 @@
-from typing import Optional, Tuple, List, Any
+from typing import AsyncIterator, Optional, Tuple, List, Any
 from .database import AsyncDatabase
+from .row_cache import cached, invalidates
 
 
 class AsyncPartsRepository(AsyncDatabase):
@@ -13,6 +14,7 @@ class AsyncPartsRepository(AsyncDatabase):
 
     # ----------------- Getters -----------------
 
+    @cached("Parts")
     async def get_part(self, part_id: int) -> Optional[Tuple]:
         """
         Retrieve a single part by Part_Id.
@@ -23,7 +25,7 @@ class AsyncPartsRepository(AsyncDatabase):
         Returns:
             Optional[Tuple]: Part row or None if not found.
         """
-        return await self.get_row(self.TABLE, "Part_Id = ?", (part_id,))
+        return await self.load_row(self.TABLE, "Part_Id", part_id)
 
     async def get_all_parts(self) -> List[Tuple[Any]]:
         """
@@ -34,6 +36,18 @@ class AsyncPartsRepository(AsyncDatabase):
         """
         return await self.get_table(self.TABLE)
 
+    def iter_all_parts(self, chunk_size: int = 500) -> AsyncIterator[Tuple[Any]]:
+        """
+        Stream all parts without loading them into a list.
+
+        Args:
+            chunk_size (int): Rows fetched per round trip.
+
+        Returns:
+            AsyncIterator[Tuple]: Part rows.
+        """
+        return self.iter_table(self.TABLE, chunk_size)
+
     async def get_parts_by_type(self, part_type: str) -> List[Tuple[Any]]:
         """
         Retrieve all parts of a given type.
@@ -49,6 +63,7 @@ class AsyncPartsRepository(AsyncDatabase):
 
     # ----------------- Insert / Update / Delete -----------------
 
+    @invalidates("Parts", by_id=False)
     async def add_part(
         self,
         type: str,
@@ -61,7 +76,7 @@ class AsyncPartsRepository(AsyncDatabase):
         notes: Optional[str] = None,
         contact_info: Optional[str] = None,
         contract_id: Optional[float] = None
-    ) -> None:
+    ) -> Optional[int]:
         """
         Insert a new part into the database.
 
@@ -78,7 +93,7 @@ class AsyncPartsRepository(AsyncDatabase):
             contract_id (float, optional): Contract ID if applicable.
 
         Returns:
-            None
+            Optional[int]: Part_Id of the new part.
         """
         columns = [
             "Type", "Title", "Condition", "Listed_Price", "Sold_Price",
@@ -88,8 +103,9 @@ class AsyncPartsRepository(AsyncDatabase):
             type, title, condition, listed_price, sold_price,
             listing_url, description, notes, contact_info, contract_id
         )
-        await self.insert(self.TABLE, columns, values)
+        return await self.insert(self.TABLE, columns, values)
 
+    @invalidates("Parts")
     async def update_part(
         self,
         part_id: int,
@@ -109,6 +125,7 @@ class AsyncPartsRepository(AsyncDatabase):
         """
         await self.update(self.TABLE, updates, "Part_Id = ?", params)
 
+    @invalidates("Parts")
     async def remove_part(self, part_id: int) -> None:
         """
         Delete a part by ID.
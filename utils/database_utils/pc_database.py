@@ -1,16 +1,19 @@
 from .database import AsyncDatabase
+from .row_cache import cached, invalidates
 from typing import Optional, Tuple, List, Any
 
 
 class AsyncPCsRepository(AsyncDatabase):
     TABLE = "PCs"
 
+    @cached("PCs")
     async def get_pc(self, pc_id: int) -> Optional[Tuple]:
-        return await self.get_row(self.TABLE, "PC_Id = ?", (pc_id,))
+        return await self.load_row(self.TABLE, "PC_Id", pc_id)
 
     async def get_all_pcs(self) -> List[Tuple[Any]]:
         return await self.get_table(self.TABLE)
 
+    @invalidates("PCs", by_id=False)
     async def add_pc(
         self,
         title: str,
@@ -28,7 +31,7 @@ class AsyncPCsRepository(AsyncDatabase):
         description: Optional[str] = None,
         notes: Optional[str] = None,
         condition: str = "Used"
-    ) -> None:
+    ) -> Optional[int]:
         columns = [
             "Title", "CPU_Id", "GPU_Id", "RAM_Id", "SSD_Id", "HDD_Id",
             "PSU_Id", "Motherboard_Id", "Case_Id", "Cooler_Id", "Fan_Id",
@@ -39,8 +42,9 @@ class AsyncPCsRepository(AsyncDatabase):
             psu_id, motherboard_id, case_id, cooler_id, fan_id,
             photo_url, description, notes, condition
         )
-        await self.insert(self.TABLE, columns, values)
+        return await self.insert(self.TABLE, columns, values)
 
+    @invalidates("PCs")
     async def update_pc(
         self,
         pc_id: int,
@@ -82,5 +86,6 @@ class AsyncPCsRepository(AsyncDatabase):
         params.append(pc_id)
         await self.update(self.TABLE, ", ".join(updates), "PC_Id = ?", tuple(params))
 
+    @invalidates("PCs")
     async def delete_pc(self, pc_id: int) -> None:
         await self.delete(self.TABLE, "PC_Id = ?", (pc_id,))
\ No newline at end of file
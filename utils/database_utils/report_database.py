@@ -0,0 +1,131 @@
+from typing import Dict, List, Tuple
+from utils.database_utils import AsyncDatabase
+
+
+class AsyncReportsRepository(AsyncDatabase):
+    """
+    Read-only sales and bid reports served from the rollup tables.
+
+    `Orders_Daily_Rollup`, `Orders_Buyer_Rollup` and `Bids_Daily_Rollup` are
+    kept up to date by triggers on `Orders` and `Bids` (see migration 3), so
+    every report aggregates one row per (period, status) or (buyer, status)
+    instead of scanning the orders themselves.
+    """
+
+    # Orders in these statuses never turn into money
+    EXCLUDED_SALES_STATUSES = ("Cancelled",)
+
+    # Bid statuses that count as a decision; "Converted" bids were accepted
+    ACCEPTED_BID_STATUSES = ("Accepted", "Converted")
+    DECIDED_BID_STATUSES = ("Accepted", "Converted", "Rejected")
+
+    # strftime() formats for each supported period
+    PERIODS: Dict[str, str] = {
+        "day": "%Y-%m-%d",
+        "week": "%Y-W%W",
+        "month": "%Y-%m",
+    }
+
+    # Recomputes every rollup from scratch (also the backfill of migration 3)
+    ROLLUP_REBUILD_SCRIPT = """
+        DELETE FROM Orders_Daily_Rollup;
+        INSERT INTO Orders_Daily_Rollup (Day, Status, Orders, Quantity, Revenue, Profit)
+        SELECT COALESCE(date(Created_At), ''), Status, COUNT(*),
+               SUM(Quantity), SUM(Total_Price), SUM(COALESCE(Profit, 0))
+        FROM Orders GROUP BY 1, 2;
+
+        DELETE FROM Orders_Buyer_Rollup;
+        INSERT INTO Orders_Buyer_Rollup (User_Id, Status, Orders, Quantity, Revenue, Profit)
+        SELECT User_Id, Status, COUNT(*), SUM(Quantity), SUM(Total_Price), SUM(COALESCE(Profit, 0))
+        FROM Orders GROUP BY 1, 2;
+
+        DELETE FROM Bids_Daily_Rollup;
+        INSERT INTO Bids_Daily_Rollup (Day, Status, Bids, Offered_Total)
+        SELECT COALESCE(date(Created_At), ''), Status, COUNT(*), SUM(Offered_Price)
+        FROM Bids GROUP BY 1, 2;
+    """
+
+    async def get_orders_by_status(self) -> List[Tuple[str, int, int, float, float]]:
+        """
+        Totals per order status.
+
+        Returns:
+            List[Tuple]: (Status, Orders, Quantity, Revenue, Profit) rows.
+        """
+        query = """
+            SELECT Status, SUM(Orders), SUM(Quantity), ROUND(SUM(Revenue), 2), ROUND(SUM(Profit), 2)
+            FROM Orders_Daily_Rollup
+            GROUP BY Status
+            ORDER BY Status
+        """
+        return await self.fetchall(query)
+
+    async def get_sales_by_period(self, period: str = "day", limit: int = 14) -> List[Tuple[str, int, float, float]]:
+        """
+        Revenue and profit of non-cancelled orders for the most recent periods.
+
+        Args:
+            period (str): "day", "week" or "month".
+            limit (int): Number of most recent periods to return.
+
+        Returns:
+            List[Tuple]: (Period, Orders, Revenue, Profit) rows, newest first.
+        """
+        period_format = self.PERIODS[period]
+        placeholders = ", ".join("?" for _ in self.EXCLUDED_SALES_STATUSES)
+        query = f"""
+            SELECT strftime('{period_format}', Day) AS Period,
+                   SUM(Orders), ROUND(SUM(Revenue), 2), ROUND(SUM(Profit), 2)
+            FROM Orders_Daily_Rollup
+            WHERE Day != '' AND Status NOT IN ({placeholders})
+            GROUP BY Period
+            ORDER BY Period DESC
+            LIMIT ?
+        """
+        return await self.fetchall(query, (*self.EXCLUDED_SALES_STATUSES, limit))
+
+    async def get_top_buyers(self, limit: int = 10) -> List[Tuple[int, str, str, int, float, float]]:
+        """
+        Buyers ranked by revenue of their non-cancelled orders.
+
+        Returns:
+            List[Tuple]: (User_Id, Username, Name, Orders, Revenue, Profit) rows.
+        """
+        placeholders = ", ".join("?" for _ in self.EXCLUDED_SALES_STATUSES)
+        query = f"""
+            SELECT r.User_Id, u.Username, u.Name,
+                   SUM(r.Orders), ROUND(SUM(r.Revenue), 2) AS Revenue, ROUND(SUM(r.Profit), 2)
+            FROM Orders_Buyer_Rollup r
+            LEFT JOIN Users u ON u.User_Id = r.User_Id
+            WHERE r.Status NOT IN ({placeholders})
+            GROUP BY r.User_Id
+            ORDER BY Revenue DESC
+            LIMIT ?
+        """
+        return await self.fetchall(query, (*self.EXCLUDED_SALES_STATUSES, limit))
+
+    async def get_bid_stats(self) -> Dict[str, float]:
+        """
+        Bid counts per status plus the acceptance rate of decided bids.
+
+        Returns:
+            Dict[str, float]: Count per status, "Total" and "Acceptance_Rate" (0..1).
+        """
+        rows = await self.fetchall("SELECT Status, SUM(Bids) FROM Bids_Daily_Rollup GROUP BY Status")
+        stats: Dict[str, float] = {status: count for status, count in rows}
+
+        accepted = sum(stats.get(status, 0) for status in self.ACCEPTED_BID_STATUSES)
+        decided = sum(stats.get(status, 0) for status in self.DECIDED_BID_STATUSES)
+
+        stats["Total"] = sum(count for _, count in rows)
+        stats["Acceptance_Rate"] = accepted / decided if decided else 0.0
+        return stats
+
+    async def rebuild_rollups(self) -> None:
+        """
+        Recompute every rollup table from `Orders` and `Bids`.
+
+        Only needed to repair rollups after rows were changed with the
+        triggers disabled (e.g. a bulk import through another tool).
+        """
+        await self.run_script_in_transaction(self.ROLLUP_REBUILD_SCRIPT)
@@ -0,0 +1,214 @@
+import functools
+import inspect
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+# Called as listener(table, row_id) after a write; row_id is None when the writer does not know it
+WriteListener = Callable[[str, Optional[Any]], None]
+
+
+class RowCache:
+    """
+    Size-bounded LRU cache with per-table TTLs for repository point reads.
+
+    Entries are keyed by (table, db_path, row id). Repository getters are
+    wrapped with `@cached(table)` and writers with `@invalidates(table)`, so a
+    write drops the affected row before the writer returns. Writers also
+    notify any listeners registered with `subscribe()`, which lets derived
+    caches react to the same writes.
+
+    Set `enabled = False` (e.g. in tests) to bypass the cache entirely.
+    """
+
+    # Section title in the Caches report
+    label = "Rows"
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 60,
+        enabled: bool = True
+    ) -> None:
+        """
+        Args:
+            max_entries (int): Maximum number of cached rows across all tables.
+            ttls (Optional[Dict[str, float]]): Seconds to keep rows, per table.
+            default_ttl (float): TTL for tables missing from `ttls`.
+            enabled (bool): Whether getters use the cache at all.
+        """
+        self.max_entries = max_entries
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self.enabled = enabled
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        # Bumped on every invalidation so reads that started before a write
+        # do not put a stale row back into the cache.
+        self._generations: Dict[str, int] = {}
+        self._listeners: Dict[str, List[WriteListener]] = {}
+
+    # ----------------- Reads -----------------
+
+    def get(self, table: str, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up a row. Returns (found, row).
+        """
+        entry = self._entries.get((table, key))
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        expires_at, row = entry
+        if expires_at < time.monotonic():
+            del self._entries[(table, key)]
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end((table, key))
+        self.hits += 1
+        return True, row
+
+    def generation(self, table: str) -> int:
+        return self._generations.get(table, 0)
+
+    def set(self, table: str, key: Hashable, row: Any, generation: Optional[int] = None) -> None:
+        """
+        Store a row, unless the table was invalidated since `generation` was read.
+        """
+        if generation is not None and generation != self.generation(table):
+            return
+
+        ttl = self.ttls.get(table, self.default_ttl)
+        self._entries[(table, key)] = (time.monotonic() + ttl, row)
+        self._entries.move_to_end((table, key))
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    # ----------------- Writes -----------------
+
+    def invalidate(self, table: str, key: Optional[Hashable] = None) -> None:
+        """
+        Drop one row, or every row of `table` if `key` is None.
+        """
+        self._generations[table] = self.generation(table) + 1
+        if key is not None:
+            self._entries.pop((table, key), None)
+            return
+
+        for entry_key in [k for k in self._entries if k[0] == table]:
+            del self._entries[entry_key]
+
+    def subscribe(self, table: str, listener: WriteListener) -> None:
+        """
+        Call `listener(table, row_id)` after every write to `table`.
+        `row_id` is None when the writer does not know the affected id.
+        """
+        self._listeners.setdefault(table, []).append(listener)
+
+    def notify_write(self, table: str, row_id: Optional[Any] = None) -> None:
+        for listener in self._listeners.get(table, ()):
+            listener(table, row_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Hits, misses, evictions, current size and approximate memory in KB.
+        """
+        memory = sys.getsizeof(self._entries) + sum(
+            sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row or ())
+            for _, row in self._entries.values()
+        )
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "cached": len(self._entries),
+            "memory_kb": memory / 1024,
+        }
+
+
+# Shared cache used by the repositories
+row_cache = RowCache(
+    ttls={
+        "Listings": 60,
+        "PCs": 300,
+        "Laptops": 300,
+        "Parts": 300,
+        "Users": 120,
+    }
+)
+
+
+def cached(table: str) -> Callable:
+    """
+    Decorator for repository getters taking a single row id.
+
+    Rows are cached per (db_path, id); None results are not cached.
+    """
+    def decorator(func: Callable) -> Callable:
+        id_param = list(inspect.signature(func).parameters)[1]
+
+        @functools.wraps(func)
+        async def wrapper(self, *args: Any, **kwargs: Any) -> Optional[Tuple]:
+            row_id = args[0] if args else kwargs[id_param]
+            if not row_cache.enabled:
+                return await func(self, row_id)
+
+            key = (self.db_path, row_id)
+            found, row = row_cache.get(table, key)
+            if found:
+                return row
+
+            generation = row_cache.generation(table)
+            row = await func(self, row_id)
+            if row is not None:
+                row_cache.set(table, key, row, generation)
+            return row
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates(table: str, by_id: bool = True) -> Callable:
+    """
+    Decorator for repository writers.
+
+    Args:
+        table (str): Table the writer modifies.
+        by_id (bool): True if the writer's first argument is the row id
+            (update/remove/delete); False for inserts, whose new id is taken
+            from the writer's return value (None if it returns nothing).
+    """
+    def decorator(func: Callable) -> Callable:
+        # Name of the first parameter after `self`, i.e. the row id
+        id_param = list(inspect.signature(func).parameters)[1]
+
+        @functools.wraps(func)
+        async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            result = await func(self, *args, **kwargs)
+
+            if by_id:
+                row_id = args[0] if args else kwargs.get(id_param)
+                row_cache.invalidate(table, (self.db_path, row_id))
+            else:
+                row_id = result
+
+            row_cache.notify_write(table, row_id)
+            return result
+
+        return wrapper
+
+    return decorator
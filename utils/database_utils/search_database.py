@@ -0,0 +1,111 @@
+import re
+from typing import Any, List, Optional, Tuple
+from utils.database_utils import AsyncDatabase
+from .listing_database import AsyncListingsRepository
+
+
+class AsyncSearchRepository(AsyncDatabase):
+    """
+    Full-text search over PCs, Laptops and Parts.
+
+    `Inventory_FTS` (see migration 4) indexes Title, Description and Notes of
+    every item and is kept in sync by triggers on the three tables. Its rowid
+    encodes the item as `Item_Id * 4 + type code`, which lets the search join
+    the hits straight to `Listings` through the (Item_Type, Item_Id) index.
+    """
+
+    FTS_TABLE = "Inventory_FTS"
+
+    # Type code stored in the low bits of an Inventory_FTS rowid
+    ITEM_TYPE_CODES = {"PC": 1, "Laptop": 2, "Part": 3}
+
+    # Longest accepted search, in words
+    MAX_TERMS = 8
+
+    # Re-indexes every item from scratch (also the backfill of migration 4)
+    FTS_REBUILD_SCRIPT = """
+        DELETE FROM Inventory_FTS;
+        INSERT INTO Inventory_FTS (rowid, Title, Description, Notes)
+        SELECT PC_Id * 4 + 1, Title, Description, Notes FROM PCs;
+        INSERT INTO Inventory_FTS (rowid, Title, Description, Notes)
+        SELECT Laptop_Id * 4 + 2, Title, Description, Notes FROM Laptops;
+        INSERT INTO Inventory_FTS (rowid, Title, Description, Notes)
+        SELECT Part_Id * 4 + 3, Title, Description, Notes FROM Parts;
+    """
+
+    # Ranked listings for one page of hits
+    RANKED_LISTINGS_QUERY = """
+        SELECT l.Listing_Id, f.rank AS Rank
+        FROM Inventory_FTS f
+        JOIN Listings l
+            ON l.Item_Type = CASE f.rowid % 4 WHEN 1 THEN 'PC' WHEN 2 THEN 'Laptop' ELSE 'Part' END
+            AND l.Item_Id = f.rowid / 4
+        WHERE Inventory_FTS MATCH ?
+        ORDER BY f.rank, l.Listing_Id
+        LIMIT ? OFFSET ?
+    """
+
+    @classmethod
+    def build_match_query(cls, text: str) -> Optional[str]:
+        """
+        Turn free user text into a safe FTS5 query.
+
+        Every word becomes a quoted term, so FTS5 operators and quotes typed by
+        the user are never interpreted. Only the last word is a prefix term
+        (the user may still be typing it): "RTX 306" -> "rtx" "306"*.
+
+        Returns:
+            Optional[str]: The MATCH expression, or None if the text has no words.
+        """
+        terms = re.findall(r"\w+", text.lower())[:cls.MAX_TERMS]
+        if not terms:
+            return None
+        return " ".join(f'"{term}"' for term in terms) + "*"
+
+    async def search_listing_ids(self, text: str, limit: int = 10, offset: int = 0) -> List[int]:
+        """
+        Listing ids whose item matches `text`, best match first.
+
+        Args:
+            text (str): Free search text, e.g. "RTX 3060".
+            limit (int): Maximum number of ids.
+            offset (int): Number of ranked results to skip.
+
+        Returns:
+            List[int]: Ranked Listing_Id values.
+        """
+        match = self.build_match_query(text)
+        if match is None:
+            return []
+        rows = await self.fetchall(self.RANKED_LISTINGS_QUERY, (match, limit, offset))
+        return [row[0] for row in rows]
+
+    async def search_catalog(self, text: str, limit: int = 10, offset: int = 0) -> List[Tuple[Any]]:
+        """
+        Ranked search results in the row shape of `AsyncListingsRepository.get_catalog`.
+
+        Args:
+            text (str): Free search text.
+            limit (int): Maximum number of rows.
+            offset (int): Number of ranked results to skip.
+
+        Returns:
+            List[Tuple]: Catalog rows (item Title last), best match first.
+        """
+        match = self.build_match_query(text)
+        if match is None:
+            return []
+
+        query = f"""
+            WITH ranked AS ({self.RANKED_LISTINGS_QUERY})
+            {AsyncListingsRepository.CATALOG_QUERY}
+            JOIN ranked r ON r.Listing_Id = l.Listing_Id
+            ORDER BY r.Rank, l.Listing_Id
+        """
+        return await self.fetchall(query, (match, limit, offset))
+
+    async def rebuild_index(self) -> None:
+        """
+        Re-index every PC, Laptop and Part (e.g. after a bulk import with triggers off).
+        """
+        await self.run_script_in_transaction(self.FTS_REBUILD_SCRIPT)
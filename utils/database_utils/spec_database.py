@@ -0,0 +1,181 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+from utils.database_utils import AsyncDatabase
+from .row_cache import row_cache
+
+
+@dataclass(frozen=True)
+class ResolvedComponent:
+    """
+    One component slot of a PC or Laptop with its part resolved.
+
+    Attributes:
+        slot (str): Human-readable slot name, e.g. "CPU".
+        part_id (int): Referenced Part_Id.
+        title (Optional[str]): Part title (None if the part no longer exists).
+        condition (Optional[str]): Part condition.
+        price (Optional[float]): Part Listed_Price.
+    """
+    slot: str
+    part_id: int
+    title: Optional[str] = None
+    condition: Optional[str] = None
+    price: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class ResolvedSpec:
+    """
+    A PC or Laptop row together with its resolved components.
+
+    Attributes:
+        item_type (str): 'PC' or 'Laptop'.
+        item (Tuple): The full PCs / Laptops row.
+        components (List[ResolvedComponent]): Filled slots, in table column order.
+    """
+    item_type: str
+    item: Tuple
+    components: List[ResolvedComponent] = field(default_factory=list)
+
+    @property
+    def total_price(self) -> float:
+        """Sum of the listed prices of all existing components."""
+        return sum(component.price or 0 for component in self.components)
+
+
+class AsyncSpecsRepository(AsyncDatabase):
+    """
+    Resolves PCs and Laptops with every referenced part in one query.
+
+    A PC references up to 10 parts and a Laptop up to 13; instead of one
+    `get_part` per slot, `get_spec` joins the item to `Parts` with
+    `Part_Id IN (<slot columns>)`. Resolved specs are cached until the item
+    or any of its parts is written.
+    """
+
+    # (table, id column, [(slot name, column)]) per item type
+    ITEM_TABLES: Dict[str, Tuple[str, str, List[Tuple[str, str]]]] = {
+        "PC": ("PCs", "PC_Id", [
+            ("CPU", "CPU_Id"), ("GPU", "GPU_Id"), ("RAM", "RAM_Id"), ("SSD", "SSD_Id"),
+            ("HDD", "HDD_Id"), ("PSU", "PSU_Id"), ("Motherboard", "Motherboard_Id"),
+            ("Case", "Case_Id"), ("Cooler", "Cooler_Id"), ("Fan", "Fan_Id"),
+        ]),
+        "Laptop": ("Laptops", "Laptop_Id", [
+            ("CPU", "CPU_Id"), ("GPU", "GPU_Id"), ("RAM", "RAM_Id"), ("SSD", "SSD_Id"),
+            ("HDD", "HDD_Id"), ("Motherboard", "Motherboard_Id"), ("Battery", "Battery_Id"),
+            ("Keyboard", "Keyboard_Id"), ("Touchpad", "Touchpad_Id"), ("Display", "Display_Id"),
+            ("Charger", "Charger_Id"), ("Webcam", "Webcam_Id"), ("Case Panel", "Case_Panel_Id"),
+        ]),
+    }
+
+    # Parts columns appended to every item row by the spec query
+    PART_COLUMNS = ("Part_Id", "Title", "Condition", "Listed_Price")
+
+    MAX_CACHED_SPECS = 5000
+
+    # Shared by all instances: (db_path, item_type, item_id) -> spec, plus
+    # Part_Id -> keys of the specs that reference it
+    _specs: "OrderedDict[Hashable, ResolvedSpec]" = OrderedDict()
+    _specs_by_part: Dict[int, Set[Hashable]] = {}
+    # Bumped on every invalidation so a query racing a write is not cached
+    _generation = 0
+
+    @classmethod
+    def _spec_query(cls, item_type: str) -> str:
+        table, id_column, slots = cls.ITEM_TABLES[item_type]
+        slot_columns = ", ".join(f"i.{column}" for _, column in slots)
+        part_columns = ", ".join(f"p.{column}" for column in cls.PART_COLUMNS)
+        # Slot ids first, then the full item row, then the joined part
+        return (
+            f"SELECT {slot_columns}, i.*, {part_columns} FROM {table} i "
+            f"LEFT JOIN Parts p ON p.Part_Id IN ({slot_columns}) "
+            f"WHERE i.{id_column} = ?"
+        )
+
+    async def get_spec(self, item_type: str, item_id: int) -> Optional[ResolvedSpec]:
+        """
+        Load a PC or Laptop with all of its components resolved.
+
+        Args:
+            item_type (str): 'PC' or 'Laptop'.
+            item_id (int): PC_Id or Laptop_Id.
+
+        Returns:
+            Optional[ResolvedSpec]: The resolved spec, or None if the item does not exist.
+        """
+        key = (self.db_path, item_type, item_id)
+        spec = self._specs.get(key)
+        if spec is not None:
+            self._specs.move_to_end(key)
+            return spec
+
+        generation = AsyncSpecsRepository._generation
+        rows = await self.fetchall(self._spec_query(item_type), (item_id,))
+        if not rows:
+            return None
+
+        # One row per matched part (a single row of NULL parts if none matched)
+        _, _, slots = self.ITEM_TABLES[item_type]
+        part_count = len(self.PART_COLUMNS)
+        item = tuple(rows[0][len(slots):-part_count])
+        parts = {row[-part_count]: row[-part_count:] for row in rows if row[-part_count] is not None}
+
+        components = []
+        for (slot, _), part_id in zip(slots, rows[0][:len(slots)]):
+            if part_id is None:
+                continue
+            _, title, condition, price = parts.get(part_id, (part_id, None, None, None))
+            components.append(ResolvedComponent(slot, part_id, title, condition, price))
+
+        spec = ResolvedSpec(item_type, item, components)
+        if generation == AsyncSpecsRepository._generation:
+            self._store(key, spec)
+        return spec
+
+    @classmethod
+    def _store(cls, key: Hashable, spec: ResolvedSpec) -> None:
+        cls._specs[key] = spec
+        for component in spec.components:
+            cls._specs_by_part.setdefault(component.part_id, set()).add(key)
+
+        while len(cls._specs) > cls.MAX_CACHED_SPECS:
+            cls._drop(next(iter(cls._specs)))
+
+    @classmethod
+    def _drop(cls, key: Hashable) -> None:
+        spec = cls._specs.pop(key, None)
+        if spec is None:
+            return
+        for component in spec.components:
+            keys = cls._specs_by_part.get(component.part_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del cls._specs_by_part[component.part_id]
+
+    @classmethod
+    def _on_write(cls, table: str, row_id: Optional[Any]) -> None:
+        # row_cache write listener: drop every spec the written row appears in
+        cls._generation += 1
+
+        if table == "Parts":
+            if row_id is None:
+                cls.clear()
+                return
+            for key in list(cls._specs_by_part.get(row_id, ())):
+                cls._drop(key)
+            return
+
+        item_type = "PC" if table == "PCs" else "Laptop"
+        for key in [key for key in cls._specs if key[1] == item_type and (row_id is None or key[2] == row_id)]:
+            cls._drop(key)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._specs.clear()
+        cls._specs_by_part.clear()
+
+
+for _table in ("PCs", "Laptops", "Parts"):
+    row_cache.subscribe(_table, AsyncSpecsRepository._on_write)
@@ -0,0 +1,162 @@
+import asyncio
+import csv
+import gzip
+import io
+import os
+import shutil
+import tempfile
+import zipfile
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Awaitable, Callable, List, Optional, Union
+from .database import AsyncDatabase
+
+
+# Called as progress(table, rows_written, total_rows) after every chunk
+ProgressCallback = Callable[[str, int, int], Union[Awaitable[None], None]]
+
+# File writing and compression run here, never on the event loop
+_export_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="table-export")
+
+# Not exported: bot internals (FSM states hold users' private data) and
+# summaries derived from Listings, Orders and Bids
+INTERNAL_TABLES = (
+    "FSM_Storage", "schema_version", "Listing_Facets",
+    "Orders_Daily_Rollup", "Orders_Buyer_Rollup", "Bids_Daily_Rollup"
+)
+
+
+class TableExporter:
+    """
+    Streams tables to CSV without blocking the event loop.
+
+    Rows are read in chunks from a pooled reader connection while the CSV
+    writing and gzip/zip compression run in a thread pool. Several tables (or
+    the whole database) can be exported concurrently into one zip archive,
+    with progress reported after every chunk. Each table holds a reader
+    until it is written, so at most `max_concurrent` tables are exported
+    at once and the remaining readers keep serving the bot.
+
+    Typical usage:
+        exporter = TableExporter()
+        path = await exporter.export_archive("/tmp/backup.zip", ["Orders", "Bids"])
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        chunk_size: int = 1000,
+        executor: Optional[Executor] = None,
+        max_concurrent: Optional[int] = None
+    ) -> None:
+        """
+        Args:
+            db_path (Optional[str]): Path to the database (config default if omitted).
+            chunk_size (int): Rows read and written per step.
+            executor (Optional[Executor]): Pool for file I/O (shared export pool by default).
+            max_concurrent (Optional[int]): Tables exported at once (half the pool's readers by default).
+        """
+        self.db = AsyncDatabase(db_path)
+        self.chunk_size = chunk_size
+        self.executor = executor or _export_executor
+        self.max_concurrent = max_concurrent
+
+    async def _run(self, func: Callable, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def get_tables(self) -> List[str]:
+        """
+        Names of the exportable tables: ordinary tables only, without SQLite's
+        own, FTS virtual and shadow tables, and `INTERNAL_TABLES`.
+        """
+        rows = await self.db.fetchall(
+            "SELECT name FROM pragma_table_list WHERE schema = 'main' AND type = 'table' "
+            "AND name NOT LIKE 'sqlite_%' ORDER BY name"
+        )
+        return [row[0] for row in rows if row[0] not in INTERNAL_TABLES]
+
+    async def export_table(
+        self,
+        table_name: str,
+        path: str,
+        compress: bool = False,
+        progress: Optional[ProgressCallback] = None
+    ) -> str:
+        """
+        Export one table to a CSV file (gzip-compressed if `compress`).
+
+        Args:
+            table_name (str): Table to export.
+            path (str): Destination file path.
+            compress (bool): Write `.csv.gz` content instead of plain CSV.
+            progress (Optional[ProgressCallback]): Called after every chunk.
+
+        Returns:
+            str: The path of the written file.
+        """
+        col_names = await self.db.get_columns(table_name)
+        total = (await self.db.fetchone(f"SELECT COUNT(*) FROM {table_name}"))[0]
+
+        def open_file() -> io.TextIOBase:
+            if compress:
+                return gzip.open(path, "wt", newline="", encoding="utf-8")
+            return open(path, "w", newline="", encoding="utf-8")
+
+        file = await self._run(open_file)
+        try:
+            writer = csv.writer(file)
+            await self._run(writer.writerow, col_names)
+
+            written = 0
+            async for rows in self.db.iterate_chunks(f"SELECT * FROM {table_name}", chunk_size=self.chunk_size):
+                await self._run(writer.writerows, rows)
+                written += len(rows)
+                if progress is not None:
+                    result = progress(table_name, written, total)
+                    if asyncio.iscoroutine(result):
+                        await result
+        finally:
+            await self._run(file.close)
+
+        return path
+
+    async def export_archive(
+        self,
+        archive_path: str,
+        tables: Optional[List[str]] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> str:
+        """
+        Export several tables concurrently into a single zip archive.
+
+        Args:
+            archive_path (str): Destination `.zip` path.
+            tables (Optional[List[str]]): Tables to export (duplicates ignored); all of `get_tables` if None.
+            progress (Optional[ProgressCallback]): Called after every chunk of every table.
+
+        Returns:
+            str: The path of the archive.
+        """
+        # One CSV per table, in the order requested
+        tables = list(dict.fromkeys(tables or await self.get_tables()))
+        work_dir = tempfile.mkdtemp(prefix="export_")
+
+        limit = self.max_concurrent or max(1, self.db.pool.readers_count // 2)
+        semaphore = asyncio.Semaphore(limit)
+
+        async def export_one(table: str) -> str:
+            async with semaphore:
+                return await self.export_table(table, os.path.join(work_dir, f"{table}.csv"), progress=progress)
+
+        try:
+            csv_paths = await asyncio.gather(*[export_one(table) for table in tables])
+
+            def build_zip() -> None:
+                with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                    for csv_path in csv_paths:
+                        archive.write(csv_path, arcname=os.path.basename(csv_path))
+
+            await self._run(build_zip)
+        finally:
+            await self._run(shutil.rmtree, work_dir, True)
+
+        return archive_path
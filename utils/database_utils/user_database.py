@@ -1,5 +1,7 @@
-from typing import Optional, List, Tuple
+from typing import AsyncIterator, Dict, Iterable, Optional, List, Tuple
 from utils.database_utils import AsyncDatabase  # assuming your base class is in base_database.py
+from .row_cache import cached, invalidates
+from .acl_cache import acl_cache
 
 
 class AsyncUsersRepository(AsyncDatabase):
@@ -9,6 +11,7 @@ class AsyncUsersRepository(AsyncDatabase):
 
     TABLE_NAME = "Users"
 
+    @invalidates("Users")
     async def create_user(
         self,
         user_id: int,
@@ -26,19 +29,35 @@ class AsyncUsersRepository(AsyncDatabase):
         columns = ["User_Id", "Username", "Name", "Company_Id", "Level", "Type", "Address", "Contact_info"]
         values = (user_id, username, name, company_id, level, type_, address, contact_info)
         await self.insert(self.TABLE_NAME, columns, values)
+        acl_cache.add_user(user_id)
 
+    @cached("Users")
     async def get_user_by_id(self, user_id: int) -> Optional[Tuple]:
         """
         Get a single user by their User_Id.
         """
         return await self.get_row(self.TABLE_NAME, "User_Id = ?", (user_id,))
 
+    async def get_users_by_ids(self, user_ids: Iterable[int]) -> Dict[int, Tuple]:
+        """
+        Get many users at once, keyed by User_Id. Missing ids are left out.
+        """
+        rows = await self.get_rows_by_ids(self.TABLE_NAME, "User_Id", user_ids)
+        return {row[0]: row for row in rows}
+
     async def get_all_users(self) -> List[Tuple]:
         """
         Retrieve all users.
         """
         return await self.get_table(self.TABLE_NAME)
 
+    def iter_all_users(self, chunk_size: int = 500) -> AsyncIterator[Tuple]:
+        """
+        Stream all users without loading them into a list.
+        """
+        return self.iter_table(self.TABLE_NAME, chunk_size)
+
+    @invalidates("Users")
     async def update_user(
         self,
         user_id: int,
@@ -83,8 +102,10 @@ class AsyncUsersRepository(AsyncDatabase):
             params.append(user_id)
             await self.update(self.TABLE_NAME, update_str, "User_Id = ?", tuple(params))
 
+    @invalidates("Users")
     async def delete_user(self, user_id: int) -> None:
         """
         Delete a user by their User_Id.
         """
-        await self.delete(self.TABLE_NAME, "User_Id = ?", (user_id,))
\ No newline at end of file
+        await self.delete(self.TABLE_NAME, "User_Id = ?", (user_id,))
+        acl_cache.remove_user(user_id)
\ No newline at end of file
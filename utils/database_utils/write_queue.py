@@ -0,0 +1,169 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from .connection_pool import get_pool
+
+
+logger = logging.getLogger(__name__)
+
+PendingWrite = Tuple[str, Tuple, asyncio.Future]
+
+# Queued by `stop()` to tell the writer task to finish
+_STOP = None
+
+
+class WriteQueue:
+    """
+    Write-behind queue that group-commits writes for one database file.
+
+    `submit()` enqueues a statement and waits for it. A single writer task
+    drains the queue, applies up to `max_batch_size` statements (collected for
+    at most `max_delay` seconds) in one transaction, commits once and then
+    resolves every caller. Callers therefore keep read-your-writes semantics:
+    when `submit()` returns, the row is committed and visible to readers.
+
+    Errors are reported per write: a failing statement is rolled back on its
+    own (SQLite statement-level rollback) and only its caller gets the
+    exception; the rest of the batch still commits.
+    """
+
+    def __init__(self, db_path: str, max_batch_size: int = 100, max_delay: float = 0.005) -> None:
+        """
+        Args:
+            db_path (str): Path to the SQLite database file.
+            max_batch_size (int): Maximum statements per transaction.
+            max_delay (float): Seconds to wait for more statements after the first one.
+        """
+        self.db_path = db_path
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+
+        self.batches = 0
+        self.writes = 0
+
+        self._queue: "asyncio.Queue[Optional[PendingWrite]]" = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Apply everything still queued, then stop the writer task.
+        """
+        if self._task is None:
+            return
+
+        self._queue.put_nowait(_STOP)
+        await self._task
+        self._task = None
+
+    async def submit(self, query: str, params: Tuple = ()) -> Optional[int]:
+        """
+        Queue a write and wait until it is committed.
+
+        Returns:
+            Optional[int]: `lastrowid` of the statement.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((query, params, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        stopping = False
+
+        while not stopping:
+            first = await self._queue.get()
+            if first is _STOP:
+                return
+
+            batch = [first]
+            deadline = loop.time() + self.max_delay
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            try:
+                await self._apply(batch)
+            except Exception:
+                logger.exception("Write batch failed")
+
+    async def _apply(self, batch: List[PendingWrite]) -> None:
+        results: List[Tuple[asyncio.Future, Any, Optional[BaseException]]] = []
+
+        async with get_pool(self.db_path).writer() as conn:
+            try:
+                await conn.execute("BEGIN")
+                for query, params, future in batch:
+                    try:
+                        cursor = await conn.execute(query, params)
+                        results.append((future, cursor.lastrowid, None))
+                    except Exception as e:
+                        results.append((future, None, e))
+
+                if not conn.in_transaction:
+                    # A statement aborted the whole transaction (e.g. disk I/O
+                    # error): the writes that "succeeded" were rolled back too.
+                    raise RuntimeError("Write transaction was rolled back")
+
+                await conn.commit()
+            except Exception as e:
+                if conn.in_transaction:
+                    await conn.rollback()
+                results = [(future, None, error or e) for future, _, error in results]
+                results += [(future, None, e) for _, _, future in batch[len(results):]]
+
+        self.batches += 1
+        self.writes += len(batch)
+
+        for future, lastrowid, error in results:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(lastrowid)
+
+
+_queues: Dict[str, WriteQueue] = {}
+
+
+def get_write_queue(db_path: str) -> Optional[WriteQueue]:
+    """
+    Return the running write queue for `db_path`, or None if writes go direct.
+    """
+    return _queues.get(db_path)
+
+
+def start_write_queue(db_path: str, max_batch_size: int = 100, max_delay: float = 0.005) -> WriteQueue:
+    """
+    Route every `AsyncDatabase.execute` on `db_path` through a group-commit queue.
+    """
+    queue = _queues.get(db_path)
+    if queue is None:
+        queue = WriteQueue(db_path, max_batch_size, max_delay)
+        _queues[db_path] = queue
+    queue.start()
+    return queue
+
+
+async def stop_write_queues() -> None:
+    """
+    Flush and stop every write queue (call before closing the pools).
+    """
+    for db_path, queue in list(_queues.items()):
+        await queue.stop()
+        del _queues[db_path]
@@ -0,0 +1,3 @@
+from .sqlite_storage import SQLiteStorage, fsm_storage
+
+__all__ = ["SQLiteStorage", "fsm_storage"]
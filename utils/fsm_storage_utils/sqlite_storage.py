@@ -0,0 +1,249 @@
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Set
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage, StateType, StorageKey
+from utils.database_utils import AsyncDatabase
+
+
+logger = logging.getLogger(__name__)
+
+
+class _Record:
+    """
+    FSM state and data of one storage key, as held in memory.
+    """
+    __slots__ = ("state", "data", "touched")
+
+    def __init__(self, state: Optional[str], data: Dict[str, Any]) -> None:
+        self.state = state
+        self.data = data
+        self.touched = time.monotonic()
+
+
+class SQLiteStorage(BaseStorage):
+    """
+    Persistent aiogram FSM storage: an in-memory LRU in front of the
+    `FSM_Storage` table (see migration 6).
+
+    Reads are served from memory once a key has been loaded. Writes only
+    mark the key dirty; a background task writes all dirty keys in one
+    transaction every `flush_interval` seconds, so updates cost no fsync of
+    their own. Clean keys are evicted when the LRU is full or after
+    `idle_timeout` seconds without use, which bounds RAM by the number of
+    active users rather than by all users ever seen. Data is stored as
+    compact JSON, so it must hold JSON values only.
+
+    Metrics:
+        hits / loads: reads served from memory / from SQLite.
+        flushes / rows_written: write-behind transactions and the rows they wrote.
+        evictions: keys dropped from memory.
+    """
+
+    TABLE = "FSM_Storage"
+
+    # Section title in the Caches report
+    label = "FSM states"
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_entries: int = 10000,
+        idle_timeout: float = 1800,
+        flush_interval: float = 1.0
+    ) -> None:
+        """
+        Args:
+            db_path (str, optional): Path to the SQLite database file.
+            max_entries (int): Maximum keys held in memory.
+            idle_timeout (float): Seconds after which an unused key is evicted.
+            flush_interval (float): Seconds between write-behind flushes.
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.idle_timeout = idle_timeout
+        self.flush_interval = flush_interval
+
+        self.hits = 0
+        self.loads = 0
+        self.flushes = 0
+        self.rows_written = 0
+        self.evictions = 0
+
+        self._records: "OrderedDict[str, _Record]" = OrderedDict()
+        self._dirty: Set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_now: Optional[asyncio.Event] = None
+        self._closing = False
+
+    @property
+    def db(self) -> AsyncDatabase:
+        # Resolved lazily: the storage is created before the pool is opened
+        return AsyncDatabase(self.db_path)
+
+    # ----------------- BaseStorage -----------------
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        record = await self._get_record(key)
+        record.state = state.state if isinstance(state, State) else state
+        self._mark_dirty(key)
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        return (await self._get_record(key)).state
+
+    async def set_data(self, key: StorageKey, data: Mapping[str, Any]) -> None:
+        record = await self._get_record(key)
+        record.data = dict(data)
+        self._mark_dirty(key)
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        return (await self._get_record(key)).data.copy()
+
+    async def close(self) -> None:
+        """
+        Stop the write-behind task and write everything still dirty.
+        """
+        if self._flush_task is not None:
+            # Not cancelled: that could interrupt a flush mid-transaction
+            self._closing = True
+            self._flush_now.set()
+            await self._flush_task
+            self._flush_task = None
+            self._closing = False
+        await self.flush()
+
+    # ----------------- Memory front -----------------
+
+    @staticmethod
+    def _key(key: StorageKey) -> str:
+        return (
+            f"{key.bot_id}:{key.chat_id}:{key.user_id}:{key.thread_id or ''}:"
+            f"{key.business_connection_id or ''}:{key.destiny}"
+        )
+
+    async def _get_record(self, key: StorageKey) -> _Record:
+        storage_key = self._key(key)
+
+        record = self._records.get(storage_key)
+        if record is not None:
+            self.hits += 1
+        else:
+            row = await self.db.fetchone(
+                f"SELECT State, Data FROM {self.TABLE} WHERE Key = ?", (storage_key,)
+            )
+            # Another update may have loaded the key while this one waited
+            record = self._records.get(storage_key)
+            if record is None:
+                self.loads += 1
+                record = _Record(row[0], json.loads(row[1])) if row else _Record(None, {})
+                self._records[storage_key] = record
+
+        self._records.move_to_end(storage_key)
+        record.touched = time.monotonic()
+        if len(self._records) > self.max_entries:
+            self._evict(self.max_entries)
+            # Only unflushed keys left to evict: flush now instead of waiting
+            if len(self._records) > self.max_entries and self._flush_now is not None:
+                self._flush_now.set()
+        return record
+
+    def _mark_dirty(self, key: StorageKey) -> None:
+        self._dirty.add(self._key(key))
+        if self._flush_task is None:
+            self._flush_now = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    def _evict(self, max_entries: int, idle_before: Optional[float] = None) -> None:
+        # Least recently used first, never the key just used; dirty keys
+        # stay until they are flushed
+        excess = len(self._records) - max_entries
+        newest = next(reversed(self._records), None)
+        victims = []
+        for storage_key, record in self._records.items():
+            if storage_key == newest:
+                break
+            if len(victims) >= excess and (idle_before is None or record.touched >= idle_before):
+                break
+            if storage_key not in self._dirty:
+                victims.append(storage_key)
+
+        for storage_key in victims:
+            del self._records[storage_key]
+        self.evictions += len(victims)
+
+    # ----------------- Write-behind -----------------
+
+    async def flush(self) -> None:
+        """
+        Write every dirty key to SQLite in a single transaction.
+        """
+        if not self._dirty:
+            return
+
+        keys, self._dirty = self._dirty, set()
+        upserts, deletes = [], []
+        now = time.time()
+        for storage_key in keys:
+            record = self._records.get(storage_key)
+            if record is None:
+                continue
+            if record.state is None and not record.data:
+                deletes.append((storage_key,))
+                continue
+            try:
+                data = json.dumps(record.data, separators=(",", ":"), ensure_ascii=False)
+            except (TypeError, ValueError):
+                logger.exception("FSM data of %s is not JSON serializable, not persisted", storage_key)
+                continue
+            upserts.append((storage_key, record.state, data, now))
+
+        try:
+            async with self.db.transaction() as conn:
+                await conn.executemany(
+                    f"INSERT INTO {self.TABLE} (Key, State, Data, Updated_At) VALUES (?, ?, ?, ?) "
+                    f"ON CONFLICT (Key) DO UPDATE SET State = excluded.State, Data = excluded.Data, "
+                    f"Updated_At = excluded.Updated_At",
+                    upserts
+                )
+                await conn.executemany(f"DELETE FROM {self.TABLE} WHERE Key = ?", deletes)
+        except Exception:
+            # Keep the keys dirty (unless written again meanwhile) for the next flush
+            self._dirty |= keys
+            raise
+
+        self.flushes += 1
+        self.rows_written += len(upserts) + len(deletes)
+
+    async def _flush_loop(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._flush_now.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_now.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to write FSM states")
+            self._evict(self.max_entries, time.monotonic() - self.idle_timeout)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Reads served from memory (hits) and from SQLite (misses), then eviction and flush counters.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.loads,
+            "evictions": self.evictions,
+            "cached": len(self._records),
+            "unflushed": len(self._dirty),
+            "flushes": self.flushes,
+            "rows_written": self.rows_written,
+        }
+
+
+# Shared storage of the dispatcher
+fsm_storage = SQLiteStorage()
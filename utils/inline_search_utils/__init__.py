@@ -0,0 +1,7 @@
+from .inline_search import InlineSearchCache, InlineSearchStats, inline_cache, inline_stats, normalize_query, \
+    search_listings_inline
+
+__all__ = [
+    "InlineSearchCache", "InlineSearchStats", "inline_cache", "inline_stats", "normalize_query",
+    "search_listings_inline",
+]
@@ -0,0 +1,165 @@
+import re
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Hashable, List, Optional, Tuple
+from utils.database_utils import WriteListener, row_cache
+from utils.computer_list_utils import get_postings_page, search_postings_page
+
+
+# (postings, next offset or "" if this is the last page)
+InlinePage = Tuple[List[Dict], str]
+
+
+def normalize_query(text: str) -> str:
+    """
+    Canonical form of an inline query, used as the cache key:
+    lower case, words only, single spaces ("  RTX-3060 " -> "rtx 3060").
+    """
+    return " ".join(re.findall(r"\w+", text.lower()))
+
+
+class InlineSearchStats:
+    """
+    Per-query latency of inline answers, over the last `window` queries.
+    """
+
+    def __init__(self, window: int = 1000) -> None:
+        self.queries = 0
+        self.timeouts = 0
+        self._latencies: Deque[float] = deque(maxlen=window)
+
+    def record(self, latency: float, timed_out: bool = False) -> None:
+        self.queries += 1
+        self.timeouts += timed_out
+        self._latencies.append(latency)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Query count, timeouts and p50 / p95 / max latency in milliseconds.
+        """
+        latencies = sorted(self._latencies)
+        if not latencies:
+            return {"queries": self.queries, "timeouts": self.timeouts}
+
+        def percentile(p: float) -> float:
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+        return {
+            "queries": self.queries,
+            "timeouts": self.timeouts,
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "max_ms": latencies[-1] * 1000,
+        }
+
+
+class InlineSearchCache:
+    """
+    LRU cache of inline search pages keyed by (normalized query, offset).
+
+    Entries expire after `ttl` seconds and the whole cache is dropped whenever
+    a listing or an item is written (see `row_cache.subscribe`), so results
+    are never older than the last write.
+    """
+
+    # Section title in the Caches report
+    label = "Inline search"
+
+    def __init__(self, max_entries: int = 1000, ttl: float = 60, latency: Optional[InlineSearchStats] = None) -> None:
+        """
+        Args:
+            max_entries (int): Maximum number of cached pages.
+            ttl (float): Seconds to keep a page.
+            latency (Optional[InlineSearchStats]): Answer latencies reported along with the cache stats.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.latency = latency
+
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[Hashable, Tuple[float, InlinePage]]" = OrderedDict()
+        # Bumped on every clear so a search racing a write is not cached
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: Hashable) -> Optional[InlinePage]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, page: InlinePage, generation: int) -> None:
+        if generation != self._generation:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, page)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self, *_: Any) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Hits, misses and cached pages, then the answer latencies if tracked.
+        """
+        stats = {"hits": self.hits, "misses": self.misses, "cached": len(self._entries)}
+        if self.latency is not None:
+            stats.update(self.latency.stats())
+        return stats
+
+
+# Shared instances used by the inline handler
+inline_stats = InlineSearchStats()
+inline_cache = InlineSearchCache(latency=inline_stats)
+
+_on_write: WriteListener = inline_cache.clear
+for _table in ("Listings", "PCs", "Laptops", "Parts"):
+    row_cache.subscribe(_table, _on_write)
+
+
+async def search_listings_inline(text: str, offset: str = "", limit: int = 20) -> InlinePage:
+    """
+    One page of inline results for `text`, served from `inline_cache` when possible.
+
+    A non-empty query is a ranked full-text search paged by page number; an
+    empty query pages through the whole catalog by Listing_Id cursor.
+
+    Args:
+        text (str): Raw inline query text.
+        offset (str): Offset Telegram sent back from the previous page ("" for the first).
+        limit (int): Results per page (Telegram accepts at most 50).
+
+    Returns:
+        InlinePage: (postings, next offset or "" if there are no more results).
+    """
+    query = normalize_query(text)
+    key = (query, offset, limit)
+
+    page = inline_cache.get(key)
+    if page is not None:
+        return page
+
+    generation = inline_cache.generation
+    if query:
+        page_number = int(offset or 0)
+        postings, _, has_next = await search_postings_page(query, page_number, limit)
+        next_offset = str(page_number + 1) if has_next else ""
+    else:
+        postings, _, has_next = await get_postings_page(after_id=int(offset or 0), limit=limit)
+        next_offset = str(postings[-1]["listing_id"]) if has_next else ""
+
+    page = (postings, next_offset)
+    inline_cache.set(key, page, generation)
+    return page
@@ -0,0 +1,7 @@
+from .listing_detail import ListingDetail, ListingDetailCache, DetailPrefetcher, detail_cache, detail_prefetcher, \
+    get_listing_detail, listing_ids_in, render_listing_detail
+
+__all__ = [
+    "ListingDetail", "ListingDetailCache", "DetailPrefetcher", "detail_cache", "detail_prefetcher",
+    "get_listing_detail", "listing_ids_in", "render_listing_detail",
+]
@@ -0,0 +1,245 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+from aiogram.types import InlineKeyboardMarkup
+from keyboards.callback_factories import ListingCallback
+from utils.database_utils import row_cache, AsyncListingsRepository, AsyncPartsRepository, AsyncSpecsRepository
+from utils.computer_list_utils import format_computer_description_message
+
+
+@dataclass(frozen=True)
+class ListingDetail:
+    """
+    A rendered listing detail screen.
+
+    Attributes:
+        listing_id (int): Listing_Id.
+        item_type (str): 'PC', 'Laptop' or 'Part'.
+        item_id (int): Id of the item in its own table.
+        description (str): HTML text of the detail message.
+    """
+    listing_id: int
+    item_type: str
+    item_id: int
+    description: str
+
+
+async def render_listing_detail(listing_id: int) -> Optional[ListingDetail]:
+    """
+    Load a listing with its item and format the detail message.
+
+    Args:
+        listing_id (int): Listing_Id.
+
+    Returns:
+        Optional[ListingDetail]: The rendered detail, or None if the listing does not exist.
+    """
+    listing = await AsyncListingsRepository().get_listing(listing_id)
+    if not listing:
+        return None
+
+    _, item_type, item_id, added_price, real_price, notes, created_at = listing
+
+    # PCs and Laptops come with all of their components resolved in one query
+    item_details = None
+    spec = None
+
+    if item_type in ("PC", "Laptop"):
+        spec = await AsyncSpecsRepository().get_spec(item_type, item_id)
+        item_details = spec.item if spec else None
+
+    elif item_type == "Part":
+        item_details = await AsyncPartsRepository().get_part(item_id)
+
+    description = format_computer_description_message(
+        item=item_details or listing,  # fallback to listing info if details not found
+        item_type=item_type,
+        added_price=added_price,
+        real_price=real_price,
+        notes=notes,
+        spec=spec
+    )
+    return ListingDetail(listing_id, item_type, item_id, description)
+
+
+class ListingDetailCache:
+    """
+    LRU cache of rendered listing details keyed by Listing_Id.
+
+    A write to a listing drops that listing; a write to an item table drops
+    everything, since one part can appear in many PC and Laptop details.
+    """
+
+    # Section title in the Caches report
+    label = "Listing details"
+
+    def __init__(self, max_entries: int = 2000) -> None:
+        """
+        Args:
+            max_entries (int): Maximum number of cached details.
+        """
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+        self.cancelled = 0
+
+        self._entries: "OrderedDict[int, ListingDetail]" = OrderedDict()
+        # Bumped on every invalidation so a render racing a write is not cached
+        self._generation = 0
+
+    def __contains__(self, listing_id: int) -> bool:
+        return listing_id in self._entries
+
+    def get(self, listing_id: int) -> Optional[ListingDetail]:
+        detail = self._entries.get(listing_id)
+        if detail is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(listing_id)
+        self.hits += 1
+        return detail
+
+    def set(self, detail: ListingDetail, generation: int) -> None:
+        if generation != self._generation:
+            return
+        self._entries[detail.listing_id] = detail
+        self._entries.move_to_end(detail.listing_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def load(self, listing_id: int) -> Optional[ListingDetail]:
+        """
+        Render a listing detail and cache it (no hit / miss accounting).
+        """
+        generation = self._generation
+        detail = await render_listing_detail(listing_id)
+        if detail is not None:
+            self.set(detail, generation)
+        return detail
+
+    def invalidate(self, table: str, row_id: Optional[Any]) -> None:
+        # row_cache write listener
+        self._generation += 1
+        if table == "Listings" and row_id is not None:
+            self._entries.pop(row_id, None)
+        else:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Hits, misses, cached details and prefetch counters.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cached": len(self._entries),
+            "prefetched": self.prefetched,
+            "cancelled_prefetches": self.cancelled,
+        }
+
+
+class DetailPrefetcher:
+    """
+    Warms `ListingDetailCache` for the listings a user is looking at.
+
+    Each user has at most one prefetch task; scheduling a new one (the next
+    catalog page) or calling `cancel` (the user left the list) cancels the
+    previous task. A shared semaphore bounds how many details are rendered
+    at once across all users, so prefetching never crowds out live handlers.
+    """
+
+    def __init__(self, cache: ListingDetailCache, max_listings: int = 10, concurrency: int = 2) -> None:
+        """
+        Args:
+            cache (ListingDetailCache): Cache to warm.
+            max_listings (int): Maximum listings prefetched per schedule.
+            concurrency (int): Maximum details rendered at once, over all users.
+        """
+        self.cache = cache
+        self.max_listings = max_listings
+        self.concurrency = concurrency
+
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def schedule(self, user_id: int, listing_ids: Iterable[int]) -> None:
+        """
+        Replace the user's prefetch with one for `listing_ids` (in display order).
+        """
+        self.cancel(user_id)
+
+        pending = [listing_id for listing_id in listing_ids if listing_id not in self.cache][:self.max_listings]
+        if not pending:
+            return
+
+        task = asyncio.create_task(self._prefetch(pending))
+        self._tasks[user_id] = task
+        task.add_done_callback(lambda done: self._forget(user_id, done))
+
+    def cancel(self, user_id: int) -> None:
+        task = self._tasks.pop(user_id, None)
+        if task is not None and not task.done():
+            task.cancel()
+            self.cache.cancelled += 1
+
+    async def _prefetch(self, listing_ids: List[int]) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        for listing_id in listing_ids:
+            if listing_id in self.cache:
+                continue
+            async with self._semaphore:
+                try:
+                    if await self.cache.load(listing_id) is not None:
+                        self.cache.prefetched += 1
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    # A failed prefetch only costs the later tap a cache miss
+                    logging.exception("Prefetch of listing %s failed", listing_id)
+
+    def _forget(self, user_id: int, task: asyncio.Task) -> None:
+        if self._tasks.get(user_id) is task:
+            del self._tasks[user_id]
+
+
+def listing_ids_in(kb: InlineKeyboardMarkup) -> List[int]:
+    """
+    Listing ids of the listing buttons of a keyboard, top to bottom.
+    """
+    listing_ids = []
+    for row in kb.inline_keyboard:
+        for button in row:
+            if button.callback_data and button.callback_data.startswith(f"{ListingCallback.__prefix__}:"):
+                listing_ids.append(ListingCallback.unpack(button.callback_data).listing_id)
+    return listing_ids
+
+
+# Shared instances used by the catalog, search and detail handlers
+detail_cache = ListingDetailCache()
+detail_prefetcher = DetailPrefetcher(detail_cache)
+
+for _table in ("Listings", "PCs", "Laptops", "Parts"):
+    row_cache.subscribe(_table, detail_cache.invalidate)
+
+
+async def get_listing_detail(listing_id: int) -> Optional[ListingDetail]:
+    """
+    The detail screen of a listing, from `detail_cache` when it was prefetched.
+
+    Args:
+        listing_id (int): Listing_Id.
+
+    Returns:
+        Optional[ListingDetail]: The rendered detail, or None if the listing does not exist.
+    """
+    detail = detail_cache.get(listing_id)
+    if detail is not None:
+        return detail
+    return await detail_cache.load(listing_id)
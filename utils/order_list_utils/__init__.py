@@ -1 +1 @@
-from .format_orders_for_keyboard import format_orders
\ No newline at end of file
+from .format_orders_for_keyboard import format_orders, format_order
\ No newline at end of file
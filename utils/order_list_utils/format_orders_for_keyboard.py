@@ -1,65 +1,87 @@
-from typing import List, Dict, Optional
-from utils.database_utils import AsyncOrdersRepository, AsyncUsersRepository, AsyncAdminsRepository
+from typing import List, Optional, Tuple
+from aiogram import html
+from utils.database_utils import AsyncOrdersRepository, AsyncAdminsRepository
 
-orders_repo = AsyncOrdersRepository()
-users_repo = AsyncUsersRepository()
-admins_repo = AsyncAdminsRepository()
+# Columns of an Orders row
+ORDER_KEYS = ["Order_Id", "User_Id", "Item_Id", "Quantity", "Total_Price",
+              "Profit", "Payment_Method", "Status", "Notes_and_instructions", "Created_At"]
 
 
-async def format_orders(user_id: Optional[int] = None) -> List[str]:
+def _order_lines(order: dict) -> List[str]:
+    """
+    One line per order field after the Order ID.
+    """
+    lines = [
+        f"Item ID: {order['Item_Id']}",
+        f"Quantity: {order['Quantity']}",
+        f"Total Price: ${order['Total_Price']}",
+        f"Profit: ${order['Profit']}",
+        f"Payment Method: {order['Payment_Method']}",
+        f"Status: {order['Status']}",
+    ]
+    if order.get("Notes_and_instructions"):
+        lines.append(f"Notes: {order['Notes_and_instructions']}")
+    return lines
+
+
+async def format_orders(user_id: Optional[int] = None) -> List[Tuple[int, str]]:
     """
     Retrieve and format orders.
 
     - If `user_id` is given and the user is not an admin, returns only that user's orders.
     - If the user is an admin or `user_id` is None, returns all orders with user info.
 
+    Orders come back already joined to their buyer, so the number of queries
+    does not depend on the number of orders.
+
     Returns:
-        List[str]: Human-readable formatted order strings.
+        List[Tuple[int, str]]: (Order_Id, human-readable formatted order) pairs.
     """
     is_admin = False
     if user_id:
-        admin_row = await admins_repo.get_admin_by_user_id(user_id)
+        admin_row = await AsyncAdminsRepository().get_admin_by_user_id(user_id)
         if admin_row:
             is_admin = True
 
-    # Get orders
-    if user_id and not is_admin:
-        orders_rows = await orders_repo.get_orders_by_user(user_id)
-    else:
-        orders_rows = await orders_repo.get_all_orders()
+    show_users = not user_id or is_admin
 
-    if not orders_rows:
-        return []
+    # Keys for Orders table + joined user columns
+    order_keys = ORDER_KEYS + ["Username", "Name"]
 
-    # Keys for Orders table
-    order_keys = ["Order_Id", "User_Id", "Item_Id", "Quantity", "Total_Price",
-                  "Profit", "Payment_Method", "Status", "Notes_and_instructions", "Created_At"]
+    # Stream orders (joined with buyer Username / Name)
+    orders_rows = AsyncOrdersRepository().iter_orders_with_users(None if show_users else user_id)
 
     formatted_orders = []
-    for i, row in enumerate(orders_rows, start=1):
+    async for row in orders_rows:
+        i = len(formatted_orders) + 1
         order = dict(zip(order_keys, row))
         user_info = ""
 
         # Include user info if returning all orders
-        if not user_id or is_admin:
-            user_row = await users_repo.get_user_by_id(order["User_Id"])
-            if user_row:
-                u_keys = ["User_Id", "Username", "Name", "Company_Id", "Level", "Type", "Address", "Contact_info",
-                          "Created_At"]
-                user_dict = dict(zip(u_keys, user_row))
-                user_info = f"{user_dict.get('Name') or user_dict.get('Username')} (ID: {order['User_Id']})\n"
-
-        lines = [
-            f"{i}) {user_info}Order ID: {order['Order_Id']}",
-            f"Item ID: {order['Item_Id']}",
-            f"Quantity: {order['Quantity']}",
-            f"Total Price: ${order['Total_Price']}",
-            f"Profit: ${order['Profit']}",
-            f"Payment Method: {order['Payment_Method']}",
-            f"Status: {order['Status']}",
-        ]
-        if order.get("Notes_and_instructions"):
-            lines.append(f"Notes: {order['Notes_and_instructions']}")
-        formatted_orders.append("\n".join(lines))
+        if show_users and (order["Name"] or order["Username"]):
+            user_info = f"{order['Name'] or order['Username']} (ID: {order['User_Id']})\n"
+
+        lines = [f"{i}) {user_info}Order ID: {order['Order_Id']}", *_order_lines(order)]
+        formatted_orders.append((order["Order_Id"], "\n".join(lines)))
 
     return formatted_orders
+
+
+async def format_order(order_id: int, user_id: int) -> Optional[str]:
+    """
+    Full details of one order as HTML, for its buyer or an admin.
+
+    Returns:
+        Optional[str]: The details, or None if the order does not exist or
+            belongs to another user and `user_id` is not an admin.
+    """
+    row = await AsyncOrdersRepository().get_order_by_id(order_id)
+    if row is None:
+        return None
+
+    order = dict(zip(ORDER_KEYS, row))
+    if order["User_Id"] != user_id and not await AsyncAdminsRepository().get_admin_by_user_id(user_id):
+        return None
+
+    details = "\n".join([*_order_lines(order), f"Created: {order['Created_At']}"])
+    return f"<b>Order ID: {order['Order_Id']}</b>\n{html.quote(details)}"
@@ -0,0 +1 @@
+from .format_reports import REPORTS, format_report
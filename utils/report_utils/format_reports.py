@@ -0,0 +1,96 @@
+from typing import Dict, List
+from aiogram import html
+from utils.database_utils import AsyncReportsRepository, acl_cache, get_loaders, row_cache
+from utils.listing_detail_utils import detail_cache
+from utils.computer_list_utils import catalog_cache
+from utils.inline_search_utils import inline_cache
+from utils.api_stats_utils import api_call_stats
+from utils.fsm_storage_utils import fsm_storage
+
+reports_repo = AsyncReportsRepository()
+
+# Report kind -> button text, in menu order
+REPORTS: Dict[str, str] = {
+    "status": "Orders by status",
+    "day": "Sales by day",
+    "week": "Sales by week",
+    "month": "Sales by month",
+    "buyers": "Top buyers",
+    "bids": "Bid acceptance",
+    "cache": "Caches",
+    "api": "Bot API calls",
+}
+
+# Sections of the Caches report: each has a `label` and a `stats()` dict
+# starting with "hits" and "misses", followed by its own counters
+CACHES = [detail_cache, catalog_cache, inline_cache, row_cache, fsm_storage, acl_cache]
+
+
+def format_cache(label: str, stats: Dict[str, float]) -> List[str]:
+    """
+    Lines of one cache in the Caches report: hit rate, then its other counters.
+    """
+    counters = dict(stats)
+    hits, misses = counters.pop("hits"), counters.pop("misses")
+    lookups = hits + misses
+    lines = [f"<b>{label}</b>", f"Hit rate: {hits / lookups if lookups else 0:.1%} ({hits} hits, {misses} misses)"]
+    if counters:
+        line = ", ".join(f"{name.replace('_', ' ')}: {value:.0f}" for name, value in counters.items())
+        lines.append(line.capitalize())
+    return lines
+
+
+async def format_report(kind: str) -> str:
+    """
+    Build the text of one admin report.
+
+    Every report is read from the rollup tables, so its cost depends on the
+    number of periods / buyers shown, not on the number of orders.
+
+    Args:
+        kind (str): One of the keys of `REPORTS`.
+
+    Returns:
+        str: HTML-formatted report.
+    """
+    lines = [f"<b>{REPORTS[kind]}</b>"]
+
+    if kind == "status":
+        for status, orders, quantity, revenue, profit in await reports_repo.get_orders_by_status():
+            lines.append(f"{status}: {orders} orders ({quantity} items), revenue ${revenue}, profit ${profit}")
+
+    elif kind in ("day", "week", "month"):
+        for period, orders, revenue, profit in await reports_repo.get_sales_by_period(kind):
+            lines.append(f"{period}: {orders} orders, revenue ${revenue}, profit ${profit}")
+
+    elif kind == "buyers":
+        for i, (user_id, username, name, orders, revenue, profit) in enumerate(
+                await reports_repo.get_top_buyers(), start=1):
+            # User-chosen names go into HTML text
+            buyer = html.quote(name or username or "Unknown")
+            lines.append(f"{i}) {buyer} (ID: {user_id}): {orders} orders, revenue ${revenue}, profit ${profit}")
+
+    elif kind == "bids":
+        stats = await reports_repo.get_bid_stats()
+        for status in ("Pending", "Accepted", "Converted", "Rejected"):
+            lines.append(f"{status}: {stats.get(status, 0)}")
+        lines.append(f"Total: {stats['Total']}")
+        lines.append(f"Acceptance rate: {stats['Acceptance_Rate']:.1%}")
+
+    elif kind == "cache":
+        # In-memory counters since the bot started, not a database report
+        for cache in CACHES + get_loaders():
+            lines.extend(format_cache(cache.label, cache.stats()))
+
+    elif kind == "api":
+        # In-memory counters since the bot started
+        for update_type, stats in api_call_stats.stats().items():
+            lines.append(
+                f"{update_type}: {stats['calls_per_update']:.2f} calls per update "
+                f"({stats['calls']} calls, {stats['updates']} updates, max {stats['max_calls']})"
+            )
+
+    if len(lines) == 1:
+        lines.append("No data yet.")
+
+    return "\n".join(lines)
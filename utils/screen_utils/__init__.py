@@ -0,0 +1,6 @@
+from .registry import Screen, ScreenOutput, SCREENS, screen, render_screen
+from .navigation import Navigation, HISTORY_KEY, HISTORY_SIZE
+from .render import show
+
+__all__ = ["Screen", "ScreenOutput", "SCREENS", "screen", "render_screen", "Navigation", "HISTORY_KEY", "HISTORY_SIZE",
+           "show"]
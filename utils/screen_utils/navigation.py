@@ -0,0 +1,112 @@
+from typing import Any, List, Optional
+from aiogram.fsm.context import FSMContext
+from aiogram.types import CallbackQuery, User
+from .registry import SCREENS, ScreenOutput, render_screen
+from .render import show
+
+# FSM data key of the navigation history
+HISTORY_KEY = "history"
+
+# Screens remembered per user; older ones are dropped
+HISTORY_SIZE = 20
+
+# Screen shown when the history is exhausted
+HOME_SCREEN = "main_menu"
+
+# FSM data of a flow that is abandoned when the user goes back
+TEMP_KEYS = ("item_id", "title", "bid_price", "temp_data")
+
+
+class Navigation:
+    """
+    Navigation of one user during one update.
+
+    Handlers render registered screens through `render`, which remembers
+    the screen; the history middleware then appends it to the user's
+    history. Each history entry is a reference, not the rendered content:
+    [screen id, params, FSM state, output digest].
+    """
+
+    def __init__(self, state: FSMContext, raw_state: Optional[str]) -> None:
+        """
+        Args:
+            state (FSMContext): FSM context of the user.
+            raw_state (Optional[str]): FSM state before the handler ran.
+        """
+        self.state = state
+        self.raw_state = raw_state
+        self.shown: Optional[List[Any]] = None
+
+    async def render(self, name: str, user: User, **params: Any) -> Optional[ScreenOutput]:
+        """
+        Render screen `name` and remember it as the screen shown by this update.
+
+        Returns:
+            Optional[ScreenOutput]: The output, or None if the screen cannot be shown.
+        """
+        output = await render_screen(name, user, **params)
+        if output is not None:
+            self.remember(name, output, **params)
+        return output
+
+    def remember(self, name: str, output: ScreenOutput, **params: Any) -> None:
+        """
+        Remember `output` as screen `name` shown by this update, for handlers that
+        built it from data they had already loaded (re-rendered from `params` on Back).
+        """
+        screen_state = SCREENS[name].state
+        fsm_state = screen_state.state if screen_state is not None else self.raw_state
+        self.shown = [name, params, fsm_state, output.digest]
+
+    async def save(self) -> None:
+        """
+        Append the shown screen to the history (one FSM data read and one write).
+        """
+        if self.shown is None:
+            return
+
+        fsm_data = await self.state.get_data()
+        history = fsm_data.get(HISTORY_KEY, [])
+
+        # Ignore duplicate
+        if history and history[-1] == self.shown:
+            return
+
+        history = history[-(HISTORY_SIZE - 1):] + [self.shown]
+        await self.state.set_data({**fsm_data, HISTORY_KEY: history})
+
+    async def back(self, callback: CallbackQuery) -> None:
+        """
+        Leave the current screen and re-render the previous one in place.
+
+        The edit is skipped when the previous screen renders exactly what the
+        message already shows.
+        """
+        fsm_data = await self.state.get_data()
+        history = fsm_data.get(HISTORY_KEY, [])
+        current_digest = history[-1][3] if history else None
+
+        # Drop the current screen, then any previous one that can no longer be shown
+        history = history[:-1]
+        output = None
+        while history and output is None:
+            name, params, fsm_state, _ = history[-1]
+            output = await render_screen(name, callback.from_user, **params)
+            if output is None:
+                history = history[:-1]
+
+        if output is None:
+            name, params, fsm_state = HOME_SCREEN, {}, None
+            output = await render_screen(name, callback.from_user)
+            history = [[name, params, fsm_state, output.digest]]
+        else:
+            history[-1] = [name, params, fsm_state, output.digest]
+
+        for key in TEMP_KEYS:
+            fsm_data.pop(key, None)
+        await self.state.set_data({**fsm_data, HISTORY_KEY: history})
+        await self.state.set_state(fsm_state)
+        self.shown = None
+
+        if output.digest != current_digest:
+            await show(callback, output)
@@ -0,0 +1,85 @@
+import hashlib
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Awaitable, Callable, Dict, Optional
+from aiogram.fsm.state import State
+from aiogram.types import InlineKeyboardMarkup, User
+
+
+@dataclass(frozen=True)
+class ScreenOutput:
+    """
+    Rendered content of a screen.
+
+    Attributes:
+        text (str): Message text.
+        reply_markup (Optional[InlineKeyboardMarkup]): Message keyboard.
+        parse_mode (str): Telegram parse mode of `text`.
+    """
+    text: str
+    reply_markup: Optional[InlineKeyboardMarkup] = None
+    parse_mode: str = "html"
+
+    @cached_property
+    def digest(self) -> str:
+        """
+        Short hash of text and keyboard; equal digests mean an edit would change nothing.
+        """
+        content = self.text
+        if self.reply_markup is not None:
+            content += self.reply_markup.model_dump_json()
+        return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+
+
+# Renders a screen for a user from its params (None if it can no longer be shown)
+ScreenRender = Callable[..., Awaitable[Optional[ScreenOutput]]]
+
+
+@dataclass(frozen=True)
+class Screen:
+    """
+    A named screen of the bot.
+
+    Attributes:
+        name (str): Screen id stored in the navigation history.
+        render (ScreenRender): `async render(user, **params) -> Optional[ScreenOutput]`.
+        state (Optional[State]): FSM state the screen puts the user in, if any.
+    """
+    name: str
+    render: ScreenRender
+    state: Optional[State] = None
+
+
+SCREENS: Dict[str, Screen] = {}
+
+
+def screen(name: str, state: Optional[State] = None) -> Callable[[ScreenRender], ScreenRender]:
+    """
+    Register a render function as screen `name`.
+
+    Params of a screen are stored in the navigation history (and FSM
+    storage), so they must be plain JSON values: ints, strings and None.
+    """
+    def decorator(render: ScreenRender) -> ScreenRender:
+        if name in SCREENS:
+            raise ValueError(f"Screen {name!r} is already registered")
+        SCREENS[name] = Screen(name, render, state)
+        return render
+
+    return decorator
+
+
+async def render_screen(name: str, user: User, **params: Any) -> Optional[ScreenOutput]:
+    """
+    Render screen `name` for `user`.
+
+    Args:
+        name (str): Registered screen id.
+        user (User): User the screen is shown to.
+        **params: Screen params.
+
+    Returns:
+        Optional[ScreenOutput]: The output, or None if the screen can no longer be shown
+            (e.g. its listing was removed).
+    """
+    return await SCREENS[name].render(user, **params)
@@ -0,0 +1,33 @@
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import CallbackQuery, Message
+from .registry import ScreenOutput
+
+
+async def show(callback: CallbackQuery, output: ScreenOutput) -> None:
+    """
+    Show `output` on the message the callback came from.
+
+    The message is edited in place (one Bot API call). A new message is sent
+    only when the old one cannot be edited (no text, e.g. a document, or too
+    old), and no call is made at all when it already shows `output`.
+
+    Args:
+        callback (CallbackQuery): The callback being handled.
+        output (ScreenOutput): Text and keyboard to show.
+    """
+    message = callback.message
+
+    if isinstance(message, Message) and message.text is not None:
+        if message.html_text == output.text and message.reply_markup == output.reply_markup:
+            return
+        try:
+            await message.edit_text(output.text, reply_markup=output.reply_markup, parse_mode=output.parse_mode)
+            return
+        except TelegramBadRequest as e:
+            if "message is not modified" in e.message:
+                return
+
+    if message is not None:
+        await callback.bot.send_message(
+            message.chat.id, output.text, reply_markup=output.reply_markup, parse_mode=output.parse_mode
+        )